@@ -0,0 +1,38 @@
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+
+# Streamed line by line; gzip would hold lines back until its buffer fills
+UNCOMPRESSED_MEDIA_TYPES = ("application/x-ndjson", "text/event-stream")
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that passes streamed media types through uncompressed, so
+    each NDJSON result reaches the client as soon as it is produced
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get(
+            "Accept-Encoding", ""
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        responder = GZipResponder(
+            self.app, self.minimum_size, compresslevel=self.compresslevel
+        )
+        responder.send = send
+        passthrough = False
+
+        async def send_maybe_compressed(message):
+            nonlocal passthrough
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                passthrough = content_type.startswith(UNCOMPRESSED_MEDIA_TYPES)
+            if passthrough:
+                await send(message)
+            else:
+                await responder.send_with_gzip(message)
+
+        await self.app(scope, receive, send_maybe_compressed)
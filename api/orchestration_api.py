@@ -4,30 +4,92 @@ import sys
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from typing import Optional
+from typing import List, Optional
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, conint
+
+from api.compression import StreamingAwareGZipMiddleware
+from api.profiling import install_profiling
+from api.rejections import raise_if_rejected
+from orchestration.config.settings import (
+    DEFAULT_TENANT,
+    JOB_DB_PATH,
+    JOURNAL_DIR,
+    MAX_GENERATION_TOKENS,
+)
+from orchestration.core.backend.generation import GenerationOptions
+from orchestration.core.balancer.tenancy import RateLimitExceeded
 from orchestration.core.orchestrator import ModelOrchestrator
+from orchestration.core.telemetry.request_journal import RequestJournal
+from orchestration.jobs.job_store import JobStore
+from orchestration.jobs.job_worker import JobWorker, validate_callback_url
 
 # Add project root to Python path
 
 
-app = FastAPI(title="AI Model Orchestration API", version="1.0.0")
+app = FastAPI(
+    title="AI Model Orchestration API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024)
+install_profiling(app)
 # rest of code...
 
 # Initialize orchestrator
 orchestrator = ModelOrchestrator(max_concurrent_requests=3)
 
+# Optional request journal for offline replay (benchmarks/replay_journal.py)
+if JOURNAL_DIR:
+    orchestrator.add_completion_hook(
+        RequestJournal(os.path.join(JOURNAL_DIR, "orchestration.ndjson")).record
+    )
+
+# Durable queue for long-running generations, drained by background workers.
+# Opened at startup so importing the app doesn't create the database
+job_store: Optional[JobStore] = None
+job_worker: Optional[JobWorker] = None
+
+
+# Bounded so a client can't lift the output budget (Ollama reads -1 as unlimited)
+MaxTokens = Optional[conint(gt=0, le=MAX_GENERATION_TOKENS)]
+
 
 class QueryRequest(BaseModel):
     query: str
     priority: str = "balanced"
     user_preference: Optional[str] = None
     timeout: int = 60
-    timeout: int = 60
+    tenant: str = DEFAULT_TENANT
+    max_tokens: MaxTokens = None
+    stop: Optional[List[str]] = None
+    temperature: Optional[float] = None
+    include: List[str] = []  # opt-in extras, e.g. ["stats"]
+
+
+class BatchQueryRequest(BaseModel):
+    queries: List[str]
+    priority: str = "background"
+    user_preference: Optional[str] = None
+    tenant: str = "batch"
+    max_tokens: MaxTokens = None
+    stop: Optional[List[str]] = None
+    temperature: Optional[float] = None
+
+
+class JobRequest(BaseModel):
+    query: str
+    priority: str = "balanced"
+    user_preference: Optional[str] = None
+    tenant: str = DEFAULT_TENANT
+    max_tokens: MaxTokens = None
+    stop: Optional[List[str]] = None
+    temperature: Optional[float] = None
+    callback_url: Optional[str] = None
 
 
 class QueryResponse(BaseModel):
@@ -36,11 +98,15 @@ class QueryResponse(BaseModel):
     response_time: float
     success: bool
     category: str
-    orchestration_stats: dict
+    truncated: bool = False
+    telemetry: Optional[dict] = None
+    orchestration_stats: Optional[dict] = None
 
 
-@app.post("/orchestrate", response_model=QueryResponse)
-async def orchestrate_query(request: QueryRequest):
+@app.post(
+    "/orchestrate", response_model=QueryResponse, response_model_exclude_none=True
+)
+def orchestrate_query(request: QueryRequest):
     try:
         result = orchestrator.process_request_sync(
             query=request.query,
@@ -49,8 +115,15 @@ async def orchestrate_query(request: QueryRequest):
                 request.user_preference if request.user_preference is not None else ""
             ),
             timeout=request.timeout,
+            tenant=request.tenant,
+            generation=GenerationOptions(
+                num_predict=request.max_tokens,
+                stop=request.stop,
+                temperature=request.temperature,
+            ),
         )
 
+        raise_if_rejected(result)
         if result.get("success", False):
             return QueryResponse(
                 response=result["response"],
@@ -58,22 +131,113 @@ async def orchestrate_query(request: QueryRequest):
                 response_time=result["response_time"],
                 success=True,
                 category="auto-detected",
-                orchestration_stats=orchestrator.get_system_status(),
+                truncated=result.get("truncated", False),
+                telemetry=result.get("telemetry"),
+                orchestration_stats=(
+                    orchestrator.get_system_status()
+                    if "stats" in request.include
+                    else None
+                ),
             )
         else:
             raise HTTPException(
                 status_code=500, detail=result.get("error", "Unknown error")
             )
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/orchestrate/batch")
+def orchestrate_batch(request: BatchQueryRequest):
+    """Run many queries at background priority, streaming NDJSON results"""
+    try:
+        results = orchestrator.process_batch(
+            request.queries,
+            priority=request.priority,
+            tenant=request.tenant,
+            user_preference=request.user_preference,
+            generation=GenerationOptions(
+                num_predict=request.max_tokens,
+                stop=request.stop,
+                temperature=request.temperature,
+            ),
+        )
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": e.retry_after_header},
+        )
+
+    return StreamingResponse(
+        (orjson.dumps(result) + b"\n" for result in results),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.on_event("startup")
+def start_job_worker():
+    global job_store, job_worker
+    job_store = JobStore(JOB_DB_PATH)
+    job_worker = JobWorker(orchestrator, job_store)
+    job_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_job_worker():
+    if job_worker is not None:
+        job_worker.stop()
+
+
+@app.post("/jobs", status_code=202)
+def submit_job(request: JobRequest):
+    """Queue a generation and return immediately; poll GET /jobs/{job_id}"""
+    if request.callback_url:
+        try:
+            validate_callback_url(request.callback_url, job_worker.callback_hosts)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    job_id = job_store.enqueue(
+        {
+            "query": request.query,
+            "priority": request.priority,
+            "user_preference": request.user_preference,
+            "tenant": request.tenant,
+            "generation": {
+                "num_predict": request.max_tokens,
+                "stop": request.stop,
+                "temperature": request.temperature,
+            },
+        },
+        callback_url=request.callback_url,
+    )
+    job_worker.notify()
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
 @app.get("/system/status")
 async def get_system_status():
     return orchestrator.get_system_status()
 
 
+@app.get("/system/tenants")
+async def get_tenant_stats():
+    return orchestrator.load_balancer.get_tenant_stats()
+
+
 @app.get("/system/health")
 async def health_check():
     return orchestrator.health_check_all_models()
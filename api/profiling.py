@@ -0,0 +1,175 @@
+import hmac
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+
+from orchestration.config.settings import (
+    ADMIN_TOKEN,
+    ORCHESTRATION_CONFIG,
+    PROFILE_DIR,
+    PROFILING_ENABLED,
+)
+from orchestration.core.telemetry.sampling_profiler import (
+    SamplingProfiler,
+    profile_process,
+)
+
+PROFILE_HEADER = b"x-profile"
+MAX_CAPTURE_SECONDS = 300
+PROFILE_ID_PATTERN = re.compile(r"^[\w.-]+$")
+
+
+def _profile_id(name: str) -> str:
+    return f"{int(time.time() * 1000)}-" + re.sub(r"[^\w]+", "_", name).strip("_")
+
+
+def _write_profile(profile_dir: str, profile_id: str, collapsed: str):
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"{profile_id}.collapsed")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(collapsed)
+
+
+def _finish_profile(profiler: SamplingProfiler, profile_dir: str, profile_id: str):
+    profiler.stop()
+    _write_profile(profile_dir, profile_id, profiler.collapsed())
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests sent with an `X-Profile: 1` header plus a random sample_rate
+    fraction of the rest, saving collapsed stacks and returning an X-Profile-Id.
+    The sampler sees every thread, so the profile covers the whole process while
+    the request ran, including concurrent requests (X-Profile-Scope: process)
+    """
+
+    def __init__(self, app, profile_dir: str, sample_rate: float):
+        self.app = app
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = dict(scope["headers"]).get(PROFILE_HEADER) in (b"1", b"true")
+        if not requested and random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        # The id is fixed up front so it can ride on the response headers
+        profile_id = _profile_id(f"{scope['method']} {scope['path']}")
+        profiler = SamplingProfiler()
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode()),
+                    (b"x-profile-scope", b"process"),
+                ]
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            # Joining the sampler and writing the file would block the event loop
+            await run_in_threadpool(
+                _finish_profile, profiler, self.profile_dir, profile_id
+            )
+
+
+def admin_token_dependency(admin_token: str):
+    """Dependency rejecting requests without the configured X-Admin-Token"""
+
+    def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+        if x_admin_token is None or not hmac.compare_digest(
+            x_admin_token.encode(), admin_token.encode()
+        ):
+            raise HTTPException(status_code=401, detail="Invalid admin token")
+
+    return require_admin_token
+
+
+def create_profiling_router(profile_dir: str, admin_token: str) -> APIRouter:
+    router = APIRouter(
+        prefix="/admin",
+        tags=["profiling"],
+        dependencies=[Depends(admin_token_dependency(admin_token))],
+    )
+
+    @router.post("/profile", response_class=PlainTextResponse)
+    def capture_profile(seconds: float = 10.0, interval: Optional[float] = None):
+        """Profile the whole process for a fixed time; returns collapsed stacks"""
+        if not 0 < seconds <= MAX_CAPTURE_SECONDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"seconds must be in (0, {MAX_CAPTURE_SECONDS}]",
+            )
+        collapsed = profile_process(seconds, interval)
+        profile_id = _profile_id("process")
+        _write_profile(profile_dir, profile_id, collapsed)
+        return PlainTextResponse(collapsed, headers={"X-Profile-Id": profile_id})
+
+    @router.get("/profiles")
+    def list_profiles():
+        if not os.path.isdir(profile_dir):
+            return []
+        return sorted(
+            (
+                name[: -len(".collapsed")]
+                for name in os.listdir(profile_dir)
+                if name.endswith(".collapsed")
+            ),
+            reverse=True,
+        )
+
+    @router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+    def get_profile(profile_id: str):
+        path = os.path.join(profile_dir, f"{profile_id}.collapsed")
+        if not PROFILE_ID_PATTERN.match(profile_id) or not os.path.exists(path):
+            raise HTTPException(status_code=404, detail="Profile not found")
+        with open(path, "r", encoding="utf-8") as file:
+            return file.read()
+
+    return router
+
+
+def install_profiling(
+    app: FastAPI,
+    enabled: Optional[bool] = None,
+    profile_dir: str = PROFILE_DIR,
+    sample_rate: Optional[float] = None,
+    admin_token: Optional[str] = ADMIN_TOKEN,
+):
+    """
+    Add the profiling middleware and admin endpoints when profiling is enabled.
+    When it is off nothing is registered, so requests pay no overhead. The admin
+    endpoints need admin_token and are left out when none is configured
+    """
+    if not (enabled if enabled is not None else PROFILING_ENABLED):
+        return
+
+    app.add_middleware(
+        ProfilingMiddleware,
+        profile_dir=profile_dir,
+        sample_rate=(
+            sample_rate
+            if sample_rate is not None
+            else ORCHESTRATION_CONFIG.profile_sample_rate
+        ),
+    )
+    if admin_token:
+        app.include_router(create_profiling_router(profile_dir, admin_token))
+    else:
+        print(
+            "⚠️  ORCHESTRATION_ADMIN_TOKEN unset, /admin profiling endpoints disabled"
+        )
+    print(f"🔬 Profiling enabled, profiles saved to {profile_dir}")
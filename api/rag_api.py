@@ -9,27 +9,51 @@ import uvicorn
 from fastapi import FastAPI
 from pydantic import BaseModel
 
+from api.profiling import install_profiling
+from api.rejections import raise_if_rejected
+from orchestration.config.settings import DEFAULT_TENANT, JOURNAL_DIR
+from orchestration.core.telemetry.request_journal import RequestJournal
 from rag.retrieval.rag_orchestrator import RAGOrchestrator
 
 app = FastAPI(title="RAG + Model Orchestration API", version="1.0.0")
+install_profiling(app)
 rag_orchestrator = RAGOrchestrator()
 
+# Optional request journal for offline replay (benchmarks/replay_journal.py)
+if JOURNAL_DIR:
+    rag_orchestrator.model_orchestrator.add_completion_hook(
+        RequestJournal(os.path.join(JOURNAL_DIR, "rag.ndjson")).record
+    )
+
+
+@app.on_event("startup")
+def prepare_search():
+    # Builds the BM25 index for lexical/hybrid search before the first query
+    rag_orchestrator.chroma_manager.prepare_search()
+
 
 class RAGRequest(BaseModel):
     query: str
     use_rag: bool = True
     n_results: int = 3
     priority: str = "balanced"
+    tenant: str = DEFAULT_TENANT
 
 
 @app.post("/rag/query")
 async def rag_query(request: RAGRequest):
     if request.use_rag:
         result = rag_orchestrator.search_and_generate(
-            query=request.query, n_results=request.n_results, priority=request.priority
+            query=request.query,
+            n_results=request.n_results,
+            priority=request.priority,
+            tenant=request.tenant,
         )
     else:
-        result = rag_orchestrator.simple_chat(request.query, use_rag=False)
+        result = rag_orchestrator.simple_chat(
+            request.query, use_rag=False, tenant=request.tenant
+        )
+    raise_if_rejected(result)
 
     return result
 
@@ -0,0 +1,19 @@
+from typing import Dict
+
+from fastapi import HTTPException
+
+from orchestration.core.balancer.admission import retry_after_header
+
+
+def raise_if_rejected(result: Dict):
+    """
+    Turn a rejected-request result into 429 (tenant throttled) or 503 (shed
+    by admission control), both with Retry-After
+    """
+    if result.get("retry_after") is None:
+        return
+    raise HTTPException(
+        status_code=429 if result.get("rate_limited") else 503,
+        detail=result.get("error", "Request rejected"),
+        headers={"Retry-After": retry_after_header(result["retry_after"])},
+    )
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Measure how file parsing and chunking scale with ingestion workers.
+
+Generates a directory of synthetic markdown files (or uses --directory) and runs
+the ingestion pipeline over it once per worker count, with embedding and vector
+store writes replaced by no-ops so only reading and chunking are timed.
+
+    python benchmarks/ingestion_benchmark.py --files 5000 --workers 1,2,4,8
+
+--chunker-mb compares the offset chunker against the previous split/join word
+windows on one large generated text instead, by time and peak allocation. Both
+use the same RAG_CHUNK_TOKENS budget and return chunk strings; offset_spans
+additionally shows the offsets alone, without materializing the strings.
+
+    python benchmarks/ingestion_benchmark.py --chunker-mb 8
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from rag.ingestion.chunker import (
+    CHUNK_OVERLAP_TOKENS,
+    CHUNK_TOKENS,
+    chunk_spans,
+    chunk_text,
+)
+from rag.ingestion.file_reader import read_file_documents
+from rag.ingestion.pipeline import IngestionPipeline, iter_files
+from rag.vector_store.embedding_service import EmbeddingService
+
+WORDS = (
+    "model vector query latency token chunk index retrieval python cache batch "
+    "memory throughput scheduler embedding document corpus server cluster"
+).split()
+
+
+class NullModel:
+    def encode(self, texts):
+        return np.zeros((len(texts), 1), dtype=np.float32)
+
+
+class NullChromaManager:
+    """Stands in for ChromaManager so only reading and chunking are measured"""
+
+    def __init__(self):
+        self.embedding_service = EmbeddingService(
+            "null", model=NullModel(), query_cache_size=0
+        )
+
+    def stored_ids(self, ids):
+        return set()
+
+    def write_embedded(self, ids, documents, embeddings, metadatas):
+        pass
+
+
+def generate_text(rng: random.Random, paragraphs: int) -> str:
+    sections = []
+    for _ in range(paragraphs):
+        sentences = (
+            " ".join(rng.choices(WORDS, k=rng.randint(8, 20))).capitalize() + "."
+            for _ in range(rng.randint(3, 8))
+        )
+        sections.append(" ".join(sentences))
+    return "\n\n".join(sections)
+
+
+def generate_corpus(directory: str, files: int, paragraphs: int, seed: int = 0):
+    rng = random.Random(seed)
+    for index in range(files):
+        path = os.path.join(directory, f"doc_{index:06d}.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"# Document {index}\n\n" + generate_text(rng, paragraphs))
+
+
+def word_window_chunks(
+    text: str, chunk_size: int = CHUNK_TOKENS, overlap: int = CHUNK_OVERLAP_TOKENS
+):
+    """
+    The split/join chunker DocumentProcessor used before offset chunking, at
+    the same budget (it used 500 words with 50 overlap)
+    """
+    words = text.split()
+    return [
+        " ".join(words[i : i + chunk_size])
+        for i in range(0, len(words), chunk_size - overlap)
+    ]
+
+
+def measure(function, text: str) -> Dict:
+    elapsed = min(_timed(function, text) for _ in range(3))
+    tracemalloc.start()
+    chunks = function(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mb": peak / 1e6, "chunks": len(chunks)}
+
+
+def _timed(function, text: str) -> float:
+    start = time.perf_counter()
+    function(text)
+    return time.perf_counter() - start
+
+
+def compare_chunkers(megabytes: float) -> Dict:
+    rng = random.Random(0)
+    text = ""
+    while len(text) < megabytes * 1e6:
+        text += generate_text(rng, 1000) + "\n\n"
+    return {
+        "megabytes": len(text) / 1e6,
+        "word_windows": measure(word_window_chunks, text),
+        "offset_chunks": measure(chunk_text, text),
+        "offset_spans": measure(chunk_spans, text),
+    }
+
+
+def run(directory: str, workers: int) -> Dict:
+    paths = list(iter_files(directory, [".md", ".txt"]))
+    pipeline = IngestionPipeline(
+        NullChromaManager(), read_file_documents, workers=workers
+    )
+    start = time.perf_counter()
+    progress = pipeline.run(paths)
+    elapsed = time.perf_counter() - start
+    return {
+        "workers": workers,
+        "files": progress["files_done"],
+        "chunks": progress["chunks_read"],
+        "seconds": elapsed,
+        "files_per_second": progress["files_done"] / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directory", help="Existing corpus to ingest")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--paragraphs", type=int, default=20)
+    parser.add_argument(
+        "--workers",
+        default=",".join(
+            str(n) for n in (1, 2, 4, 8, 16) if n <= (os.cpu_count() or 1)
+        ),
+        help="Worker counts to compare, e.g. 1,2,4",
+    )
+    parser.add_argument(
+        "--chunker-mb", type=float, help="Compare chunkers on a text of this size"
+    )
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    if args.chunker_mb:
+        comparison = compare_chunkers(args.chunker_mb)
+        if args.json:
+            print(json.dumps(comparison, indent=2))
+            return
+        print(f"Text: {comparison['megabytes']:.1f} MB")
+        print(f"{'chunker':<14}{'seconds':>9}{'peak MB':>9}{'chunks':>8}")
+        for name in ("word_windows", "offset_chunks", "offset_spans"):
+            result = comparison[name]
+            print(
+                f"{name:<14}{result['seconds']:>9.3f}{result['peak_mb']:>9.1f}"
+                f"{result['chunks']:>8}"
+            )
+        return
+
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = args.directory
+        if directory is None:
+            directory = scratch
+            generate_corpus(directory, args.files, args.paragraphs)
+
+        results: List[Dict] = [
+            run(directory, int(workers)) for workers in args.workers.split(",")
+        ]
+
+    baseline = results[0]["seconds"]
+    for result in results:
+        result["speedup"] = baseline / result["seconds"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'workers':>8}{'files':>8}{'chunks':>9}{'seconds':>10}{'files/s':>10}"
+        f"{'speedup':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['workers']:>8}{result['files']:>8}{result['chunks']:>9}"
+            f"{result['seconds']:>10.2f}{result['files_per_second']:>10.0f}"
+            f"{result['speedup']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
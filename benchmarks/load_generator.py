@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""Drive the orchestration and RAG APIs with a repeatable synthetic load.
+
+Open-loop mode fires requests at Poisson arrival rates regardless of how fast
+the server answers (so queueing shows up as latency); closed-loop mode keeps a
+fixed number of clients busy. Each step of the sweep reports throughput,
+latency percentiles and error rates, and the first step whose throughput falls
+behind the offered load or whose errors exceed the threshold is reported as
+the saturation point. Rate-limit rejections (429) are reported separately and
+don't count as saturation, since they measure the tenant's quota rather than
+capacity. Keep the duration well above the expected latency, since stragglers
+finishing after the window count against throughput.
+
+    python benchmarks/load_generator.py --local --rates 1,2,4,8 --duration 30
+    python benchmarks/load_generator.py --mode closed --concurrency 1,4,16 \\
+        --html-report load_report.html
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import html
+import json
+import random
+import socket
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from orchestration.simulation.workloads import DEFAULT_CATEGORY_MIX, QUERY_MIX
+
+ORCHESTRATION_URL = "http://localhost:8001"
+RAG_URL = "http://localhost:8002"
+
+DEFAULT_ENDPOINT_MIX = {"orchestrate": 0.9, "status": 0.1}
+
+SATURATION_THROUGHPUT = 0.9  # achieved / offered rate below this is saturated
+SATURATION_ERROR_RATE = 0.05
+
+# Unthrottled tenant registered by --local, so the sweep measures capacity
+# rather than the default tenant's rate limit
+BENCHMARK_TENANT = "benchmark"
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse "fast=0.5,coding=0.5" into normalized weights"""
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    total = sum(weights.values())
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def parse_numbers(value: str) -> List[float]:
+    return [float(item) for item in value.split(",") if item.strip()]
+
+
+def _choose(rng: random.Random, mix: Dict[str, float]) -> str:
+    return rng.choices(list(mix), weights=list(mix.values()))[0]
+
+
+class LoadGenerator:
+    """Builds requests from the configured mixes and times them over HTTP"""
+
+    def __init__(
+        self,
+        orchestration_url: str = ORCHESTRATION_URL,
+        rag_url: str = RAG_URL,
+        category_mix: Optional[Dict[str, float]] = None,
+        endpoint_mix: Optional[Dict[str, float]] = None,
+        tenant: str = "default",
+        timeout: float = 120,
+        seed: int = 0,
+    ):
+        self.orchestration_url = orchestration_url.rstrip("/")
+        self.rag_url = rag_url.rstrip("/")
+        self.category_mix = category_mix or DEFAULT_CATEGORY_MIX
+        self.endpoint_mix = endpoint_mix or DEFAULT_ENDPOINT_MIX
+        self.tenant = tenant
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def next_request(self) -> Dict:
+        """Pick the endpoint and query for the next request"""
+        with self._rng_lock:
+            endpoint = _choose(self.rng, self.endpoint_mix)
+            category = _choose(self.rng, self.category_mix)
+            query = self.rng.choice(QUERY_MIX[category])
+
+        if endpoint == "orchestrate":
+            return {
+                "endpoint": endpoint,
+                "category": category,
+                "url": f"{self.orchestration_url}/orchestrate",
+                "body": {"query": query, "tenant": self.tenant},
+            }
+        if endpoint == "rag":
+            return {
+                "endpoint": endpoint,
+                "category": category,
+                "url": f"{self.rag_url}/rag/query",
+                "body": {"query": query, "tenant": self.tenant},
+            }
+        if endpoint == "status":
+            return {
+                "endpoint": endpoint,
+                "category": None,
+                "url": f"{self.orchestration_url}/system/status",
+                "body": None,
+            }
+        if endpoint == "rag_stats":
+            return {
+                "endpoint": endpoint,
+                "category": None,
+                "url": f"{self.rag_url}/rag/stats",
+                "body": None,
+            }
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+
+    def send(self, request: Dict) -> Dict:
+        """Send one request and return its timing and outcome"""
+        data = None
+        headers = {}
+        if request["body"] is not None:
+            data = json.dumps(request["body"]).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        start = time.perf_counter()
+        status = None
+        error = None
+        try:
+            http_request = urllib.request.Request(
+                request["url"], data=data, headers=headers
+            )
+            with urllib.request.urlopen(http_request, timeout=self.timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+            error = f"HTTP {e.code}"
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            error = str(getattr(e, "reason", e))
+
+        return {
+            "endpoint": request["endpoint"],
+            "category": request["category"],
+            "status": status,
+            "error": error,
+            "latency": time.perf_counter() - start,
+        }
+
+    def run_open_loop(self, rate: float, duration: float) -> List[Dict]:
+        """Fire requests at Poisson arrivals for duration seconds"""
+        results = []
+        futures = []
+        with ThreadPoolExecutor(max_workers=max(8, int(rate * 30))) as executor:
+            start = time.perf_counter()
+            next_arrival = 0.0
+            while next_arrival < duration:
+                delay = start + next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self.send, self.next_request()))
+                with self._rng_lock:
+                    next_arrival += self.rng.expovariate(rate)
+            results = [future.result() for future in futures]
+        return results
+
+    def run_closed_loop(self, concurrency: int, duration: float) -> List[Dict]:
+        """Keep concurrency clients sending back to back for duration seconds"""
+        results = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def client():
+            while time.perf_counter() < deadline:
+                result = self.send(self.next_request())
+                with lock:
+                    results.append(result)
+
+        threads = [threading.Thread(target=client) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+
+def summarize(results: List[Dict], elapsed: float) -> Dict:
+    """Throughput, latency percentiles and error rates for one sweep step"""
+    latencies = [result["latency"] for result in results]
+    errors = [result for result in results if result["error"]]
+    status_counts: Dict[str, int] = {}
+    for result in results:
+        key = str(result["status"] or "connection_error")
+        status_counts[key] = status_counts.get(key, 0) + 1
+    throttled = status_counts.get("429", 0)
+    admitted = len(results) - throttled
+
+    summary = {
+        "requests": len(results),
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        # Excluding 429s, which the tenant's rate limit answers immediately
+        "admitted_throughput": admitted / elapsed if elapsed else 0.0,
+        "error_rate": len(errors) / len(results) if results else 0.0,
+        "capacity_error_rate": (
+            (len(errors) - throttled) / admitted if admitted else 0.0
+        ),
+        "throttled": throttled,
+        "rejected": status_counts.get("503", 0),
+        "status_counts": status_counts,
+        "latency": {
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 0.5),
+            "p90": percentile(latencies, 0.9),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies, default=0.0),
+        },
+    }
+
+    by_endpoint = {}
+    for endpoint in sorted({result["endpoint"] for result in results}):
+        subset = [result for result in results if result["endpoint"] == endpoint]
+        endpoint_latencies = [result["latency"] for result in subset]
+        by_endpoint[endpoint] = {
+            "requests": len(subset),
+            "error_rate": sum(1 for result in subset if result["error"]) / len(subset),
+            "p50": percentile(endpoint_latencies, 0.5),
+            "p99": percentile(endpoint_latencies, 0.99),
+        }
+    summary["by_endpoint"] = by_endpoint
+    return summary
+
+
+def find_saturation(steps: List[Dict]) -> Optional[Dict]:
+    """
+    First sweep step that falls behind its offered load or errors too often.
+    Throttled requests are left out of both, so a tenant rate limit doesn't
+    read as saturation
+    """
+    for step in steps:
+        summary = step["summary"]
+        offered = step.get("admitted_rate")
+        behind = (
+            offered is not None
+            and summary["admitted_throughput"] < SATURATION_THROUGHPUT * offered
+        )
+        if behind or summary["capacity_error_rate"] > SATURATION_ERROR_RATE:
+            return {
+                "mode": step["mode"],
+                "level": step["level"],
+                "throughput": summary["admitted_throughput"],
+                "error_rate": summary["capacity_error_rate"],
+                "p99": summary["latency"]["p99"],
+            }
+    return None
+
+
+def run_sweep(
+    generator: LoadGenerator, mode: str, levels: List[float], duration: float
+) -> Dict:
+    steps = []
+    for level in levels:
+        print(f"▶️  {mode} load at {level:g} for {duration:g}s...")
+        start = time.perf_counter()
+        if mode == "open":
+            results = generator.run_open_loop(level, duration)
+        else:
+            results = generator.run_closed_loop(int(level), duration)
+        # Open-loop stragglers finish after the window; count their full time
+        elapsed = max(time.perf_counter() - start, duration)
+        summary = summarize(results, elapsed)
+        steps.append(
+            {
+                "mode": mode,
+                "level": level,
+                # Realized Poisson arrivals, not the nominal rate
+                "offered_rate": len(results) / duration if mode == "open" else None,
+                "admitted_rate": (
+                    (len(results) - summary["throttled"]) / duration
+                    if mode == "open"
+                    else None
+                ),
+                "duration": duration,
+                "summary": summary,
+            }
+        )
+        print(
+            f"   {summary['requests']} requests, {summary['throughput']:.2f}/s, "
+            f"p50 {summary['latency']['p50']:.2f}s, "
+            f"p99 {summary['latency']['p99']:.2f}s, "
+            f"errors {summary['capacity_error_rate']:.1%}"
+        )
+        if summary["throttled"]:
+            print(
+                f"   ⚠️  {summary['throttled']} requests throttled (429) by the "
+                f"{generator.tenant!r} tenant's rate limit; not counted as saturation"
+            )
+
+    return {
+        "mode": mode,
+        "category_mix": generator.category_mix,
+        "endpoint_mix": generator.endpoint_mix,
+        "timestamp": time.time(),
+        "steps": steps,
+        "saturation": find_saturation(steps),
+    }
+
+
+def render_html(report: Dict) -> str:
+    """Standalone HTML page with one table row per sweep step"""
+    level_name = "Arrival rate (req/s)" if report["mode"] == "open" else "Clients"
+    rows = []
+    for step in report["steps"]:
+        summary = step["summary"]
+        latency = summary["latency"]
+        saturated = report["saturation"] and report["saturation"]["level"] == (
+            step["level"]
+        )
+        row_class = ' class="saturated"' if saturated else ""
+        rows.append(
+            f"<tr{row_class}>"
+            f"<td>{step['level']:g}</td><td>{summary['requests']}</td>"
+            f"<td>{summary['throughput']:.2f}</td>"
+            f"<td>{latency['p50']:.3f}</td><td>{latency['p90']:.3f}</td>"
+            f"<td>{latency['p99']:.3f}</td><td>{latency['max']:.3f}</td>"
+            f"<td>{summary['capacity_error_rate']:.1%}</td><td>{summary['throttled']}</td>"
+            f"<td>{summary['rejected']}</td></tr>"
+        )
+
+    saturation = report["saturation"]
+    saturation_text = (
+        f"Saturated at {saturation['level']:g} "
+        f"({saturation['throughput']:.2f} req/s, p99 {saturation['p99']:.2f}s)"
+        if saturation
+        else "No saturation point reached"
+    )
+    mixes = html.escape(
+        json.dumps({"categories": report["category_mix"], **report["endpoint_mix"]})
+    )
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Load test report</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: right; }}
+tr.saturated {{ background: #fdd; }}
+</style>
+</head>
+<body>
+<h1>Load test report ({report['mode']} loop)</h1>
+<p>{html.escape(saturation_text)}</p>
+<p>Mix: <code>{mixes}</code></p>
+<table>
+<tr><th>{level_name}</th><th>Requests</th><th>Throughput (req/s)</th>
+<th>p50 (s)</th><th>p90 (s)</th><th>p99 (s)</th><th>Max (s)</th>
+<th>Errors</th><th>429</th><th>503</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+
+
+def start_local_api(port: int = 8001) -> str:
+    """
+    Serve the orchestration API in-process on the simulated backend, with an
+    unthrottled benchmark tenant and a throwaway job database.
+    Must run before anything imports orchestration.config.settings
+    """
+    os.environ.setdefault("ORCHESTRATION_BACKEND", "simulated")
+    os.environ.setdefault("ORCHESTRATION_SIM_TIME_SCALE", "0.1")
+    job_dir = tempfile.TemporaryDirectory(prefix="load_generator_")
+    os.environ.setdefault("ORCHESTRATION_JOB_DB", os.path.join(job_dir.name, "jobs.db"))
+
+    import uvicorn
+
+    from orchestration.config.settings import TENANT_CONFIGS, TenantConfig
+
+    TENANT_CONFIGS[BENCHMARK_TENANT] = TenantConfig(
+        name=BENCHMARK_TENANT,
+        requests_per_second=1_000_000.0,
+        burst=1_000_000,
+        max_concurrent=1_000_000,
+    )
+
+    from api.orchestration_api import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    # Keep the job database directory alive for as long as the server runs
+    server.job_dir = job_dir
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["open", "closed"], default="open")
+    parser.add_argument("--rates", default="1,2,4", help="Open-loop req/s sweep")
+    parser.add_argument(
+        "--concurrency", default="1,2,4,8", help="Closed-loop client count sweep"
+    )
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--orchestration-url", default=ORCHESTRATION_URL)
+    parser.add_argument("--rag-url", default=RAG_URL)
+    parser.add_argument(
+        "--categories", help="Query mix, e.g. fast=0.5,coding=0.3,analysis=0.2"
+    )
+    parser.add_argument(
+        "--endpoints",
+        help="Endpoint mix over orchestrate, rag, status and rag_stats",
+    )
+    parser.add_argument(
+        "--tenant",
+        help=f'Tenant to send as (default "{BENCHMARK_TENANT}" with --local, '
+        'otherwise "default", which is rate limited)',
+    )
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Start the orchestration API in-process on the simulated backend",
+    )
+    parser.add_argument("--local-port", type=int, default=8011)
+    parser.add_argument("--json-report", help="Write the full report as JSON")
+    parser.add_argument("--html-report", help="Write an HTML summary")
+    args = parser.parse_args()
+
+    orchestration_url = args.orchestration_url
+    if args.local:
+        orchestration_url = start_local_api(args.local_port)
+        print(f"🧪 Local orchestration API on {orchestration_url} (simulated backend)")
+
+    generator = LoadGenerator(
+        orchestration_url=orchestration_url,
+        rag_url=args.rag_url,
+        category_mix=parse_mix(args.categories) if args.categories else None,
+        endpoint_mix=parse_mix(args.endpoints) if args.endpoints else None,
+        tenant=args.tenant or (BENCHMARK_TENANT if args.local else "default"),
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+    levels = parse_numbers(args.rates if args.mode == "open" else args.concurrency)
+    report = run_sweep(generator, args.mode, levels, args.duration)
+
+    if report["saturation"]:
+        print(f"📉 Saturation at {report['saturation']['level']:g}")
+    else:
+        print("✅ No saturation point reached")
+
+    if args.json_report:
+        with open(args.json_report, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.html_report:
+        with open(args.html_report, "w", encoding="utf-8") as file:
+            file.write(render_html(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Replay a recorded request journal through ModelOrchestrator.
+
+Feeds journaled requests (see ORCHESTRATION_JOURNAL_DIR) back through the real
+router, admission control, tenant limits and dispatch queue, keeping the original
+inter-arrival gaps divided by --speed. Run several scheduling policies against the
+same traffic and compare latency, shed load and routing against the recording.
+
+    python benchmarks/replay_journal.py journals/orchestration.ndjson \\
+        --speed 10 --policies fifo,weighted_fair
+
+On the simulated backend, service times are scaled by 1/speed as well so the
+replay keeps the recorded load level; latencies are reported in recorded time.
+Tenant rate limits are multiplied by the speed for the same reason
+(--no-rate-limits lifts them).
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import dataclasses
+import json
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.load_generator import percentile
+
+
+def scaled_tenant_configs(speed: Optional[float]) -> Dict:
+    """
+    Tenant configs with request rates multiplied by speed, since token buckets
+    refill in wall-clock time while the replay compresses it. None lifts the
+    limits entirely
+    """
+    from orchestration.config.settings import TENANT_CONFIGS
+
+    return {
+        name: dataclasses.replace(
+            config,
+            requests_per_second=(
+                config.requests_per_second * speed if speed is not None else 1e9
+            ),
+            burst=config.burst if speed is not None else 1_000_000_000,
+        )
+        for name, config in TENANT_CONFIGS.items()
+    }
+
+
+def replay(entries: List[Dict], orchestrator, speed: float, pin_models: bool) -> Dict:
+    """Submit entries at their (scaled) recorded offsets and collect outcomes"""
+    from orchestration.core.balancer.admission import AdmissionRejected
+    from orchestration.core.balancer.tenancy import RateLimitExceeded
+
+    outcomes = []
+    submitted = []
+    counts = {"throttled": 0, "rejected": 0}
+
+    first_arrival = entries[0]["arrival"]
+    start = time.perf_counter()
+    for entry in entries:
+        delay = start + (entry["arrival"] - first_arrival) / speed - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            future = orchestrator.process_request(
+                entry["query"],
+                entry.get("priority", "balanced"),
+                entry.get("model") if pin_models else None,
+                tenant=entry.get("tenant", "default"),
+            )
+        except RateLimitExceeded:
+            counts["throttled"] += 1
+            continue
+        except AdmissionRejected:
+            counts["rejected"] += 1
+            continue
+        submitted.append((entry, future))
+
+    for entry, future in submitted:
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        outcome = {
+            "priority": entry.get("priority", "balanced"),
+            "latency": None,
+            "success": result.get("success", False),
+            "model": result.get("model"),
+            "recorded_model": entry.get("model"),
+        }
+        if result.get("arrival") is not None and result.get("timestamp") is not None:
+            # Queue wait plus service, back in recorded time units
+            finished = result["timestamp"] + (result.get("response_time") or 0.0)
+            outcome["latency"] = (finished - result["arrival"]) * speed
+        outcomes.append(outcome)
+    wall_time = time.perf_counter() - start
+
+    timed = [outcome for outcome in outcomes if outcome["latency"] is not None]
+    latencies = [outcome["latency"] for outcome in timed]
+    by_priority: Dict[str, List[float]] = {}
+    for outcome in timed:
+        by_priority.setdefault(outcome["priority"], []).append(outcome["latency"])
+    routed = [outcome for outcome in outcomes if outcome["recorded_model"]]
+
+    return {
+        "requests": len(entries),
+        "completed": sum(1 for outcome in outcomes if outcome["success"]),
+        "failed": sum(1 for outcome in outcomes if not outcome["success"]),
+        **counts,
+        "wall_time": wall_time,
+        "latency": {
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 0.5),
+            "p99": percentile(latencies, 0.99),
+        },
+        "by_priority": {
+            priority: {
+                "mean": sum(values) / len(values),
+                "p99": percentile(values, 0.99),
+            }
+            for priority, values in sorted(by_priority.items())
+        },
+        "model_agreement": (
+            sum(1 for o in routed if o["model"] == o["recorded_model"]) / len(routed)
+            if routed
+            else None
+        ),
+    }
+
+
+def recorded_summary(entries: List[Dict]) -> Dict:
+    """What the journal itself says happened, for comparison"""
+    served = [entry for entry in entries if not entry.get("rejected")]
+    latencies = [
+        entry.get("queue_time", 0.0) + entry.get("service_time", 0.0)
+        for entry in served
+    ]
+    return {
+        "requests": len(entries),
+        "rejected": len(entries) - len(served),
+        "span": entries[-1]["arrival"] - entries[0]["arrival"],
+        "latency": {
+            "p50": percentile(latencies, 0.5),
+            "p99": percentile(latencies, 0.99),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("journals", nargs="+", help="Journal files to replay")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="Replay speed-up, 1 is original"
+    )
+    parser.add_argument(
+        "--policies", help="Comma-separated scheduling policies to compare"
+    )
+    parser.add_argument("--backend", default="simulated", help="ollama or simulated")
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        help="Simulated backend time scale (default 1/speed)",
+    )
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument(
+        "--pin-models",
+        action="store_true",
+        help="Reuse the recorded model instead of routing again",
+    )
+    parser.add_argument(
+        "--no-rate-limits",
+        action="store_true",
+        help="Lift tenant rate limits instead of scaling them by --speed",
+    )
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    # Select the backend before any orchestration module reads the settings
+    os.environ["ORCHESTRATION_BACKEND"] = args.backend
+
+    from orchestration.config.settings import ORCHESTRATION_CONFIG
+    from orchestration.core.backend.factory import create_backend
+    from orchestration.core.orchestrator import ModelOrchestrator
+    from orchestration.core.telemetry.request_journal import read_journal
+
+    entries = sorted(
+        (entry for path in args.journals for entry in read_journal(path)),
+        key=lambda entry: entry["arrival"],
+    )
+    if not entries:
+        print("No journal entries found")
+        return
+
+    policies = (
+        args.policies.split(",")
+        if args.policies
+        else [ORCHESTRATION_CONFIG.scheduling_policy]
+    )
+    backend_options = {}
+    if args.backend == "simulated":
+        backend_options["time_scale"] = (
+            args.time_scale if args.time_scale is not None else 1.0 / args.speed
+        )
+
+    results = {"recorded": recorded_summary(entries), "replays": {}}
+    for policy in policies:
+        ORCHESTRATION_CONFIG.scheduling_policy = policy
+        # Fresh backend per run so model residency does not carry over
+        orchestrator = ModelOrchestrator(
+            args.concurrency, backend=create_backend(args.backend, **backend_options)
+        )
+        orchestrator.load_balancer.tenants.tenant_configs = scaled_tenant_configs(
+            None if args.no_rate_limits else args.speed
+        )
+        try:
+            results["replays"][policy] = replay(
+                entries, orchestrator, args.speed, args.pin_models
+            )
+        finally:
+            orchestrator.shutdown()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    recorded = results["recorded"]
+    print(
+        f"Journal: {recorded['requests']} requests over {recorded['span']:.0f}s, "
+        f"replayed at {args.speed:g}x"
+    )
+    print(f"{'policy':<15}{'p50':>10}{'p99':>10}{'shed':>10}{'agree':>10}")
+    print(
+        f"{'recorded':<15}{recorded['latency']['p50']:>9.1f}s"
+        f"{recorded['latency']['p99']:>9.1f}s{recorded['rejected']:>10}"
+    )
+    for policy, result in results["replays"].items():
+        agreement = result["model_agreement"]
+        print(
+            f"{policy:<15}{result['latency']['p50']:>9.1f}s"
+            f"{result['latency']['p99']:>9.1f}s"
+            f"{result['rejected'] + result['throttled']:>10}"
+            f"{agreement if agreement is not None else 0:>10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Measure per-query latency of MMR diversification at different over-fetch factors.
+
+Builds a synthetic corpus of unit embeddings in which every chunk has several
+near-copies (overlapping chunks, repeated crawls). Each query runs an exact
+top-k search over it, standing in for the vector store, and then narrows the
+candidates with MMR. For each factor the benchmark reports the search and MMR
+times and how redundant the returned results are.
+
+    python benchmarks/retrieval_benchmark.py --factors 1,2,4,8,16
+
+--reranker also scores candidates with a cross-encoder (needs
+sentence-transformers and the model download), over synthetic texts.
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from rag.retrieval.reranking import (
+    MMR_LAMBDA,
+    CrossEncoderReranker,
+    diversify,
+    normalize_rows,
+)
+
+DIMENSIONS = 384  # all-MiniLM-L6-v2
+
+
+def generate_corpus(
+    rng: np.random.Generator, chunks: int, copies: int, noise: float
+) -> np.ndarray:
+    """Unit embeddings in groups of copies that differ only by a little noise"""
+    bases = rng.standard_normal((chunks // copies, DIMENSIONS), dtype=np.float32)
+    corpus = np.repeat(bases, copies, axis=0)
+    corpus += noise * rng.standard_normal(corpus.shape, dtype=np.float32)
+    return normalize_rows(corpus)
+
+
+def search(corpus: np.ndarray, query: np.ndarray, n_results: int) -> Dict:
+    """Exact top-n by cosine similarity, shaped like search_documents results"""
+    scores = corpus @ query
+    top = np.argpartition(-scores, n_results - 1)[:n_results]
+    top = top[np.argsort(-scores[top])]
+    return {
+        "ids": [str(i) for i in top],
+        "documents": [f"Synthetic chunk {i} about topic {i // 8}." for i in top],
+        "distances": (2 - 2 * scores[top]).tolist(),
+        "metadatas": [{"source": f"doc_{i}"} for i in top],
+        "embeddings": corpus[top],
+    }
+
+
+def redundancy(embeddings: np.ndarray) -> float:
+    """Mean over results of their highest cosine similarity to another result"""
+    if len(embeddings) < 2:
+        return 0.0
+    similarity = embeddings @ embeddings.T
+    np.fill_diagonal(similarity, -1)
+    return float(similarity.max(axis=1).mean())
+
+
+def run(
+    corpus: np.ndarray,
+    queries: np.ndarray,
+    n_results: int,
+    factor: int,
+    lambda_mult: float,
+    reranker=None,
+) -> Dict:
+    search_seconds = mmr_seconds = 0.0
+    redundancies = []
+    for query in queries:
+        start = time.perf_counter()
+        candidates = search(corpus, query, n_results * factor)
+        search_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        if factor > 1:
+            results = diversify(
+                "synthetic query", query, candidates, n_results, lambda_mult, reranker
+            )
+        else:
+            results = candidates
+        mmr_seconds += time.perf_counter() - start
+        redundancies.append(redundancy(results["embeddings"]))
+
+    count = len(queries)
+    return {
+        "factor": factor,
+        "candidates": n_results * factor,
+        "search_ms": search_seconds / count * 1000,
+        "mmr_ms": mmr_seconds / count * 1000,
+        "total_ms": (search_seconds + mmr_seconds) / count * 1000,
+        "redundancy": float(np.mean(redundancies)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=50000)
+    parser.add_argument("--copies", type=int, default=4, help="Near-copies per chunk")
+    parser.add_argument("--noise", type=float, default=0.02)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--n-results", type=int, default=5)
+    parser.add_argument("--factors", default="1,2,4,8,16")
+    parser.add_argument("--lambda", dest="lambda_mult", type=float, default=MMR_LAMBDA)
+    parser.add_argument("--reranker", help="Cross-encoder model to score candidates")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    corpus = generate_corpus(rng, args.chunks, args.copies, args.noise)
+    # Queries close to random chunks, like real questions about stored content
+    picks = rng.integers(0, len(corpus), args.queries)
+    queries = normalize_rows(
+        corpus[picks]
+        + 0.5 * rng.standard_normal((args.queries, DIMENSIONS), dtype=np.float32)
+    )
+    reranker = CrossEncoderReranker(args.reranker) if args.reranker else None
+
+    results: List[Dict] = [
+        run(corpus, queries, args.n_results, int(factor), args.lambda_mult, reranker)
+        for factor in args.factors.split(",")
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Corpus: {len(corpus)} chunks, {args.copies} near-copies each")
+    print(
+        f"{'factor':>7}{'candidates':>12}{'search ms':>11}{'mmr ms':>9}"
+        f"{'total ms':>10}{'redundancy':>12}"
+    )
+    for result in results:
+        print(
+            f"{result['factor']:>7}{result['candidates']:>12}"
+            f"{result['search_ms']:>11.3f}{result['mmr_ms']:>9.3f}"
+            f"{result['total_ms']:>10.3f}{result['redundancy']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Compare dispatch queue scheduling policies on a recorded workload.
+
+Replays the workload in virtual time against the real scheduling policies and
+service time predictor, using each record's observed service time as ground
+truth, and reports mean and tail latency per policy.
+
+    python benchmarks/scheduling_benchmark.py --slots 4
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import heapq
+import json
+from typing import Dict, List
+
+from orchestration.core.balancer.load_balancer import RequestTask
+from orchestration.core.balancer.scheduling import SCHEDULING_POLICIES, create_policy
+from orchestration.core.balancer.service_time_predictor import ServiceTimePredictor
+from orchestration.core.balancer.wait_estimator import WaitTimeEstimator
+
+DEFAULT_WORKLOAD = os.path.join(
+    os.path.dirname(__file__), "workloads", "recorded_workload.jsonl"
+)
+
+
+def load_workload(path: str) -> List[Dict]:
+    """Load a recorded workload, one JSON request per line"""
+    with open(path, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    return sorted(records, key=lambda record: record["arrival"])
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def simulate(workload: List[Dict], policy_name: str, slots: int) -> Dict:
+    """Run the workload through one policy in virtual time"""
+    policy = create_policy(policy_name)
+    estimator = WaitTimeEstimator()
+    predictor = ServiceTimePredictor(estimator)
+
+    completions = []  # heap of (finish_time, sequence, task, record)
+    records: Dict[str, Dict] = {}
+    latencies: Dict[str, List[float]] = {}
+    busy = 0
+    now = 0.0
+    index = 0
+    sequence = 0
+
+    while index < len(workload) or len(policy) or completions:
+        next_arrival = workload[index]["arrival"] if index < len(workload) else None
+        next_finish = completions[0][0] if completions else None
+
+        if next_finish is not None and (
+            next_arrival is None or next_finish <= next_arrival
+        ):
+            now, _, task, record = heapq.heappop(completions)
+            busy -= 1
+            estimator.record(task.model, record["service_time"])
+            # Recorded output length is approximated by the service time
+            predictor.observe(
+                task.model,
+                task.query,
+                task.category,
+                "x" * int(record["service_time"] * 40),
+                record["service_time"],
+            )
+            latencies.setdefault(task.priority, []).append(now - task.timestamp)
+        else:
+            record = workload[index]
+            index += 1
+            now = record["arrival"]
+            task = RequestTask(
+                request_id=f"req_{index}",
+                query=record["query"],
+                model=record["model"],
+                priority=record["priority"],
+                timestamp=now,
+                category=record.get("category"),
+                predicted_service_time=predictor.predict(
+                    record["model"], record["query"], record.get("category")
+                ),
+            )
+            records[task.request_id] = record
+            policy.push(task, now)
+
+        while busy < slots and len(policy):
+            task = policy.pop(now)
+            busy += 1
+            sequence += 1
+            record = records.pop(task.request_id)
+            finish = now + record["service_time"]
+            heapq.heappush(completions, (finish, sequence, task, record))
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "policy": policy_name,
+        "requests": len(all_latencies),
+        "mean": sum(all_latencies) / len(all_latencies),
+        "p50": percentile(all_latencies, 0.5),
+        "p99": percentile(all_latencies, 0.99),
+        "by_priority": {
+            priority: {
+                "mean": sum(values) / len(values),
+                "p99": percentile(values, 0.99),
+            }
+            for priority, values in sorted(latencies.items())
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workload", default=DEFAULT_WORKLOAD)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    workload = load_workload(args.workload)
+    results = [simulate(workload, name, args.slots) for name in SCHEDULING_POLICIES]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Workload: {len(workload)} requests, {args.slots} slots")
+    print(f"{'policy':<15}{'mean':>10}{'p50':>10}{'p99':>10}")
+    for result in results:
+        print(
+            f"{result['policy']:<15}{result['mean']:>9.1f}s"
+            f"{result['p50']:>9.1f}s{result['p99']:>9.1f}s"
+        )
+        for priority, stats in result["by_priority"].items():
+            print(
+                f"  {priority:<13}{stats['mean']:>9.1f}s{'':>10}{stats['p99']:>9.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
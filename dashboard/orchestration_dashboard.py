@@ -37,7 +37,12 @@ def get_recommendations(query):
 def orchestrate_query(query, priority="balanced", timeout=60):
     """Send query to orchestration API"""
     try:
-        payload = {"query": query, "priority": priority, "timeout": timeout}
+        payload = {
+            "query": query,
+            "priority": priority,
+            "timeout": timeout,
+            "tenant": "dashboard",
+        }
         response = requests.post(f"{API_BASE}/orchestrate", json=payload)
         if response.status_code == 200:
             return response.json()
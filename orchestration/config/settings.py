@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from typing import Dict
 
@@ -11,6 +12,26 @@ class ModelConfig:
     priority: int
 
 
+@dataclass
+class TenantConfig:
+    name: str
+    weight: float = 1.0  # share of model capacity under weighted fair scheduling
+    requests_per_second: float = 2.0  # token bucket refill rate
+    burst: int = 10  # token bucket capacity
+    max_concurrent: int = 2  # requests executing at once
+
+
+@dataclass
+class SimulatedModelProfile:
+    time_to_first_token: float = 0.3  # seconds, median
+    tokens_per_second: float = 40.0
+    output_tokens: int = 300  # median natural response length
+    load_time: float = 3.0  # seconds to load into memory on a cold start
+    memory_gb: float = 5.0
+    jitter: float = 0.25  # lognormal sigma applied to TTFT, token rate and length
+    failure_rate: float = 0.0  # fraction of requests failing with a backend error
+
+
 @dataclass
 class OrchestrationConfig:
     models: Dict[str, ModelConfig]
@@ -18,6 +39,24 @@ class OrchestrationConfig:
     health_check_interval: int = 300  # 5 minutes
     default_timeout: int = 60
     enable_auto_scaling: bool = True
+    enable_admission_control: bool = True
+    admission_wait_quantile: float = 0.9  # service-time quantile used for deadlines
+    service_time_window: int = 100  # observed service times kept per model
+    scheduling_policy: str = "weighted_fair"  # fifo, priority, sjf or weighted_fair
+    max_queue_size: int = 100
+    aging_rate: float = 0.5  # seconds of predicted cost forgiven per second queued
+    batch_window: int = 32  # batch requests kept queued at once per batch call
+    model_status_ttl: float = 2.0  # seconds an `ollama ps` snapshot is reused
+    job_workers: int = 2  # background workers pulling from the job queue
+    job_poll_interval: float = 1.0
+    job_timeout: int = 900  # deadline and backend timeout for queued jobs
+    job_lease_grace: int = 60  # running jobs are reclaimed this long past timeout
+    job_max_attempts: int = 5  # admission retries before a job is failed
+    hook_workers: int = 2  # threads running completion callbacks and subscribers
+    journal_max_bytes: int = 10_000_000  # rotate the request journal at this size
+    journal_backups: int = 5
+    profile_sample_rate: float = 0.0  # fraction of requests profiled when enabled
+    profile_interval: float = 0.005  # seconds between profiler stack samples
 
 
 # Model configurations
@@ -43,7 +82,158 @@ MODEL_CONFIGS = {
         max_response_time=20.0,
         priority=3,
     ),
+    "mixtral:8x7b-instruct-v0.1-q4_0": ModelConfig(
+        name="mixtral:8x7b-instruct-v0.1-q4_0",
+        category="analysis",
+        size_gb=26,
+        max_response_time=45.0,
+        priority=4,
+    ),
+    "llama3.1:70b": ModelConfig(
+        name="llama3.1:70b",
+        category="reasoning",
+        size_gb=42,
+        max_response_time=90.0,
+        priority=5,
+    ),
+}
+
+# Scheduling class for each request priority (lower is served first)
+PRIORITY_CLASSES = {
+    "speed": 0,
+    "balanced": 1,
+    "normal": 1,
+    "accuracy": 1,
+    "background": 2,
+}
+
+# Share of capacity per priority for weighted fair scheduling
+PRIORITY_WEIGHTS = {
+    "speed": 4.0,
+    "balanced": 2.0,
+    "normal": 2.0,
+    "accuracy": 2.0,
+    "background": 1.0,
+}
+
+# Per-tenant capacity shares, rate limits and concurrency quotas.
+# Unknown tenant names are accounted as the "default" tenant, sharing its
+# bucket, quota and fair share.
+DEFAULT_TENANT = "default"
+
+TENANT_CONFIGS = {
+    "default": TenantConfig(
+        name="default",
+        weight=1.0,
+        requests_per_second=2.0,
+        burst=10,
+        max_concurrent=2,
+    ),
+    "dashboard": TenantConfig(
+        name="dashboard",
+        weight=4.0,
+        requests_per_second=5.0,
+        burst=20,
+        max_concurrent=3,
+    ),
+    "batch": TenantConfig(
+        name="batch",
+        weight=1.0,
+        requests_per_second=50.0,
+        burst=500,
+        max_concurrent=2,
+    ),
+}
+
+# SQLite database backing the asynchronous job queue
+JOB_DB_PATH = os.getenv("ORCHESTRATION_JOB_DB", "./jobs.db")
+# Comma-separated hosts job callbacks may be sent to. When unset, any host
+# that resolves only to public addresses is allowed
+JOB_CALLBACK_HOSTS = [
+    host.strip()
+    for host in os.getenv("ORCHESTRATION_CALLBACK_HOSTS", "").split(",")
+    if host.strip()
+]
+
+# Directory for request journals (one file per API); unset disables journaling
+JOURNAL_DIR = os.getenv("ORCHESTRATION_JOURNAL_DIR")
+
+# Opt-in sampling profiler: X-Profile header, sampled requests and /admin/profile
+PROFILING_ENABLED = os.getenv("ORCHESTRATION_PROFILING", "0") == "1"
+PROFILE_DIR = os.getenv("ORCHESTRATION_PROFILE_DIR", "./profiles")
+# Required in X-Admin-Token for the /admin profiling endpoints; unset leaves
+# them unregistered
+ADMIN_TOKEN = os.getenv("ORCHESTRATION_ADMIN_TOKEN")
+
+# Ollama HTTP API used by the model backend
+OLLAMA_BASE_URL = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+
+# Model backend: "ollama" for real models, "simulated" for GPU-less testing
+MODEL_BACKEND = os.getenv("ORCHESTRATION_BACKEND", "ollama")
+
+# Timing profiles used by the simulated backend
+SIMULATED_MODEL_PROFILES = {
+    "neural-chat:7b-v3.3-q4_0": SimulatedModelProfile(
+        time_to_first_token=0.15,
+        tokens_per_second=60.0,
+        output_tokens=150,
+        load_time=2.0,
+        memory_gb=4.1,
+    ),
+    "llama3.1:8b": SimulatedModelProfile(
+        time_to_first_token=0.25,
+        tokens_per_second=45.0,
+        output_tokens=300,
+        load_time=3.0,
+        memory_gb=4.9,
+    ),
+    "codellama:13b": SimulatedModelProfile(
+        time_to_first_token=0.4,
+        tokens_per_second=30.0,
+        output_tokens=400,
+        load_time=4.5,
+        memory_gb=7.4,
+    ),
+    "mixtral:8x7b-instruct-v0.1-q4_0": SimulatedModelProfile(
+        time_to_first_token=0.8,
+        tokens_per_second=18.0,
+        output_tokens=500,
+        load_time=12.0,
+        memory_gb=26.0,
+    ),
+    "llama3.1:70b": SimulatedModelProfile(
+        time_to_first_token=1.5,
+        tokens_per_second=6.0,
+        output_tokens=600,
+        load_time=25.0,
+        memory_gb=42.0,
+    ),
+}
+SIMULATED_MEMORY_GB = 48.0  # resident models are evicted LRU beyond this
+SIMULATED_TIME_SCALE = float(os.getenv("ORCHESTRATION_SIM_TIME_SCALE", "1.0"))
+
+# Default output-length budgets (num_predict tokens). A request gets the smaller
+# of its priority and category budgets unless it asks for max_tokens explicitly.
+GENERATION_BUDGETS = {
+    "priority": {
+        "speed": 256,
+        "balanced": 1024,
+        "normal": 1024,
+        "accuracy": 2048,
+        "background": 2048,
+    },
+    "category": {
+        "fast": 192,
+        "general": 1024,
+        "coding": 2048,
+        "analysis": 2048,
+        "reasoning": 2048,
+    },
 }
+# Largest max_tokens a request may ask for; Ollama treats num_predict -1 as
+# unlimited, so explicit values are bounded too
+MAX_GENERATION_TOKENS = 4096
+DEFAULT_TEMPERATURE = None  # use the model's own default
 
 # Default orchestration settings
 ORCHESTRATION_CONFIG = OrchestrationConfig(
@@ -52,4 +242,22 @@ ORCHESTRATION_CONFIG = OrchestrationConfig(
     health_check_interval=300,
     default_timeout=60,
     enable_auto_scaling=True,
+    enable_admission_control=True,
+    admission_wait_quantile=0.9,
+    service_time_window=100,
+    scheduling_policy="weighted_fair",
+    max_queue_size=100,
+    aging_rate=0.5,
+    batch_window=32,
+    model_status_ttl=2.0,
+    job_workers=2,
+    job_poll_interval=1.0,
+    job_timeout=900,
+    job_lease_grace=60,
+    job_max_attempts=5,
+    hook_workers=2,
+    journal_max_bytes=10_000_000,
+    journal_backups=5,
+    profile_sample_rate=0.0,
+    profile_interval=0.005,
 )
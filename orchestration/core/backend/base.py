@@ -0,0 +1,61 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from orchestration.core.backend.generation import GenerationOptions
+
+HEALTH_CHECK_PROMPT = "Hello"
+HEALTH_CHECK_TOKENS = 8
+
+
+class BackendError(Exception):
+    """Raised when the model backend fails a request"""
+
+
+class BackendTimeoutError(BackendError):
+    """Raised when the model backend does not answer in time"""
+
+
+class ModelBackend(ABC):
+    """Interface the orchestration layer uses to run and inspect models"""
+
+    name = "base"
+
+    @abstractmethod
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[GenerationOptions] = None,
+        timeout: float = 60,
+    ) -> Dict:
+        """
+        Generate a completion. Returns a dict with response, done_reason,
+        truncated and telemetry keys
+        """
+
+    @abstractmethod
+    def list_running(self) -> List[str]:
+        """Names of the models currently loaded in memory"""
+
+    def health_check(self, model: str, timeout: float = 30) -> Dict:
+        """Run a tiny generation and report whether the model answered"""
+        start_time = time.time()
+        try:
+            self.generate(
+                model,
+                HEALTH_CHECK_PROMPT,
+                GenerationOptions(num_predict=HEALTH_CHECK_TOKENS),
+                timeout=timeout,
+            )
+            error = None
+        except BackendTimeoutError:
+            error = "Timeout"
+        except BackendError as e:
+            error = str(e)
+
+        return {
+            "healthy": error is None,
+            "response_time": time.time() - start_time,
+            "error": error,
+        }
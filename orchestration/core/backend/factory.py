@@ -0,0 +1,35 @@
+import threading
+from typing import Dict, Optional
+
+from orchestration.config.settings import MODEL_BACKEND
+from orchestration.core.backend.base import ModelBackend
+from orchestration.core.backend.ollama_backend import OllamaBackend
+from orchestration.core.backend.simulated_backend import SimulatedBackend
+
+BACKENDS = {
+    "ollama": OllamaBackend,
+    "simulated": SimulatedBackend,
+}
+
+_shared_backends: Dict[str, ModelBackend] = {}
+_shared_lock = threading.Lock()
+
+
+def create_backend(name: Optional[str] = None, **kwargs) -> ModelBackend:
+    """Build a new backend by name, defaulting to the configured MODEL_BACKEND"""
+    name = name or MODEL_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown model backend: {name}")
+    return BACKENDS[name](**kwargs)
+
+
+def get_backend(name: Optional[str] = None) -> ModelBackend:
+    """
+    Process-wide backend instance, so the pool sees the models the balancer
+    loaded (this matters for the simulated backend's residency)
+    """
+    name = name or MODEL_BACKEND
+    with _shared_lock:
+        if name not in _shared_backends:
+            _shared_backends[name] = create_backend(name)
+        return _shared_backends[name]
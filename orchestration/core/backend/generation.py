@@ -0,0 +1,49 @@
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from orchestration.config.settings import (
+    DEFAULT_TEMPERATURE,
+    GENERATION_BUDGETS,
+    MAX_GENERATION_TOKENS,
+)
+
+CHARS_PER_TOKEN = 4  # rough English average, used to turn token budgets into text
+
+
+@dataclass
+class GenerationOptions:
+    num_predict: Optional[int] = None  # max tokens to generate
+    stop: Optional[List[str]] = None
+    temperature: Optional[float] = None
+
+    def to_ollama_options(self) -> Dict:
+        """Options payload for the Ollama generate API"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def resolve_generation_options(
+    priority: str,
+    category: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    stop: Optional[List[str]] = None,
+    temperature: Optional[float] = None,
+) -> GenerationOptions:
+    """Fill in configured per-priority and per-category budgets for a request"""
+    if max_tokens is None:
+        budgets = [
+            GENERATION_BUDGETS["priority"].get(priority),
+            GENERATION_BUDGETS["category"].get(category),
+        ]
+        budgets = [budget for budget in budgets if budget is not None]
+        max_tokens = min(budgets) if budgets else None
+    else:
+        max_tokens = min(max(max_tokens, 1), MAX_GENERATION_TOKENS)
+
+    return GenerationOptions(
+        num_predict=max_tokens,
+        stop=stop or None,
+        temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
+    )
@@ -0,0 +1,125 @@
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, Iterator, List, Optional
+
+from orchestration.config.settings import OLLAMA_BASE_URL
+from orchestration.core.backend.base import (
+    BackendError,
+    BackendTimeoutError,
+    ModelBackend,
+)
+from orchestration.core.backend.generation import GenerationOptions
+
+NANOSECONDS = 1e9
+
+
+def build_telemetry(final_chunk: Dict, time_to_first_token: Optional[float]) -> Dict:
+    """Convert Ollama's nanosecond timing fields into per-request telemetry"""
+    eval_count = final_chunk.get("eval_count", 0)
+    eval_duration = final_chunk.get("eval_duration", 0) / NANOSECONDS
+    prompt_eval_count = final_chunk.get("prompt_eval_count", 0)
+    prompt_eval_duration = final_chunk.get("prompt_eval_duration", 0) / NANOSECONDS
+
+    return {
+        "load_duration": final_chunk.get("load_duration", 0) / NANOSECONDS,
+        "prompt_eval_count": prompt_eval_count,
+        "prompt_eval_duration": prompt_eval_duration,
+        "eval_count": eval_count,
+        "eval_duration": eval_duration,
+        "total_duration": final_chunk.get("total_duration", 0) / NANOSECONDS,
+        "time_to_first_token": time_to_first_token,
+        "tokens_per_second": eval_count / eval_duration if eval_duration else None,
+        "prompt_tokens_per_second": (
+            prompt_eval_count / prompt_eval_duration if prompt_eval_duration else None
+        ),
+    }
+
+
+class OllamaBackend(ModelBackend):
+    """Runs generations through the Ollama HTTP API"""
+
+    name = "ollama"
+
+    def __init__(self, base_url: str = OLLAMA_BASE_URL):
+        self.base_url = base_url.rstrip("/")
+
+    def _stream(self, path: str, payload: Dict, timeout: float) -> Iterator[Dict]:
+        """POST and yield each NDJSON chunk, enforcing timeout on the whole call"""
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        deadline = time.monotonic() + timeout
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                for line in response:
+                    if time.monotonic() > deadline:
+                        raise BackendTimeoutError("Request timeout")
+                    if line.strip():
+                        chunk = json.loads(line)
+                        if "error" in chunk:
+                            raise BackendError(chunk["error"])
+                        yield chunk
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", str(e))
+            except Exception:
+                message = str(e)
+            raise BackendError(message)
+        except urllib.error.URLError as e:
+            if isinstance(e.reason, socket.timeout):
+                raise BackendTimeoutError("Request timeout")
+            raise BackendError(f"Ollama unavailable: {e.reason}")
+        except socket.timeout:
+            raise BackendTimeoutError("Request timeout")
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[GenerationOptions] = None,
+        timeout: float = 60,
+    ) -> Dict:
+        """
+        Generate a completion. Returns the response text, whether it was cut
+        short by the num_predict budget, and token-level timing telemetry.
+        """
+        payload = {"model": model, "prompt": prompt, "stream": True}
+        if options is not None:
+            payload["options"] = options.to_ollama_options()
+
+        start = time.monotonic()
+        time_to_first_token = None
+        parts = []
+        final_chunk = {}
+
+        # Streaming lets us time the first token instead of inferring it
+        for chunk in self._stream("/api/generate", payload, timeout):
+            if chunk.get("response"):
+                if time_to_first_token is None:
+                    time_to_first_token = time.monotonic() - start
+                parts.append(chunk["response"])
+            if chunk.get("done"):
+                final_chunk = chunk
+
+        return {
+            "response": "".join(parts).strip(),
+            "done_reason": final_chunk.get("done_reason"),
+            "truncated": final_chunk.get("done_reason") == "length",
+            "telemetry": build_telemetry(final_chunk, time_to_first_token),
+        }
+
+    def list_running(self) -> List[str]:
+        """Models Ollama currently holds in memory (the /api/ps endpoint)"""
+        try:
+            with urllib.request.urlopen(
+                f"{self.base_url}/api/ps", timeout=5
+            ) as response:
+                payload = json.loads(response.read())
+        except (urllib.error.URLError, socket.timeout) as e:
+            raise BackendError(f"Ollama unavailable: {e}")
+        return [model["name"] for model in payload.get("models", [])]
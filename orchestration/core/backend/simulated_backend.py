@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from orchestration.config.settings import (
+    SIMULATED_MEMORY_GB,
+    SIMULATED_MODEL_PROFILES,
+    SIMULATED_TIME_SCALE,
+    SimulatedModelProfile,
+)
+from orchestration.core.backend.base import (
+    BackendError,
+    BackendTimeoutError,
+    ModelBackend,
+)
+from orchestration.core.backend.generation import CHARS_PER_TOKEN, GenerationOptions
+from orchestration.core.backend.ollama_backend import NANOSECONDS, build_telemetry
+
+VOCABULARY = (
+    "the model response simulated token output orchestration request "
+    "latency queue result answer data system value"
+).split()
+
+
+class SimulatedBackend(ModelBackend):
+    """
+    Deterministic stand-in for Ollama with per-model timing profiles.
+    The same seed, model and prompt always produce the same timings; repeated
+    prompts draw the next value in their own sequence
+    """
+
+    name = "simulated"
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, SimulatedModelProfile]] = None,
+        memory_gb: float = SIMULATED_MEMORY_GB,
+        time_scale: float = SIMULATED_TIME_SCALE,
+        seed: int = 0,
+    ):
+        self.profiles = profiles if profiles is not None else SIMULATED_MODEL_PROFILES
+        self.memory_gb = memory_gb
+        self.time_scale = time_scale  # 0 returns instantly, 0.1 runs 10x faster
+        self.seed = seed
+        self.resident: "OrderedDict[str, float]" = OrderedDict()
+        self._occurrences: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "loads": 0,
+            "evictions": 0,
+        }
+
+    def _rng(self, model: str, prompt: str) -> random.Random:
+        key = (model, prompt)
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+        return random.Random(f"{self.seed}:{model}:{prompt}:{occurrence}")
+
+    def _ensure_resident(self, model: str, profile: SimulatedModelProfile) -> float:
+        """Make the model resident, evicting LRU models; returns the load time"""
+        with self._lock:
+            if model in self.resident:
+                self.resident.move_to_end(model)
+                return 0.0
+
+            self.resident[model] = profile.memory_gb
+            self.stats["loads"] += 1
+            while (
+                sum(self.resident.values()) > self.memory_gb and len(self.resident) > 1
+            ):
+                self.resident.popitem(last=False)
+                self.stats["evictions"] += 1
+            return profile.load_time
+
+    def _sleep(self, seconds: float):
+        if self.time_scale > 0:
+            time.sleep(seconds * self.time_scale)
+
+    def sample(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[GenerationOptions] = None,
+    ) -> Dict:
+        """
+        Draw one request's timings and update residency without sleeping.
+        The discrete-event simulator calls this directly on its virtual clock
+        """
+        if model not in self.profiles:
+            raise BackendError(f"model '{model}' not found")
+
+        profile = self.profiles[model]
+        rng = self._rng(model, prompt)
+        with self._lock:
+            self.stats["requests"] += 1
+
+        load_time = self._ensure_resident(model, profile)
+        time_to_first_token = profile.time_to_first_token * rng.lognormvariate(
+            0, profile.jitter
+        )
+        tokens_per_second = profile.tokens_per_second * rng.lognormvariate(
+            0, profile.jitter
+        )
+        natural_tokens = max(
+            1, int(profile.output_tokens * rng.lognormvariate(0, profile.jitter))
+        )
+        budget = options.num_predict if options and options.num_predict else None
+        eval_count = min(natural_tokens, budget) if budget else natural_tokens
+        eval_duration = eval_count / tokens_per_second
+
+        return {
+            "rng": rng,
+            "load_time": load_time,
+            "time_to_first_token": time_to_first_token,
+            "eval_count": eval_count,
+            "eval_duration": eval_duration,
+            "total_duration": load_time + time_to_first_token + eval_duration,
+            "truncated": budget is not None and natural_tokens > budget,
+            "failed": rng.random() < profile.failure_rate,
+        }
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[GenerationOptions] = None,
+        timeout: float = 60,
+    ) -> Dict:
+        timing = self.sample(model, prompt, options)
+        load_time = timing["load_time"]
+        time_to_first_token = timing["time_to_first_token"]
+        total_duration = timing["total_duration"]
+
+        if timing["failed"]:
+            self._sleep(load_time + time_to_first_token)
+            with self._lock:
+                self.stats["failures"] += 1
+            raise BackendError("Simulated backend failure")
+
+        if total_duration > timeout:
+            self._sleep(timeout)
+            with self._lock:
+                self.stats["timeouts"] += 1
+            raise BackendTimeoutError("Request timeout")
+
+        self._sleep(total_duration)
+
+        final_chunk = {
+            "done_reason": "length" if timing["truncated"] else "stop",
+            "load_duration": load_time * NANOSECONDS,
+            "prompt_eval_count": len(prompt) // CHARS_PER_TOKEN + 1,
+            "prompt_eval_duration": time_to_first_token * NANOSECONDS,
+            "eval_count": timing["eval_count"],
+            "eval_duration": timing["eval_duration"] * NANOSECONDS,
+            "total_duration": total_duration * NANOSECONDS,
+        }
+        rng = timing["rng"]
+        return {
+            "response": " ".join(
+                rng.choice(VOCABULARY) for _ in range(timing["eval_count"])
+            ),
+            "done_reason": final_chunk["done_reason"],
+            "truncated": timing["truncated"],
+            "telemetry": build_telemetry(final_chunk, load_time + time_to_first_token),
+        }
+
+    def list_running(self) -> List[str]:
+        with self._lock:
+            return list(self.resident)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.stats,
+                "resident_models": list(self.resident),
+                "memory_used_gb": sum(self.resident.values()),
+            }
@@ -0,0 +1,126 @@
+import math
+from typing import Dict, List, Optional
+
+
+def retry_after_header(retry_after: float) -> str:
+    """Retry-After value in whole seconds"""
+    return str(max(1, math.ceil(retry_after)))
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be served within its deadline"""
+
+    def __init__(self, message: str, retry_after: float, estimated_wait: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.estimated_wait = estimated_wait
+
+    @property
+    def retry_after_header(self) -> str:
+        return retry_after_header(self.retry_after)
+
+
+class AdmissionController:
+    """Admit, downgrade or shed requests up front using predicted wait times"""
+
+    def __init__(
+        self, load_balancer, routing_rules: Dict[str, List[str]], quantile=0.9
+    ):
+        self.load_balancer = load_balancer
+        self.routing_rules = routing_rules
+        self.quantile = quantile
+        self.stats = {
+            "admitted": 0,
+            "downgraded": 0,
+            "rejected": 0,
+        }
+
+    def predict_completion(
+        self,
+        model: str,
+        query: str = "",
+        category: Optional[str] = None,
+        priority: str = "balanced",
+        tenant: str = "default",
+        options=None,
+    ) -> Dict:
+        """Predicted wait and completion time for a request sent to model now"""
+        wait = self.load_balancer.estimate_wait_time(
+            model, query, category, priority, tenant, options
+        )
+        service = self.load_balancer.predict_service_time(
+            model,
+            query,
+            category,
+            self.quantile,
+            max_tokens=options.num_predict if options else None,
+        )
+        return {"model": model, "estimated_wait": wait, "completion": wait + service}
+
+    def _downgrade_candidates(self, model: str, category: str) -> List[str]:
+        candidates = self.routing_rules.get(category, []) + self.routing_rules.get(
+            "fast", []
+        )
+        seen = {model}
+        ordered = []
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                ordered.append(candidate)
+        return ordered
+
+    def admit(
+        self,
+        model: str,
+        category: str,
+        deadline: Optional[float] = None,
+        allow_downgrade: bool = True,
+        query: str = "",
+        priority: str = "balanced",
+        tenant: str = "default",
+        options=None,
+    ) -> Dict:
+        """
+        Decide whether a request can start now and finish within deadline seconds.
+        Returns the admission decision or raises AdmissionRejected.
+        """
+        prediction = self.predict_completion(
+            model, query, category, priority, tenant, options
+        )
+
+        if not self.load_balancer.can_accept_request():
+            self.stats["rejected"] += 1
+            raise AdmissionRejected(
+                "Load balancer at capacity",
+                retry_after=prediction["estimated_wait"],
+                estimated_wait=prediction["estimated_wait"],
+            )
+
+        if deadline is None or prediction["completion"] <= deadline:
+            self.stats["admitted"] += 1
+            return {**prediction, "deadline": deadline, "downgraded_from": None}
+
+        if allow_downgrade:
+            for candidate in self._downgrade_candidates(model, category):
+                alternative = self.predict_completion(
+                    candidate, query, category, priority, tenant, options
+                )
+                if alternative["completion"] <= deadline:
+                    self.stats["admitted"] += 1
+                    self.stats["downgraded"] += 1
+                    return {
+                        **alternative,
+                        "deadline": deadline,
+                        "downgraded_from": model,
+                    }
+
+        # Retry once enough of the queue has drained for the service time to fit
+        service = prediction["completion"] - prediction["estimated_wait"]
+        retry_after = max(prediction["estimated_wait"] - (deadline - service), 1.0)
+        self.stats["rejected"] += 1
+        raise AdmissionRejected(
+            f"Deadline of {deadline:.1f}s cannot be met by {model} "
+            f"(predicted {prediction['completion']:.1f}s)",
+            retry_after=retry_after,
+            estimated_wait=prediction["estimated_wait"],
+        )
@@ -1,9 +1,31 @@
-import subprocess
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+import itertools
+import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from queue import Queue
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
+
+from orchestration.config.settings import DEFAULT_TENANT, ORCHESTRATION_CONFIG
+from orchestration.core.backend.base import BackendTimeoutError, ModelBackend
+from orchestration.core.backend.factory import get_backend
+from orchestration.core.backend.generation import GenerationOptions
+from orchestration.core.balancer.scheduling import create_policy
+from orchestration.core.balancer.service_time_predictor import ServiceTimePredictor
+from orchestration.core.balancer.tenancy import TenantManager
+from orchestration.core.balancer.wait_estimator import WaitTimeEstimator
+from orchestration.core.telemetry.metrics_registry import MetricsRegistry
+
+
+class LoadBalancerAtCapacity(Exception):
+    """Raised when the queue is full or the load balancer has stopped"""
 
 
 @dataclass
@@ -14,21 +36,61 @@ class RequestTask:
     priority: str
     timestamp: float
     callback: Optional[Callable] = None
+    admission: Optional[Dict] = None
+    category: Optional[str] = None
+    predicted_service_time: float = 0.0
+    tenant: str = DEFAULT_TENANT
+    options: Optional[GenerationOptions] = None
+    timeout: Optional[float] = None  # backend timeout, default_timeout if unset
 
 
 class LoadBalancer:
-    def __init__(self, max_concurrent_requests: int = 3):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 3,
+        scheduling_policy: Optional[str] = None,
+        max_queue_size: Optional[int] = None,
+        backend: Optional[ModelBackend] = None,
+    ):
         self.max_concurrent_requests = max_concurrent_requests
-        self.request_queue = Queue()
+        self.max_queue_size = (
+            max_queue_size
+            if max_queue_size is not None
+            else ORCHESTRATION_CONFIG.max_queue_size
+        )
+        self.tenants = TenantManager()
+        self.scheduler = create_policy(
+            scheduling_policy or ORCHESTRATION_CONFIG.scheduling_policy,
+            aging_rate=ORCHESTRATION_CONFIG.aging_rate,
+            tenant_weights=self.tenants.weight,
+        )
+        self.pending_futures: Dict[str, Future] = {}
         self.active_requests = {}
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent_requests)
+        # Completion hooks run here so slow hooks never hold an inference slot
+        self.hook_executor = ThreadPoolExecutor(
+            max_workers=ORCHESTRATION_CONFIG.hook_workers,
+            thread_name_prefix="completion-hook",
+        )
+        self.subscribers: List[Callable[[Dict], None]] = []
+        self.wait_estimator = WaitTimeEstimator(
+            window=ORCHESTRATION_CONFIG.service_time_window
+        )
+        self.predictor = ServiceTimePredictor(self.wait_estimator)
+        self.backend = backend or get_backend()
+        self.metrics = MetricsRegistry(window=ORCHESTRATION_CONFIG.service_time_window)
+        self._lock = threading.RLock()
+        self._request_ids = itertools.count(1)
         self.running = False
+        self.stopped = False
         self.stats = {
             "total_requests": 0,
             "completed_requests": 0,
             "failed_requests": 0,
             "average_response_time": 0.0,
             "current_load": 0,
+            "truncated_responses": 0,
+            "hook_errors": 0,
         }
 
     def start(self):
@@ -37,9 +99,15 @@ class LoadBalancer:
         print("Load balancer started")
 
     def stop(self):
-        """Stop the load balancer"""
-        self.running = False
+        """Stop the load balancer, cancelling requests still waiting in the queue"""
+        with self._lock:
+            self.running = False
+            self.stopped = True
+            while len(self.scheduler):
+                task = self.scheduler.pop(time.time())
+                self.pending_futures.pop(task.request_id).cancel()
         self.executor.shutdown(wait=True)
+        self.hook_executor.shutdown(wait=True)
         print("Load balancer stopped")
 
     def get_current_load(self) -> float:
@@ -48,7 +116,48 @@ class LoadBalancer:
 
     def can_accept_request(self) -> bool:
         """Check if system can accept new requests"""
-        return len(self.active_requests) < self.max_concurrent_requests
+        return (
+            len(self.active_requests) < self.max_concurrent_requests
+            or len(self.scheduler) < self.max_queue_size
+        )
+
+    def estimate_wait_time(
+        self,
+        model: Optional[str] = None,
+        query: str = "",
+        category: Optional[str] = None,
+        priority: str = "balanced",
+        tenant: str = DEFAULT_TENANT,
+        options: Optional[GenerationOptions] = None,
+    ) -> float:
+        """Estimate how long a newly submitted request waits for a slot"""
+        now = time.time()
+        probe = self._create_task(
+            query, model or "", priority, category, None, tenant, options
+        )
+        with self._lock:
+            in_flight = [
+                (info["task"].model, now - info["start_time"])
+                for info in self.active_requests.values()
+            ]
+            ahead = self.scheduler.ahead_of(probe, now)
+
+        return self.wait_estimator.estimate_wait(
+            in_flight,
+            [task.predicted_service_time for task in ahead],
+            self.max_concurrent_requests,
+        )
+
+    def predict_service_time(
+        self,
+        model: str,
+        query: str = "",
+        category: Optional[str] = None,
+        quantile: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> float:
+        """Predicted time the request will hold a slot once dispatched"""
+        return self.predictor.predict(model, query, category, quantile, max_tokens)
 
     def execute_model_request(self, task: RequestTask) -> Dict:
         """Execute a single model request"""
@@ -56,11 +165,11 @@ class LoadBalancer:
 
         try:
             # Execute the model request
-            result = subprocess.run(
-                ["ollama", "run", task.model, task.query],
-                capture_output=True,
-                text=True,
-                timeout=60,
+            result = self.backend.generate(
+                task.model,
+                task.query,
+                task.options,
+                timeout=task.timeout or ORCHESTRATION_CONFIG.default_timeout,
             )
 
             end_time = time.time()
@@ -70,19 +179,39 @@ class LoadBalancer:
                 "request_id": task.request_id,
                 "query": task.query,
                 "model": task.model,
-                "response": result.stdout.strip() if result.returncode == 0 else None,
-                "error": result.stderr if result.returncode != 0 else None,
+                "response": result["response"],
+                "error": None,
                 "response_time": response_time,
                 "timestamp": start_time,
-                "success": result.returncode == 0,
+                **self._task_metadata(task),
+                "success": True,
+                "truncated": result["truncated"],
+                "telemetry": result.get("telemetry"),
+                "generation_options": (
+                    task.options.to_dict() if task.options else None
+                ),
             }
+            if task.admission:
+                response["admission"] = task.admission
+            if response["truncated"]:
+                self.stats["truncated_responses"] += 1
 
             # Update stats
             self._update_stats(response_time, response["success"])
+            if response["success"]:
+                self.metrics.record(task.model, response["telemetry"])
+                self.wait_estimator.record(task.model, response_time)
+                self.predictor.observe(
+                    task.model,
+                    task.query,
+                    task.category,
+                    response["response"],
+                    response_time,
+                )
 
             return response
 
-        except subprocess.TimeoutExpired:
+        except BackendTimeoutError:
             end_time = time.time()
             response_time = end_time - start_time
 
@@ -94,10 +223,12 @@ class LoadBalancer:
                 "error": "Request timeout",
                 "response_time": response_time,
                 "timestamp": start_time,
+                **self._task_metadata(task),
                 "success": False,
             }
 
             self._update_stats(response_time, False)
+            self.wait_estimator.record(task.model, response_time)
             return response
 
         except Exception as e:
@@ -112,44 +243,164 @@ class LoadBalancer:
                 "error": str(e),
                 "response_time": response_time,
                 "timestamp": start_time,
+                **self._task_metadata(task),
                 "success": False,
             }
 
             self._update_stats(response_time, False)
             return response
 
-        finally:
-            # Remove from active requests
-            if task.request_id in self.active_requests:
-                del self.active_requests[task.request_id]
-
-    def submit_request(
-        self, query: str, model: str, priority: str = "normal"
-    ) -> Future:
-        """Submit a request for processing"""
-        if not self.can_accept_request():
-            raise Exception("Load balancer at capacity")
+    def _task_metadata(self, task: RequestTask) -> Dict:
+        """Request attributes echoed in results for hooks and journaling"""
+        return {
+            "priority": task.priority,
+            "category": task.category,
+            "tenant": task.tenant,
+            "arrival": task.timestamp,
+        }
 
-        request_id = f"req_{int(time.time() * 1000)}"
-        task = RequestTask(
-            request_id=request_id,
+    def _create_task(
+        self,
+        query: str,
+        model: str,
+        priority: str,
+        category: Optional[str],
+        admission: Optional[Dict],
+        tenant: str = DEFAULT_TENANT,
+        options: Optional[GenerationOptions] = None,
+    ) -> RequestTask:
+        return RequestTask(
+            request_id=f"req_{int(time.time() * 1000)}_{next(self._request_ids)}",
             query=query,
             model=model,
             priority=priority,
             timestamp=time.time(),
+            admission=admission,
+            category=category,
+            predicted_service_time=self.predictor.predict(
+                model,
+                query,
+                category,
+                max_tokens=options.num_predict if options else None,
+            ),
+            tenant=self.tenants.resolve(tenant),
+            options=options,
         )
 
-        # Submit to executor
-        future = self.executor.submit(self.execute_model_request, task)
-        self.active_requests[request_id] = {
-            "task": task,
-            "future": future,
-            "start_time": time.time(),
-        }
+    def submit_request(
+        self,
+        query: str,
+        model: str,
+        priority: str = "normal",
+        admission: Optional[Dict] = None,
+        category: Optional[str] = None,
+        tenant: str = DEFAULT_TENANT,
+        options: Optional[GenerationOptions] = None,
+        callback: Optional[Callable[[Dict], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue a request; it is dispatched in scheduling policy order.
+        callback receives the result dict once the request finishes
+        """
+        task = self._create_task(
+            query, model, priority, category, admission, tenant, options
+        )
+        task.callback = callback
+        task.timeout = timeout
+        future = Future()
 
-        self.stats["total_requests"] += 1
+        with self._lock:
+            if self.stopped or not self.can_accept_request():
+                raise LoadBalancerAtCapacity("Load balancer at capacity")
+
+            self.pending_futures[task.request_id] = future
+            self.scheduler.push(task, task.timestamp)
+            self.stats["total_requests"] += 1
+
+        self._dispatch()
         return future
 
+    def _dispatch(self):
+        """Move queued requests onto free execution slots"""
+        with self._lock:
+            while (
+                not self.stopped
+                and len(self.scheduler)
+                and len(self.active_requests) < self.max_concurrent_requests
+            ):
+                # Tenants at their concurrency quota wait for their own slots
+                task = self.scheduler.pop(time.time(), self.tenants.can_dispatch)
+                if task is None:
+                    break
+
+                future = self.pending_futures.pop(task.request_id)
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                self.tenants.on_dispatch(task)
+                self.active_requests[task.request_id] = {
+                    "task": task,
+                    "future": future,
+                    "start_time": time.time(),
+                }
+                self.executor.submit(self._run_task, task, future)
+
+    def _run_task(self, task: RequestTask, future: Future):
+        result = {}
+        try:
+            result = self.execute_model_request(task)
+            future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+            result = {
+                "request_id": task.request_id,
+                "query": task.query,
+                "model": task.model,
+                "error": str(e),
+                "success": False,
+            }
+        finally:
+            # The slot belongs to dispatch, so it is freed here whatever ran
+            with self._lock:
+                self.active_requests.pop(task.request_id, None)
+            self.tenants.on_complete(
+                task, result.get("response_time", 0.0), result.get("success", False)
+            )
+            self._dispatch()
+            self.notify_completion(result, task.callback)
+
+    def subscribe(self, hook: Callable[[Dict], None]):
+        """Register a hook called with the result of every finished request"""
+        with self._lock:
+            self.subscribers.append(hook)
+
+    def unsubscribe(self, hook: Callable[[Dict], None]):
+        with self._lock:
+            if hook in self.subscribers:
+                self.subscribers.remove(hook)
+
+    def notify_completion(
+        self, result: Dict, callback: Optional[Callable[[Dict], None]] = None
+    ):
+        """Hand a finished result to its callback and subscribers off the worker"""
+        with self._lock:
+            hooks = ([callback] if callback else []) + list(self.subscribers)
+        if hooks:
+            self.hook_executor.submit(self._run_hooks, hooks, result)
+
+    def _run_hooks(self, hooks: List[Callable[[Dict], None]], result: Dict):
+        for hook in hooks:
+            try:
+                hook(result)
+            except Exception as e:
+                # One failing hook must not starve the others
+                print(
+                    f"❌ Completion hook {getattr(hook, '__name__', hook)} failed: {e}"
+                )
+                with self._lock:
+                    self.stats["hook_errors"] += 1
+
     def _update_stats(self, response_time: float, success: bool):
         """Update performance statistics"""
         if success:
@@ -173,9 +424,19 @@ class LoadBalancer:
             **self.stats,
             "active_requests": len(self.active_requests),
             "max_concurrent": self.max_concurrent_requests,
-            "queue_size": self.request_queue.qsize(),
+            "queue_size": len(self.scheduler),
+            "scheduling_policy": self.scheduler.name,
+            "service_times": self.wait_estimator.get_stats(),
         }
 
+    def get_tenant_stats(self) -> Dict:
+        """Per-tenant usage, throttling and queue metrics"""
+        with self._lock:
+            queued = {}
+            for task in self.scheduler.tasks():
+                queued[task.tenant] = queued.get(task.tenant, 0) + 1
+        return self.tenants.get_stats(queued)
+
 
 if __name__ == "__main__":
     # Test the load balancer
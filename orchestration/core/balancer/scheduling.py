@@ -0,0 +1,256 @@
+import heapq
+import itertools
+from collections import deque
+from typing import Callable, Dict, List, Optional, Union
+
+from orchestration.config.settings import PRIORITY_CLASSES, PRIORITY_WEIGHTS
+
+DEFAULT_PRIORITY_CLASS = 1
+
+
+def priority_class(priority: str) -> int:
+    """Map a request priority onto its scheduling class"""
+    return PRIORITY_CLASSES.get(priority, DEFAULT_PRIORITY_CLASS)
+
+
+class SchedulingPolicy:
+    """Base class for dispatch queue ordering policies"""
+
+    name = "base"
+
+    def push(self, task, now: float):
+        raise NotImplementedError
+
+    def pop(self, now: float, eligible: Optional[Callable] = None):
+        """Next task to dispatch, skipping tasks eligible() rejects; None if none"""
+        raise NotImplementedError
+
+    def ahead_of(self, task, now: float) -> List:
+        """Queued tasks that would be dispatched before task if it arrived now"""
+        raise NotImplementedError
+
+    def tasks(self) -> List:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.tasks())
+
+
+def _pop_eligible(heap: List, eligible: Optional[Callable]):
+    """Pop the smallest heap entry whose task is eligible, keeping the rest"""
+    skipped = []
+    found = None
+    while heap:
+        entry = heapq.heappop(heap)
+        if eligible is None or eligible(entry[-1]):
+            found = entry
+            break
+        skipped.append(entry)
+    for entry in skipped:
+        heapq.heappush(heap, entry)
+    return found
+
+
+class FIFOPolicy(SchedulingPolicy):
+    """First come, first served"""
+
+    name = "fifo"
+
+    def __init__(self):
+        self.queue = deque()
+
+    def push(self, task, now: float):
+        self.queue.append(task)
+
+    def pop(self, now: float, eligible: Optional[Callable] = None):
+        for index, task in enumerate(self.queue):
+            if eligible is None or eligible(task):
+                del self.queue[index]
+                return task
+        return None
+
+    def ahead_of(self, task, now: float) -> List:
+        return list(self.queue)
+
+    def tasks(self) -> List:
+        return list(self.queue)
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+class _HeapPolicy(SchedulingPolicy):
+    """Shared heap bookkeeping for policies with a static sort key"""
+
+    def __init__(self):
+        self.heap = []
+        self.sequence = itertools.count()
+
+    def sort_key(self, task, now: float):
+        raise NotImplementedError
+
+    def push(self, task, now: float):
+        heapq.heappush(self.heap, (self.sort_key(task, now), next(self.sequence), task))
+
+    def pop(self, now: float, eligible: Optional[Callable] = None):
+        entry = _pop_eligible(self.heap, eligible)
+        return entry[-1] if entry else None
+
+    def ahead_of(self, task, now: float) -> List:
+        key = self.sort_key(task, now)
+        return [entry[-1] for entry in self.heap if entry[0] <= key]
+
+    def tasks(self) -> List:
+        return [entry[-1] for entry in sorted(self.heap)]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class PriorityPolicy(_HeapPolicy):
+    """Strict priority classes, FIFO within a class"""
+
+    name = "priority"
+
+    def sort_key(self, task, now: float):
+        return (priority_class(task.priority), now)
+
+
+class ShortestExpectedJobFirstPolicy(_HeapPolicy):
+    """
+    Shortest predicted service time first within a priority class.
+    Waiting tasks earn aging_rate seconds of credit per second queued, so
+    long jobs are delayed by at most (cost difference / aging_rate).
+    """
+
+    name = "sjf"
+
+    def __init__(self, aging_rate: float = 0.5):
+        super().__init__()
+        self.aging_rate = aging_rate
+
+    def sort_key(self, task, now: float):
+        # cost - rate * (t - now) orders the same as cost + rate * now for any t
+        return (
+            priority_class(task.priority),
+            task.predicted_service_time + self.aging_rate * now,
+        )
+
+
+class WeightedFairPolicy(SchedulingPolicy):
+    """
+    Self-clocked weighted fair queuing across flows.
+    Each flow receives capacity in proportion to its weight, with a request's
+    cost taken from its predicted service time. Flows default to priorities;
+    pass flow_key and a weight callable to share capacity by tenant instead.
+    within_flow orders a flow's own requests: the flow keeps its fair share of
+    dispatch turns, but each turn goes to its best-ranked queued request
+    """
+
+    name = "weighted_fair"
+
+    def __init__(
+        self,
+        flow_key: Optional[Callable] = None,
+        weights: Optional[Union[Dict[str, float], Callable]] = None,
+        within_flow: Optional[Callable] = None,
+    ):
+        self.flow_key = flow_key or (lambda task: task.priority)
+        self.weights = weights if weights is not None else PRIORITY_WEIGHTS
+        self.within_flow = within_flow
+        self.virtual_time = 0.0
+        self.last_finish: Dict[str, float] = {}
+        # Push order of queued tasks, kept across reassignments of heap slots
+        self.arrival: Dict[int, int] = {}
+        self.heap = []
+        self.sequence = itertools.count()
+
+    def _weight(self, flow: str) -> float:
+        if callable(self.weights):
+            weight = self.weights(flow)
+        else:
+            weight = self.weights.get(flow, 1.0)
+        return max(weight, 1e-6)
+
+    def _finish_tag(self, task) -> float:
+        flow = self.flow_key(task)
+        start = max(self.virtual_time, self.last_finish.get(flow, 0.0))
+        return start + max(task.predicted_service_time, 1e-3) / self._weight(flow)
+
+    def push(self, task, now: float):
+        finish = self._finish_tag(task)
+        self.last_finish[self.flow_key(task)] = finish
+        sequence = next(self.sequence)
+        self.arrival[id(task)] = sequence
+        heapq.heappush(self.heap, (finish, sequence, task))
+
+    def _take(self, task):
+        self.arrival.pop(id(task), None)
+        return task
+
+    def pop(self, now: float, eligible: Optional[Callable] = None):
+        entry = _pop_eligible(self.heap, eligible)
+        if entry is None:
+            return None
+        self.virtual_time = entry[0]
+        task = entry[-1]
+        if self.within_flow is None:
+            return self._take(task)
+
+        # The flow's queued requests are reassigned to its slots (this turn
+        # first) best-ranked first. Heap keys don't change, so order holds
+        flow = self.flow_key(task)
+        slots = sorted(
+            (entry[:2], index)
+            for index, entry in enumerate(self.heap)
+            if self.flow_key(entry[-1]) == flow
+        )
+        tasks = sorted(
+            [task] + [self.heap[index][-1] for _, index in slots],
+            key=lambda queued: (self.within_flow(queued), self.arrival[id(queued)]),
+        )
+        for ((finish, sequence), index), queued in zip(slots, tasks[1:]):
+            self.heap[index] = (finish, sequence, queued)
+        return self._take(tasks[0])
+
+    def ahead_of(self, task, now: float) -> List:
+        finish = self._finish_tag(task)
+        return [entry[-1] for entry in self.heap if entry[0] <= finish]
+
+    def tasks(self) -> List:
+        return [entry[-1] for entry in sorted(self.heap)]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+SCHEDULING_POLICIES = {
+    FIFOPolicy.name: FIFOPolicy,
+    PriorityPolicy.name: PriorityPolicy,
+    ShortestExpectedJobFirstPolicy.name: ShortestExpectedJobFirstPolicy,
+    WeightedFairPolicy.name: WeightedFairPolicy,
+}
+
+
+def create_policy(
+    name: str, aging_rate: float = 0.5, tenant_weights: Optional[Callable] = None
+) -> SchedulingPolicy:
+    """
+    Build a scheduling policy by name. With tenant_weights, weighted fair
+    queuing shares capacity between tenants rather than priorities.
+    """
+    if name not in SCHEDULING_POLICIES:
+        raise ValueError(
+            f"Unknown scheduling policy '{name}', "
+            f"expected one of {sorted(SCHEDULING_POLICIES)}"
+        )
+    if name == ShortestExpectedJobFirstPolicy.name:
+        return ShortestExpectedJobFirstPolicy(aging_rate=aging_rate)
+    if name == WeightedFairPolicy.name and tenant_weights is not None:
+        # Priority still decides which of a tenant's requests goes first
+        return WeightedFairPolicy(
+            flow_key=lambda task: task.tenant,
+            weights=tenant_weights,
+            within_flow=lambda task: priority_class(task.priority),
+        )
+    return SCHEDULING_POLICIES[name]()
@@ -0,0 +1,83 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from orchestration.core.backend.generation import CHARS_PER_TOKEN
+from orchestration.core.balancer.wait_estimator import WaitTimeEstimator
+
+DEFAULT_OUTPUT_CHARS = 600.0
+PROMPT_CHAR_WEIGHT = 0.1  # prompt evaluation is far cheaper than decoding per char
+
+
+class ServiceTimePredictor:
+    """
+    Predict how long a request will hold a slot from its model, prompt length,
+    category and the output lengths previously seen for that model and category.
+    """
+
+    def __init__(self, wait_estimator: WaitTimeEstimator, smoothing: float = 0.2):
+        self.wait_estimator = wait_estimator
+        self.smoothing = smoothing
+        self.seconds_per_char: Dict[str, float] = {}
+        self.output_chars: Dict[Tuple[str, Optional[str]], float] = {}
+        self._lock = threading.Lock()
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        if current is None:
+            return value
+        return current + self.smoothing * (value - current)
+
+    def expected_output_chars(self, model: str, category: Optional[str]) -> float:
+        """Historical output length for model and category, falling back to model"""
+        with self._lock:
+            if (model, category) in self.output_chars:
+                return self.output_chars[(model, category)]
+            return self.output_chars.get((model, None), DEFAULT_OUTPUT_CHARS)
+
+    def predict(
+        self,
+        model: str,
+        query: str,
+        category: Optional[str] = None,
+        quantile: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> float:
+        """Predicted service time in seconds, bounded by the output budget"""
+        mean = self.wait_estimator.expected_service_time(model)
+        with self._lock:
+            rate = self.seconds_per_char.get(model)
+
+        if rate is not None:
+            output_chars = self.expected_output_chars(model, category)
+            if max_tokens is not None:
+                output_chars = min(output_chars, max_tokens * CHARS_PER_TOKEN)
+            prediction = rate * (PROMPT_CHAR_WEIGHT * len(query) + output_chars)
+        else:
+            prediction = mean
+
+        if quantile is not None and mean > 0:
+            # Scale by the spread of the model's observed distribution
+            upper = self.wait_estimator.expected_service_time(model, quantile)
+            prediction *= max(upper / mean, 1.0)
+
+        return prediction
+
+    def observe(
+        self,
+        model: str,
+        query: str,
+        category: Optional[str],
+        output: Optional[str],
+        service_time: float,
+    ):
+        """Learn from a completed request"""
+        output_chars = float(len(output or ""))
+        work = PROMPT_CHAR_WEIGHT * len(query) + output_chars
+        with self._lock:
+            if work > 0:
+                self.seconds_per_char[model] = self._ewma(
+                    self.seconds_per_char.get(model), service_time / work
+                )
+            for key in ((model, category), (model, None)):
+                self.output_chars[key] = self._ewma(
+                    self.output_chars.get(key), output_chars
+                )
@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from orchestration.config.settings import DEFAULT_TENANT, TENANT_CONFIGS, TenantConfig
+from orchestration.core.balancer.admission import AdmissionRejected
+
+
+class RateLimitExceeded(AdmissionRejected):
+    """Raised when a tenant exceeds its request rate"""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available"""
+        self._refill(time.monotonic())
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Seconds until the requested tokens will be available"""
+        self._refill(time.monotonic())
+        if self.tokens >= tokens or self.rate <= 0:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+
+class TenantManager:
+    """Per-tenant rate limits, concurrency quotas and usage metrics"""
+
+    def __init__(self, tenant_configs: Optional[Dict[str, TenantConfig]] = None):
+        self.tenant_configs = (
+            tenant_configs if tenant_configs is not None else TENANT_CONFIGS
+        )
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.in_flight: Dict[str, int] = {}
+        self.usage: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, tenant: str) -> str:
+        """
+        The tenant name requests are accounted under. Names are client-supplied,
+        so unconfigured ones share the default tenant's bucket and fair share
+        rather than each getting a fresh burst (and state that grows per name)
+        """
+        return tenant if tenant in self.tenant_configs else DEFAULT_TENANT
+
+    def get_config(self, tenant: str) -> TenantConfig:
+        tenant = self.resolve(tenant)
+        if tenant in self.tenant_configs:
+            return self.tenant_configs[tenant]
+        return TenantConfig(DEFAULT_TENANT)
+
+    def weight(self, tenant: str) -> float:
+        return self.get_config(tenant).weight
+
+    def _usage(self, tenant: str) -> Dict:
+        if tenant not in self.usage:
+            self.usage[tenant] = {
+                "submitted": 0,
+                "throttled": 0,
+                "completed": 0,
+                "failed": 0,
+                "service_time": 0.0,
+            }
+        return self.usage[tenant]
+
+    def check_rate_limit(self, tenant: str):
+        """Consume one request token or raise RateLimitExceeded"""
+        tenant = self.resolve(tenant)
+        config = self.get_config(tenant)
+        with self._lock:
+            if tenant not in self.buckets:
+                self.buckets[tenant] = TokenBucket(
+                    config.requests_per_second, config.burst
+                )
+            bucket = self.buckets[tenant]
+            usage = self._usage(tenant)
+
+            if bucket.try_acquire():
+                usage["submitted"] += 1
+                return
+
+            usage["throttled"] += 1
+            retry_after = bucket.time_until_available()
+
+        raise RateLimitExceeded(
+            f"Rate limit exceeded for tenant '{tenant}' "
+            f"({config.requests_per_second}/s, burst {config.burst})",
+            retry_after=retry_after,
+            estimated_wait=retry_after,
+        )
+
+    def can_dispatch(self, task) -> bool:
+        """Whether the task's tenant is below its concurrency quota"""
+        tenant = self.resolve(task.tenant)
+        with self._lock:
+            in_flight = self.in_flight.get(tenant, 0)
+        return in_flight < self.get_config(tenant).max_concurrent
+
+    def on_dispatch(self, task):
+        tenant = self.resolve(task.tenant)
+        with self._lock:
+            self.in_flight[tenant] = self.in_flight.get(tenant, 0) + 1
+
+    def on_complete(self, task, response_time: float, success: bool):
+        tenant = self.resolve(task.tenant)
+        with self._lock:
+            self.in_flight[tenant] = max(self.in_flight.get(tenant, 0) - 1, 0)
+            usage = self._usage(tenant)
+            usage["completed" if success else "failed"] += 1
+            usage["service_time"] += response_time
+
+    def get_stats(self, queued: Optional[Dict[str, int]] = None) -> Dict:
+        """Usage and throttling metrics per tenant"""
+        queued = queued or {}
+        with self._lock:
+            tenants = set(self.usage) | set(self.in_flight) | set(queued)
+            return {
+                tenant: {
+                    **self._usage(tenant),
+                    "in_flight": self.in_flight.get(tenant, 0),
+                    "queued": queued.get(tenant, 0),
+                    "weight": self.get_config(tenant).weight,
+                    "max_concurrent": self.get_config(tenant).max_concurrent,
+                }
+                for tenant in sorted(tenants)
+            }
@@ -0,0 +1,119 @@
+import heapq
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from orchestration.config.settings import MODEL_CONFIGS, ORCHESTRATION_CONFIG
+
+DEFAULT_SERVICE_TIME = 10.0  # seconds, used for models with no history or config
+# Priors stay under this share of the default timeout. A model predicted to miss
+# every deadline would never run, so it would never replace its prior with samples
+COLD_PRIOR_SHARE = 0.5
+
+
+class WaitTimeEstimator:
+    """Queueing-based wait estimates built from observed per-model service times"""
+
+    def __init__(
+        self,
+        window: int = 100,
+        default_service_time: float = DEFAULT_SERVICE_TIME,
+        max_prior: Optional[float] = None,
+    ):
+        self.window = window
+        self.default_service_time = default_service_time
+        self.max_prior = (
+            max_prior
+            if max_prior is not None
+            else COLD_PRIOR_SHARE * ORCHESTRATION_CONFIG.default_timeout
+        )
+        self.service_times: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, service_time: float):
+        """Record how long a request held an execution slot"""
+        with self._lock:
+            if model not in self.service_times:
+                self.service_times[model] = deque(maxlen=self.window)
+            self.service_times[model].append(service_time)
+
+    def _samples(self, model: str) -> List[float]:
+        with self._lock:
+            return sorted(self.service_times.get(model, ()))
+
+    def _prior(self, model: str) -> float:
+        config = MODEL_CONFIGS.get(model)
+        prior = config.max_response_time if config else self.default_service_time
+        return min(prior, self.max_prior)
+
+    def expected_service_time(
+        self, model: str, quantile: Optional[float] = None
+    ) -> float:
+        """Mean service time, or the given quantile of the observed distribution"""
+        samples = self._samples(model)
+        if not samples:
+            return self._prior(model)
+
+        if quantile is None:
+            return sum(samples) / len(samples)
+
+        index = min(int(quantile * len(samples)), len(samples) - 1)
+        return samples[index]
+
+    def expected_remaining_time(self, model: str, elapsed: float) -> float:
+        """Expected time left for a request that has already run for `elapsed`"""
+        samples = self._samples(model)
+        if not samples:
+            return max(self._prior(model) - elapsed, 0.0)
+
+        # Conditional mean residual: E[S - elapsed | S > elapsed]
+        longer = [s - elapsed for s in samples if s > elapsed]
+        if longer:
+            return sum(longer) / len(longer)
+
+        # Running past everything we've seen; fall back to the mean residual life
+        mean = sum(samples) / len(samples)
+        second_moment = sum(s * s for s in samples) / len(samples)
+        return second_moment / (2 * mean) if mean > 0 else 0.0
+
+    def estimate_wait(
+        self,
+        in_flight: List[Tuple[str, float]],
+        queued: List[float],
+        slots: int,
+    ) -> float:
+        """
+        Estimate how long a new request waits for a slot.
+        in_flight holds (model, elapsed) pairs, queued the predicted service
+        times of the requests ahead in line.
+        """
+        if slots <= 0:
+            return float("inf")
+
+        free_at = sorted(
+            self.expected_remaining_time(model, elapsed) for model, elapsed in in_flight
+        )[:slots]
+        free_at += [0.0] * (slots - len(free_at))
+        heapq.heapify(free_at)
+
+        # Each queued request takes the earliest free slot ahead of us
+        for service_time in queued:
+            start = heapq.heappop(free_at)
+            heapq.heappush(free_at, start + service_time)
+
+        return free_at[0]
+
+    def get_stats(self) -> Dict:
+        """Per-model service time summary"""
+        stats = {}
+        for model in list(self.service_times):
+            samples = self._samples(model)
+            if not samples:
+                continue
+            stats[model] = {
+                "samples": len(samples),
+                "mean": sum(samples) / len(samples),
+                "p50": samples[len(samples) // 2],
+                "p90": samples[min(int(0.9 * len(samples)), len(samples) - 1)],
+            }
+        return stats
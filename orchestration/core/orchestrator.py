@@ -4,11 +4,24 @@ import sys
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+import asyncio
 import time
-from concurrent.futures import Future
-from typing import Dict, Optional
-
-from orchestration.core.balancer.load_balancer import LoadBalancer
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Dict, Iterator, List, Optional
+
+from orchestration.config.settings import DEFAULT_TENANT, ORCHESTRATION_CONFIG
+from orchestration.core.backend.base import ModelBackend
+from orchestration.core.backend.factory import get_backend
+from orchestration.core.backend.generation import (
+    GenerationOptions,
+    resolve_generation_options,
+)
+from orchestration.core.balancer.admission import AdmissionController, AdmissionRejected
+from orchestration.core.balancer.load_balancer import (
+    LoadBalancer,
+    LoadBalancerAtCapacity,
+)
+from orchestration.core.balancer.tenancy import RateLimitExceeded
 from orchestration.core.pool.model_pool import ModelPool
 from orchestration.core.router.model_router import ModelRouter
 
@@ -16,14 +29,29 @@ from orchestration.core.router.model_router import ModelRouter
 
 
 class ModelOrchestrator:
-    def __init__(self, max_concurrent_requests: int = 3):
-        self.model_pool = ModelPool()
-        self.router = ModelRouter()
-        self.load_balancer = LoadBalancer(max_concurrent_requests)
+    def __init__(
+        self, max_concurrent_requests: int = 3, backend: Optional[ModelBackend] = None
+    ):
+        # One backend and one pool shared by routing, health checks and execution
+        self.backend = backend or get_backend()
+        self.model_pool = ModelPool(backend=self.backend)
+        self.router = ModelRouter(self.model_pool)
+        self.load_balancer = LoadBalancer(max_concurrent_requests, backend=self.backend)
+        self.admission_controller = (
+            AdmissionController(
+                self.load_balancer,
+                self.router.routing_rules,
+                quantile=ORCHESTRATION_CONFIG.admission_wait_quantile,
+            )
+            if ORCHESTRATION_CONFIG.enable_admission_control
+            else None
+        )
         self.orchestration_stats = {
             "total_requests": 0,
             "successful_routes": 0,
             "failed_routes": 0,
+            "rejected_requests": 0,
+            "batch_requests": 0,
             "average_routing_time": 0.0,
         }
 
@@ -35,14 +63,29 @@ class ModelOrchestrator:
         query: str,
         priority: str = "balanced",
         user_preference: Optional[str] = None,
+        deadline: Optional[float] = None,
+        tenant: str = DEFAULT_TENANT,
+        generation: Optional[GenerationOptions] = None,
+        callback: Optional[Callable[[Dict], None]] = None,
+        timeout: Optional[float] = None,
     ) -> Future:
         """
         Main orchestration method that processes a user request
         Returns a Future that will contain the response
+        Unset generation options fall back to the configured per-priority and
+        per-category output budgets
+        callback, if given, is called with the result on a completion-hook thread
+        timeout overrides the configured default_timeout for the generation itself
+        Raises AdmissionRejected if the request cannot finish within deadline seconds,
+        or RateLimitExceeded if the tenant is over its request rate
         """
         start_time = time.time()
 
         try:
+            # Step 0: Per-tenant rate limiting before any routing work
+            tenant = self.load_balancer.tenants.resolve(tenant)
+            self.load_balancer.tenants.check_rate_limit(tenant)
+
             # Step 1: Route the request
             routing_decision = self.router.route_request(query, priority)
 
@@ -53,46 +96,148 @@ class ModelOrchestrator:
                 else routing_decision["selected_model"]
             )
 
-            # Step 3: Submit to load balancer
-            future = self.load_balancer.submit_request(query, selected_model, priority)
+            # Step 3: Bound generation length with the configured budgets
+            generation = generation or GenerationOptions()
+            options = resolve_generation_options(
+                priority,
+                routing_decision["category"],
+                max_tokens=generation.num_predict,
+                stop=generation.stop,
+                temperature=generation.temperature,
+            )
+
+            # Step 4: Admission control - shed or downgrade requests up front
+            admission = None
+            if self.admission_controller:
+                admission = self.admission_controller.admit(
+                    selected_model,
+                    routing_decision["category"],
+                    deadline=deadline,
+                    allow_downgrade=not user_preference,
+                    query=query,
+                    priority=priority,
+                    tenant=tenant,
+                    options=options,
+                )
+                selected_model = admission["model"]
+
+            # Step 5: Submit to load balancer
+            future = self.load_balancer.submit_request(
+                query,
+                selected_model,
+                priority,
+                admission=admission,
+                category=routing_decision["category"],
+                tenant=tenant,
+                options=options,
+                callback=callback,
+                timeout=timeout,
+            )
 
-            # Step 4: Update orchestration stats
+            # Step 6: Update orchestration stats
             routing_time = time.time() - start_time
             self._update_orchestration_stats(routing_time, True)
 
             return future
 
+        except AdmissionRejected as e:
+            self.orchestration_stats["rejected_requests"] += 1
+            # Subscribers see shed load too; the caller gets the exception
+            self.load_balancer.notify_completion(
+                {
+                    "query": query,
+                    "model": None,
+                    "error": str(e),
+                    "response_time": 0.0,
+                    "success": False,
+                    "rejected": True,
+                    "priority": priority,
+                    "tenant": tenant,
+                    "arrival": start_time,
+                }
+            )
+            raise
+
         except Exception as e:
             routing_time = time.time() - start_time
             self._update_orchestration_stats(routing_time, False)
 
             # Return a failed future
-            failed_future = self.load_balancer.executor.submit(
-                lambda: {
-                    "error": f"Orchestration failed: {str(e)}",
-                    "success": False,
-                    "orchestration": {
-                        "routing_time": routing_time,
-                        "orchestration_timestamp": start_time,
-                    },
-                }
-            )
+            failure = {
+                "error": f"Orchestration failed: {str(e)}",
+                "success": False,
+                "orchestration": {
+                    "routing_time": routing_time,
+                    "orchestration_timestamp": start_time,
+                },
+            }
+            self.load_balancer.notify_completion(failure, callback)
+            failed_future = self.load_balancer.executor.submit(lambda: failure)
 
             return failed_future
 
+    async def process_request_async(
+        self,
+        query: str,
+        priority: str = "balanced",
+        user_preference: Optional[str] = None,
+        deadline: Optional[float] = None,
+        tenant: str = DEFAULT_TENANT,
+        generation: Optional[GenerationOptions] = None,
+    ) -> Dict:
+        """Awaitable version of process_request for asyncio callers"""
+        future = self.process_request(
+            query,
+            priority,
+            user_preference,
+            deadline=deadline,
+            tenant=tenant,
+            generation=generation,
+        )
+        return await asyncio.wrap_future(future)
+
+    def add_completion_hook(self, hook: Callable[[Dict], None]):
+        """
+        Subscribe to every finished request (cache writers, metrics, persistence).
+        Hooks run on a separate thread pool, never on an inference worker
+        """
+        self.load_balancer.subscribe(hook)
+
+    def remove_completion_hook(self, hook: Callable[[Dict], None]):
+        self.load_balancer.unsubscribe(hook)
+
     def process_request_sync(
         self,
         query: str,
         priority: str = "balanced",
         user_preference: Optional[str] = None,
         timeout: int = 60,
+        tenant: str = DEFAULT_TENANT,
+        generation: Optional[GenerationOptions] = None,
     ) -> Dict:
         """
-        Synchronous version of process_request
+        Synchronous version of process_request, the timeout doubles as the deadline.
+        Never raises: a rejected request returns an error dict with retry_after
+        (and rate_limited when the tenant was throttled)
         """
-        future = self.process_request(query, priority, user_preference)
         try:
+            future = self.process_request(
+                query,
+                priority,
+                user_preference,
+                deadline=timeout,
+                tenant=tenant,
+                generation=generation,
+            )
             return future.result(timeout=timeout)
+        except AdmissionRejected as e:
+            return {
+                "error": str(e),
+                "success": False,
+                "query": query,
+                "retry_after": e.retry_after,
+                "rate_limited": isinstance(e, RateLimitExceeded),
+            }
         except Exception as e:
             return {
                 "error": f"Request timeout or failed: {str(e)}",
@@ -101,6 +246,98 @@ class ModelOrchestrator:
                 "timeout": timeout,
             }
 
+    def process_batch(
+        self,
+        queries: List[str],
+        priority: str = "background",
+        tenant: str = "batch",
+        user_preference: Optional[str] = None,
+        generation: Optional[GenerationOptions] = None,
+    ) -> Iterator[Dict]:
+        """
+        Process many queries as one bulk job.
+        Routes every query in a single pass, submits them grouped by model so a
+        model stays resident while its group drains, and returns an iterator
+        yielding each result (tagged with its input index) as it completes.
+        Raises RateLimitExceeded up front if the tenant is over its rate.
+        """
+        tenant = self.load_balancer.tenants.resolve(tenant)
+        self.load_balancer.tenants.check_rate_limit(tenant)
+        self.orchestration_stats["batch_requests"] += 1
+
+        decisions = self.router.route_batch(queries, priority)
+        generation = generation or GenerationOptions()
+        jobs = []
+        for index, decision in enumerate(decisions):
+            model = user_preference or decision["selected_model"]
+            options = resolve_generation_options(
+                priority,
+                decision["category"],
+                max_tokens=generation.num_predict,
+                stop=generation.stop,
+                temperature=generation.temperature,
+            )
+            jobs.append((model, index, decision["category"], options))
+
+        # Group by model to avoid swapping models in and out between requests
+        jobs.sort(key=lambda job: (job[0], job[1]))
+
+        return self._run_batch(queries, jobs, priority, tenant)
+
+    def _run_batch(
+        self, queries: List[str], jobs: List, priority: str, tenant: str
+    ) -> Iterator[Dict]:
+        pending = {}
+        next_job = 0
+
+        try:
+            while next_job < len(jobs) or pending:
+                # Keep a bounded window queued so batch work can't fill the queue
+                while (
+                    next_job < len(jobs)
+                    and len(pending) < ORCHESTRATION_CONFIG.batch_window
+                ):
+                    model, index, category, options = jobs[next_job]
+                    try:
+                        future = self.load_balancer.submit_request(
+                            queries[index],
+                            model,
+                            priority,
+                            category=category,
+                            tenant=tenant,
+                            options=options,
+                        )
+                    except LoadBalancerAtCapacity:
+                        if self.load_balancer.stopped:
+                            raise
+                        if pending:
+                            break  # queue full, retry once a batch request completes
+                        time.sleep(0.5)
+                        continue
+                    pending[future] = (index, category)
+                    next_job += 1
+
+                if not pending:
+                    continue
+
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, category = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {
+                            "query": queries[index],
+                            "error": str(e),
+                            "success": False,
+                        }
+                    yield {**result, "index": index, "category": category}
+        finally:
+            # Closed early (e.g. the streaming client went away): nobody will
+            # read these, so give their queue slots and tenant quota back
+            for future in pending:
+                future.cancel()
+
     def get_system_status(self) -> Dict:
         """Get comprehensive system status"""
         return {
@@ -111,7 +348,12 @@ class ModelOrchestrator:
                 "health_status": self.model_pool.health_status,
             },
             "load_balancer": self.load_balancer.get_stats(),
+            "model_telemetry": self.load_balancer.metrics.get_stats(),
             "orchestration": self.orchestration_stats,
+            "tenants": self.load_balancer.get_tenant_stats(),
+            "admission": (
+                self.admission_controller.stats if self.admission_controller else None
+            ),
             "system_load": self.load_balancer.get_current_load(),
             "timestamp": time.time(),
         }
@@ -136,20 +378,27 @@ class ModelOrchestrator:
             "category": routing_decision["category"],
             "alternative_models": routing_decision["available_models"],
             "system_load": system_status["system_load"],
-            "estimated_wait_time": self._estimate_wait_time(),
+            "estimated_wait_time": self._estimate_wait_time(
+                routing_decision["selected_model"], query, routing_decision["category"]
+            ),
+            "estimated_completion_time": self._estimate_completion_time(
+                routing_decision["selected_model"], query, routing_decision["category"]
+            ),
         }
 
-    def _estimate_wait_time(self) -> float:
-        """Estimate wait time based on current load"""
-        current_load = self.load_balancer.get_current_load()
-        avg_response_time = self.load_balancer.stats["average_response_time"]
-
-        if avg_response_time == 0:
-            avg_response_time = 10  # Default estimate
-
-        # Simple estimation: more load = longer wait
-        wait_multiplier = 1 + current_load
-        return avg_response_time * wait_multiplier
+    def _estimate_wait_time(
+        self, model: Optional[str] = None, query: str = "", category=None
+    ) -> float:
+        """Estimate queueing delay from in-flight and queued requests"""
+        return self.load_balancer.estimate_wait_time(model, query, category)
+
+    def _estimate_completion_time(
+        self, model: str, query: str = "", category=None
+    ) -> float:
+        """Estimate wait plus predicted service time on the given model"""
+        return self._estimate_wait_time(
+            model, query, category
+        ) + self.load_balancer.predict_service_time(model, query, category)
 
     def _update_orchestration_stats(self, routing_time: float, success: bool):
         """Update orchestration statistics"""
@@ -1,11 +1,17 @@
-import subprocess
 import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from orchestration.config.settings import ORCHESTRATION_CONFIG
+from orchestration.core.backend.base import ModelBackend
+from orchestration.core.backend.factory import get_backend
+
 
 class ModelPool:
-    def __init__(self):
+    def __init__(
+        self, status_ttl: Optional[float] = None, backend: Optional[ModelBackend] = None
+    ):
+        self.backend = backend or get_backend()
         self.models = {
             "neural-chat:7b-v3.3-q4_0": {
                 "category": "fast",
@@ -37,19 +43,20 @@ class ModelPool:
         self.performance_metrics = {}
         self.health_status = {}
         self.last_health_check = {}
+        self.status_ttl = (
+            status_ttl
+            if status_ttl is not None
+            else ORCHESTRATION_CONFIG.model_status_ttl
+        )
+        self.last_status_check = 0.0
 
     def get_model_status(self) -> Dict:
-        """Get current status of all models"""
-        try:
-            result = subprocess.run(["ollama", "ps"], capture_output=True, text=True)
-            active_models = []
+        """Get current status of all models, reusing snapshots younger than the TTL"""
+        if time.time() - self.last_status_check < self.status_ttl:
+            return self.models
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")[1:]  # Skip header
-                for line in lines:
-                    if line.strip():
-                        model_name = line.split()[0]
-                        active_models.append(model_name)
+        try:
+            active_models = self.backend.list_running()
 
             # Update model status
             for model in self.models:
@@ -57,34 +64,26 @@ class ModelPool:
                     "loaded" if model in active_models else "unloaded"
                 )
 
+            self.last_status_check = time.time()
             return self.models
 
         except Exception as e:
             print(f"Error checking model status: {e}")
+            self.last_status_check = time.time()
             return self.models
 
     def health_check_model(self, model_name: str) -> Dict:
         """Check health of specific model"""
-        start_time = time.time()
-
         try:
             # Simple health check with timeout
-            result = subprocess.run(
-                ["ollama", "run", model_name, "Hello"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            end_time = time.time()
-            response_time = end_time - start_time
+            result = self.backend.health_check(model_name, timeout=30)
 
             health_data = {
                 "model": model_name,
-                "healthy": result.returncode == 0,
-                "response_time": round(response_time, 2),
+                "healthy": result["healthy"],
+                "response_time": round(result["response_time"], 2),
                 "timestamp": datetime.now().isoformat(),
-                "error": result.stderr if result.returncode != 0 else None,
+                "error": result["error"],
             }
 
             self.health_status[model_name] = health_data
@@ -92,17 +91,6 @@ class ModelPool:
 
             return health_data
 
-        except subprocess.TimeoutExpired:
-            health_data = {
-                "model": model_name,
-                "healthy": False,
-                "response_time": 30.0,
-                "timestamp": datetime.now().isoformat(),
-                "error": "Timeout",
-            }
-            self.health_status[model_name] = health_data
-            return health_data
-
         except Exception as e:
             health_data = {
                 "model": model_name,
@@ -7,14 +7,14 @@ sys.path.append(
 )
 
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from orchestration.core.pool.model_pool import ModelPool
 
 
 class ModelRouter:
-    def __init__(self):
-        self.model_pool = ModelPool()
+    def __init__(self, model_pool: Optional[ModelPool] = None):
+        self.model_pool = model_pool or ModelPool()
         self.routing_rules = {
             "coding": ["codellama:13b", "llama3.1:8b"],
             "fast": ["neural-chat:7b-v3.3-q4_0", "llama3.1:8b"],
@@ -63,11 +63,15 @@ class ModelRouter:
         return "general"
 
     def select_best_model(
-        self, category: str, priority: str = "balanced"
+        self,
+        category: str,
+        priority: str = "balanced",
+        available_models: Optional[List[str]] = None,
     ) -> Optional[str]:
         """Select best available model for category and priority"""
         candidate_models = self.routing_rules.get(category, ["llama3.1:8b"])
-        available_models = self.model_pool.get_available_models()
+        if available_models is None:
+            available_models = self.model_pool.get_available_models()
 
         # Find first available model from candidates
         for model in candidate_models:
@@ -108,6 +112,29 @@ class ModelRouter:
 
         return routing_decision
 
+    def route_batch(self, queries: List[str], priority: str = "balanced") -> List[Dict]:
+        """Route many queries against a single model status snapshot"""
+        available_models = self.model_pool.get_available_models()
+        timestamp = time.time()
+
+        decisions = []
+        for query in queries:
+            category = self.analyze_query(query)
+            decisions.append(
+                {
+                    "query": query,
+                    "category": category,
+                    "selected_model": self.select_best_model(
+                        category, priority, available_models
+                    ),
+                    "priority": priority,
+                    "available_models": available_models,
+                    "timestamp": timestamp,
+                }
+            )
+
+        return decisions
+
 
 if __name__ == "__main__":
     # Test the router
@@ -0,0 +1,66 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+# Generation telemetry fields aggregated per model
+TELEMETRY_FIELDS = [
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+    "time_to_first_token",
+    "tokens_per_second",
+    "prompt_tokens_per_second",
+]
+
+COLD_LOAD_THRESHOLD = 1.0  # seconds of load_duration that count as a cold load
+
+
+class MetricsRegistry:
+    """Per-model rolling windows of token-level generation telemetry"""
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self.samples: Dict[str, Dict[str, Deque[float]]] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, telemetry: Optional[Dict]):
+        """Record one request's telemetry"""
+        if not telemetry:
+            return
+
+        with self._lock:
+            if model not in self.samples:
+                self.samples[model] = {
+                    field: deque(maxlen=self.window) for field in TELEMETRY_FIELDS
+                }
+                self.counters[model] = {"requests": 0, "cold_loads": 0}
+
+            for field in TELEMETRY_FIELDS:
+                if telemetry.get(field) is not None:
+                    self.samples[model][field].append(telemetry[field])
+
+            self.counters[model]["requests"] += 1
+            if (telemetry.get("load_duration") or 0) > COLD_LOAD_THRESHOLD:
+                self.counters[model]["cold_loads"] += 1
+
+    def get_model_stats(self, model: str) -> Dict:
+        """Mean and p90 of each telemetry field for one model"""
+        with self._lock:
+            if model not in self.samples:
+                return {}
+            stats = dict(self.counters[model])
+            for field, values in self.samples[model].items():
+                if not values:
+                    continue
+                ordered = sorted(values)
+                stats[field] = {
+                    "mean": sum(ordered) / len(ordered),
+                    "p90": ordered[min(int(0.9 * len(ordered)), len(ordered) - 1)],
+                }
+            return stats
+
+    def get_stats(self) -> Dict:
+        return {model: self.get_model_stats(model) for model in list(self.samples)}
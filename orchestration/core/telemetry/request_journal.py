@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterator, Optional
+
+from orchestration.config.settings import ORCHESTRATION_CONFIG
+
+# Result fields copied into the journal, in the recorded workload format used by
+# benchmarks/scheduling_benchmark.py plus what replay needs
+JOURNAL_FIELDS = ["arrival", "query", "priority", "category", "tenant", "model"]
+
+
+class RequestJournal:
+    """Completion hook appending one compact NDJSON line per request"""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        backup_count: Optional[int] = None,
+    ):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # RotatingFileHandler serializes writers and handles rollover for us
+        self.handler = RotatingFileHandler(
+            path,
+            maxBytes=(
+                max_bytes
+                if max_bytes is not None
+                else ORCHESTRATION_CONFIG.journal_max_bytes
+            ),
+            backupCount=(
+                backup_count
+                if backup_count is not None
+                else ORCHESTRATION_CONFIG.journal_backups
+            ),
+            encoding="utf-8",
+        )
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger = logging.getLogger(f"request_journal.{os.path.abspath(path)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def record(self, result: Dict):
+        """Journal a finished or rejected request"""
+        entry = {field: result.get(field) for field in JOURNAL_FIELDS}
+        entry["service_time"] = round(result.get("response_time") or 0.0, 3)
+        if result.get("timestamp") and result.get("arrival"):
+            entry["queue_time"] = round(result["timestamp"] - result["arrival"], 3)
+        entry["success"] = bool(result.get("success"))
+        if result.get("rejected"):
+            entry["rejected"] = True
+        if result.get("truncated"):
+            entry["truncated"] = True
+
+        entry = {key: value for key, value in entry.items() if value is not None}
+        self.logger.info(json.dumps(entry, separators=(",", ":")))
+
+    def close(self):
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+
+def read_journal(path: str) -> Iterator[Dict]:
+    """Yield journal entries oldest first, including rotated backups"""
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+
+    for file_path in list(reversed(backups)) + [path]:
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,102 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from orchestration.config.settings import ORCHESTRATION_CONFIG
+
+# Leaf functions of threads blocked rather than using CPU
+IDLE_FUNCTIONS = {
+    "wait",
+    "_wait_for_tstate_lock",
+    "select",
+    "poll",
+    "epoll",
+    "sleep",
+    "accept",
+    "recv_into",
+    "readinto",
+    "_worker",
+}
+
+
+def _is_idle(frame) -> bool:
+    return frame.f_code.co_name in IDLE_FUNCTIONS
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Samples every thread's stack from a background thread at a fixed interval and
+    aggregates them as collapsed stacks (flamegraph.pl / speedscope input)
+    """
+
+    def __init__(self, interval: Optional[float] = None, include_idle: bool = False):
+        self.interval = (
+            interval if interval is not None else ORCHESTRATION_CONFIG.profile_interval
+        )
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.started_at = time.time()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.duration = time.time() - self.started_at
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not self.include_idle and _is_idle(frame):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """One "frame;frame;frame count" line per distinct stack, hottest first"""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.stacks.most_common()
+        )
+
+
+def profile_process(seconds: float, interval: Optional[float] = None) -> str:
+    """Profile the whole process for a fixed time and return collapsed stacks"""
+    with SamplingProfiler(interval) as profiler:
+        time.sleep(seconds)
+    return profiler.collapsed()
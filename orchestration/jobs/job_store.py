@@ -0,0 +1,159 @@
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from typing import Dict, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    callback_url TEXT,
+    callback_status TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, available_at, created_at);
+"""
+
+JSON_COLUMNS = ("request", "result")
+
+
+class JobStore:
+    """Durable SQLite-backed queue of generation jobs"""
+
+    def __init__(self, db_path: str = "./jobs.db"):
+        self.db_path = db_path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _row_to_job(self, row: Optional[sqlite3.Row]) -> Optional[Dict]:
+        if row is None:
+            return None
+        job = dict(row)
+        for column in JSON_COLUMNS:
+            if job[column] is not None:
+                job[column] = json.loads(job[column])
+        return job
+
+    def enqueue(self, request: Dict, callback_url: Optional[str] = None) -> str:
+        """Store a new job and return its id"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, request, callback_url, created_at, "
+                "available_at) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, json.dumps(request), callback_url, now, now),
+            )
+        return job_id
+
+    def claim_next(self) -> Optional[Dict]:
+        """Atomically move the oldest ready job to running and return it"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' AND available_at <= ? "
+                    "ORDER BY created_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (now, row["id"]),
+                )
+                job = conn.execute(
+                    "SELECT * FROM jobs WHERE id = ?", (row["id"],)
+                ).fetchone()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return self._row_to_job(job)
+
+    def complete(self, job_id: str, result: Dict):
+        self._finish(job_id, "completed", result=result)
+
+    def fail(self, job_id: str, error: str, result: Optional[Dict] = None):
+        self._finish(job_id, "failed", result=result, error=error)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict] = None,
+        error: Optional[str] = None,
+    ):
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE id = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def requeue(self, job_id: str, delay: float = 0.0):
+        """Put a running job back in the queue, ready after delay seconds"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', available_at = ? WHERE id = ?",
+                (time.time() + delay, job_id),
+            )
+
+    def requeue_expired(self, lease: float) -> int:
+        """
+        Return running jobs whose lease has expired to the queue; these were
+        left behind by a worker that stopped. Jobs another live worker is still
+        within its lease on are left alone
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', available_at = ? "
+                "WHERE status = 'running' AND started_at <= ?",
+                (now, now - lease),
+            )
+            return cursor.rowcount
+
+    def set_callback_status(self, job_id: str, callback_status: str):
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET callback_status = ? WHERE id = ?",
+                (callback_status, job_id),
+            )
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row)
+
+    def get_stats(self) -> Dict:
+        """Job counts by status"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
@@ -0,0 +1,193 @@
+import ipaddress
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from orchestration.config.settings import JOB_CALLBACK_HOSTS, ORCHESTRATION_CONFIG
+from orchestration.core.backend.generation import GenerationOptions
+from orchestration.core.balancer.admission import AdmissionRejected
+from orchestration.jobs.job_store import JobStore
+
+CALLBACK_TIMEOUT = 10  # seconds allowed for a webhook to accept the result
+LEASE_CHECK_INTERVAL = 30  # seconds between sweeps for expired job leases
+
+
+def validate_callback_url(url: str, allowed_hosts: Optional[List[str]] = None):
+    """
+    Raise ValueError unless url is an http(s) URL the server may call back.
+    With an allowlist the host must be on it; otherwise it must resolve only
+    to public addresses, so callbacks can't reach internal services
+    """
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("callback_url must be an http(s) URL with a host")
+
+    host = parsed.hostname.lower()
+    if allowed_hosts:
+        if host not in {allowed.lower() for allowed in allowed_hosts}:
+            raise ValueError(f"callback host {host} is not allowed")
+        return
+
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parsed.port)}
+    except (socket.gaierror, ValueError) as e:
+        raise ValueError(f"callback host {host} does not resolve: {e}")
+    for address in addresses:
+        if not ipaddress.ip_address(address.split("%")[0]).is_global:
+            raise ValueError(f"callback host {host} resolves to a private address")
+
+
+class _NoRedirects(urllib.request.HTTPRedirectHandler):
+    """Redirects could point a validated callback at an internal address"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_callback_opener = urllib.request.build_opener(_NoRedirects)
+
+
+class JobWorker:
+    """Pulls jobs from the persistent queue and runs them through the orchestrator"""
+
+    def __init__(
+        self,
+        orchestrator,
+        job_store: JobStore,
+        num_workers: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        callback_hosts: Optional[List[str]] = None,
+    ):
+        self.orchestrator = orchestrator
+        self.job_store = job_store
+        self.num_workers = (
+            num_workers if num_workers is not None else ORCHESTRATION_CONFIG.job_workers
+        )
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else ORCHESTRATION_CONFIG.job_poll_interval
+        )
+        self.callback_hosts = (
+            callback_hosts if callback_hosts is not None else JOB_CALLBACK_HOSTS
+        )
+        self.timeout = ORCHESTRATION_CONFIG.job_timeout
+        # A job still running past its own timeout plus grace has lost its worker
+        self.lease = self.timeout + ORCHESTRATION_CONFIG.job_lease_grace
+        self.max_attempts = ORCHESTRATION_CONFIG.job_max_attempts
+        self.threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._next_lease_check = 0.0
+
+    def start(self):
+        """Requeue jobs whose worker died and start the worker threads"""
+        self._requeue_expired()
+
+        self._stop_event.clear()
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+        print(f"📬 Job workers started ({self.num_workers})")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        self._wakeup.set()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+
+    def notify(self):
+        """Wake idle workers after a new job is enqueued"""
+        self._wakeup.set()
+
+    def _requeue_expired(self):
+        """Requeue jobs whose lease expired, at most every LEASE_CHECK_INTERVAL"""
+        now = time.time()
+        if now < self._next_lease_check:
+            return
+        self._next_lease_check = now + LEASE_CHECK_INTERVAL
+        requeued = self.job_store.requeue_expired(self.lease)
+        if requeued:
+            print(f"🔁 Requeued {requeued} jobs with expired leases")
+
+    def _worker_loop(self):
+        while not self._stop_event.is_set():
+            job = self.job_store.claim_next()
+            if job is None:
+                self._requeue_expired()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self.run_job(job)
+
+    def run_job(self, job: Dict):
+        """Run one claimed job to completion and record its outcome"""
+        request = job["request"]
+        generation = request.get("generation")
+
+        try:
+            future = self.orchestrator.process_request(
+                request["query"],
+                request.get("priority", "balanced"),
+                request.get("user_preference"),
+                tenant=request.get("tenant", "default"),
+                generation=GenerationOptions(**generation) if generation else None,
+                deadline=self.timeout,
+                timeout=self.timeout,
+            )
+            result = future.result(timeout=self.timeout)
+        except AdmissionRejected as e:
+            if job["attempts"] >= self.max_attempts:
+                self.job_store.fail(
+                    job["id"], f"Not admitted after {job['attempts']} attempts: {e}"
+                )
+                self._send_callback(job["id"])
+                return
+            # Over the tenant's rate or the queue is full: retry once there is room
+            self.job_store.requeue(job["id"], delay=max(e.retry_after, 1.0))
+            return
+        except Exception as e:
+            self.job_store.fail(job["id"], str(e))
+            self._send_callback(job["id"])
+            return
+
+        if result.get("success"):
+            self.job_store.complete(job["id"], result)
+        else:
+            self.job_store.fail(
+                job["id"], result.get("error") or "Unknown error", result
+            )
+        self._send_callback(job["id"])
+
+    def _send_callback(self, job_id: str):
+        """POST the finished job to its webhook, if one was given"""
+        job = self.job_store.get(job_id)
+        if not job or not job["callback_url"]:
+            return
+
+        request = urllib.request.Request(
+            job["callback_url"],
+            data=json.dumps(job).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            # Checked again here: DNS may have changed since the job was submitted
+            validate_callback_url(job["callback_url"], self.callback_hosts)
+            with _callback_opener.open(request, timeout=CALLBACK_TIMEOUT) as response:
+                callback_status = f"delivered ({response.status})"
+        except Exception as e:
+            print(f"❌ Job callback failed for {job_id}: {e}")
+            callback_status = f"failed ({e})"
+        self.job_store.set_callback_status(job_id, callback_status)
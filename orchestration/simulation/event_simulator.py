@@ -0,0 +1,321 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import argparse
+import heapq
+import itertools
+import json
+import time
+from typing import Dict, List, Optional
+
+from orchestration.config.settings import (
+    ORCHESTRATION_CONFIG,
+    SIMULATED_MEMORY_GB,
+    SimulatedModelProfile,
+    TenantConfig,
+)
+from orchestration.core.backend.generation import (
+    CHARS_PER_TOKEN,
+    resolve_generation_options,
+)
+from orchestration.core.backend.simulated_backend import SimulatedBackend
+from orchestration.core.balancer.load_balancer import RequestTask
+from orchestration.core.balancer.scheduling import SCHEDULING_POLICIES, create_policy
+from orchestration.core.balancer.service_time_predictor import ServiceTimePredictor
+from orchestration.core.balancer.tenancy import TenantManager
+from orchestration.core.balancer.wait_estimator import WaitTimeEstimator
+from orchestration.core.pool.model_pool import ModelPool
+from orchestration.core.router.model_router import ModelRouter
+from orchestration.simulation.workloads import load_workload, synthetic_workload
+
+# Event kinds; completions sort before arrivals at the same instant
+COMPLETION = 0
+ARRIVAL = 1
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _distribution(values: List[float]) -> Dict:
+    return {
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": max(values, default=0.0),
+    }
+
+
+class DiscreteEventSimulator:
+    """
+    Runs the real router, scheduling policy, tenant quotas and service-time
+    predictor on a virtual clock, with service times drawn from the simulated
+    backend's per-model timing profiles and residency model.
+    Rate limits and admission control read the wall clock and are not simulated
+    """
+
+    def __init__(
+        self,
+        slots: Optional[int] = None,
+        scheduling_policy: Optional[str] = None,
+        max_queue_size: Optional[int] = None,
+        profiles: Optional[Dict[str, SimulatedModelProfile]] = None,
+        memory_gb: float = SIMULATED_MEMORY_GB,
+        tenant_configs: Optional[Dict[str, TenantConfig]] = None,
+        seed: int = 0,
+    ):
+        self.slots = slots or ORCHESTRATION_CONFIG.max_concurrent_requests
+        self.max_queue_size = (
+            max_queue_size
+            if max_queue_size is not None
+            else ORCHESTRATION_CONFIG.max_queue_size
+        )
+        self.policy_name = scheduling_policy or ORCHESTRATION_CONFIG.scheduling_policy
+
+        self.backend = SimulatedBackend(
+            profiles=profiles, memory_gb=memory_gb, time_scale=0, seed=seed
+        )
+        # A zero TTL makes every routing decision see the current residency
+        self.router = ModelRouter(ModelPool(status_ttl=0, backend=self.backend))
+        self.tenants = TenantManager(tenant_configs)
+        self.scheduler = create_policy(
+            self.policy_name,
+            aging_rate=ORCHESTRATION_CONFIG.aging_rate,
+            tenant_weights=self.tenants.weight,
+        )
+        self.wait_estimator = WaitTimeEstimator(
+            window=ORCHESTRATION_CONFIG.service_time_window
+        )
+        self.predictor = ServiceTimePredictor(self.wait_estimator)
+
+    def run(self, workload: List[Dict], pin_models: bool = False) -> Dict:
+        """Simulate the workload to completion and report what happened"""
+        wall_start = time.perf_counter()
+        events = []
+        sequence = itertools.count()
+        for record in workload:
+            heapq.heappush(events, (record["arrival"], ARRIVAL, next(sequence), record))
+
+        busy = 0
+        now = workload[0]["arrival"] if workload else 0.0
+        first_arrival = now
+        rejected = 0
+        failed = 0
+        latencies: List[float] = []
+        queue_waits: List[float] = []
+        by_priority: Dict[str, List[float]] = {}
+        by_model: Dict[str, Dict] = {}
+        busy_time = 0.0
+        request_ids = itertools.count(1)
+
+        def dispatch():
+            nonlocal busy
+            while busy < self.slots and len(self.scheduler):
+                task = self.scheduler.pop(now, self.tenants.can_dispatch)
+                if task is None:
+                    break
+                self.tenants.on_dispatch(task)
+                timing = self.backend.sample(task.model, task.query, task.options)
+                duration = (
+                    timing["load_time"] + timing["time_to_first_token"]
+                    if timing["failed"]
+                    else timing["total_duration"]
+                )
+                busy += 1
+                heapq.heappush(
+                    events,
+                    (now + duration, COMPLETION, next(sequence), (task, timing, now)),
+                )
+
+        while events:
+            now, kind, _, payload = heapq.heappop(events)
+
+            if kind == ARRIVAL:
+                record = payload
+                if pin_models and record.get("model"):
+                    model = record["model"]
+                    category = record.get("category") or self.router.analyze_query(
+                        record["query"]
+                    )
+                else:
+                    decision = self.router.route_request(
+                        record["query"], record.get("priority", "balanced")
+                    )
+                    model = decision["selected_model"]
+                    category = decision["category"]
+
+                priority = record.get("priority", "balanced")
+                options = resolve_generation_options(priority, category)
+                task = RequestTask(
+                    request_id=f"sim_{next(request_ids)}",
+                    query=record["query"],
+                    model=model,
+                    priority=priority,
+                    timestamp=now,
+                    category=category,
+                    predicted_service_time=self.predictor.predict(
+                        model, record["query"], category, max_tokens=options.num_predict
+                    ),
+                    tenant=record.get("tenant", "default"),
+                    options=options,
+                )
+
+                if busy >= self.slots and len(self.scheduler) >= self.max_queue_size:
+                    rejected += 1
+                    continue
+                self.scheduler.push(task, now)
+
+            else:
+                task, timing, dispatched = payload
+                busy -= 1
+                duration = now - dispatched
+                success = not timing["failed"]
+                self.tenants.on_complete(task, duration, success)
+                busy_time += duration
+
+                stats = by_model.setdefault(
+                    task.model, {"requests": 0, "busy_time": 0.0, "latencies": []}
+                )
+                stats["requests"] += 1
+                stats["busy_time"] += duration
+
+                if success:
+                    self.wait_estimator.record(task.model, duration)
+                    self.predictor.observe(
+                        task.model,
+                        task.query,
+                        task.category,
+                        "x" * (timing["eval_count"] * CHARS_PER_TOKEN),
+                        duration,
+                    )
+                    latency = now - task.timestamp
+                    latencies.append(latency)
+                    queue_waits.append(dispatched - task.timestamp)
+                    by_priority.setdefault(task.priority, []).append(latency)
+                    stats["latencies"].append(latency)
+                else:
+                    failed += 1
+
+            dispatch()
+
+        makespan = max(now - first_arrival, 1e-9)
+        wall_time = time.perf_counter() - wall_start
+        backend_stats = self.backend.get_stats()
+
+        return {
+            "policy": self.policy_name,
+            "slots": self.slots,
+            "requests": len(workload),
+            "completed": len(latencies),
+            "failed": failed,
+            "rejected": rejected,
+            "makespan": makespan,
+            "wall_time": wall_time,
+            "speedup": makespan / wall_time if wall_time else None,
+            "throughput": len(latencies) / makespan,
+            "utilization": busy_time / (self.slots * makespan),
+            "latency": _distribution(latencies),
+            "queue_wait": _distribution(queue_waits),
+            "by_priority": {
+                priority: {
+                    "p50": percentile(values, 0.5),
+                    "p99": percentile(values, 0.99),
+                }
+                for priority, values in sorted(by_priority.items())
+            },
+            "by_model": {
+                model: {
+                    "requests": stats["requests"],
+                    "utilization": stats["busy_time"] / (self.slots * makespan),
+                    "p50": percentile(stats["latencies"], 0.5),
+                    "p99": percentile(stats["latencies"], 0.99),
+                }
+                for model, stats in sorted(by_model.items())
+            },
+            "residency": {
+                "loads": backend_stats["loads"],
+                "evictions": backend_stats["evictions"],
+                "loads_per_100_requests": 100 * backend_stats["loads"] / len(workload)
+                if workload
+                else 0.0,
+                "resident_models": backend_stats["resident_models"],
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate routing and scheduling policies on a virtual clock"
+    )
+    parser.add_argument("--workload", help="Recorded workload or request journal")
+    parser.add_argument("--synthetic", type=int, default=2000, help="Request count")
+    parser.add_argument("--rate", type=float, default=0.5, help="Arrivals per second")
+    parser.add_argument(
+        "--tenants",
+        default="default=0.5,dashboard=0.3,batch=0.2",
+        help="Synthetic tenant mix",
+    )
+    parser.add_argument("--policies", default=",".join(SCHEDULING_POLICIES))
+    parser.add_argument("--slots", default="3", help="Slot counts to sweep, e.g. 2,3,4")
+    parser.add_argument("--memory-gb", type=float, default=SIMULATED_MEMORY_GB)
+    parser.add_argument("--max-queue", type=int)
+    parser.add_argument("--pin-models", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    workload = (
+        load_workload(args.workload)
+        if args.workload
+        else synthetic_workload(
+            args.synthetic,
+            args.rate,
+            tenants={
+                name: float(weight)
+                for name, _, weight in (
+                    item.partition("=") for item in args.tenants.split(",")
+                )
+            },
+            seed=args.seed,
+        )
+    )
+
+    results = []
+    for slots in [int(value) for value in args.slots.split(",")]:
+        for policy in args.policies.split(","):
+            simulator = DiscreteEventSimulator(
+                slots=slots,
+                scheduling_policy=policy,
+                max_queue_size=args.max_queue,
+                memory_gb=args.memory_gb,
+                seed=args.seed,
+            )
+            results.append(simulator.run(workload, pin_models=args.pin_models))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Workload: {len(workload)} requests")
+    print(
+        f"{'policy':<15}{'slots':>6}{'p50':>9}{'p99':>9}{'util':>7}"
+        f"{'loads':>7}{'shed':>6}{'speedup':>10}"
+    )
+    for result in results:
+        print(
+            f"{result['policy']:<15}{result['slots']:>6}"
+            f"{result['latency']['p50']:>8.1f}s{result['latency']['p99']:>8.1f}s"
+            f"{result['utilization']:>7.0%}{result['residency']['loads']:>7}"
+            f"{result['rejected']:>6}{result['speedup']:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
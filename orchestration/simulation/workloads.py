@@ -0,0 +1,68 @@
+import random
+from typing import Dict, List, Optional
+
+# Sample queries per routing category, shared with benchmarks/load_generator.py
+QUERY_MIX = {
+    "fast": ["Hi", "What time is it in Tokyo?", "Thanks!", "Good morning"],
+    "general": [
+        "Summarize the benefits of remote work",
+        "What is a good name for a bakery?",
+    ],
+    "coding": [
+        "Write a Python function to merge two sorted lists",
+        "Debug this script: for i in range(10) print(i)",
+    ],
+    "analysis": [
+        "Analyze the trade-offs between SQL and NoSQL databases",
+        "Compare the economic impact of solar and wind power",
+    ],
+    "reasoning": [
+        "Explain step by step why the sum of two odd numbers is even",
+    ],
+}
+
+DEFAULT_CATEGORY_MIX = {"fast": 0.4, "general": 0.3, "coding": 0.2, "analysis": 0.1}
+DEFAULT_PRIORITY_MIX = {"speed": 0.3, "balanced": 0.5, "background": 0.2}
+
+
+def synthetic_workload(
+    requests: int,
+    rate: float,
+    category_mix: Optional[Dict[str, float]] = None,
+    priority_mix: Optional[Dict[str, float]] = None,
+    tenants: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+) -> List[Dict]:
+    """Poisson arrivals at rate per second with queries drawn from the mixes"""
+    rng = random.Random(seed)
+    category_mix = category_mix or DEFAULT_CATEGORY_MIX
+    priority_mix = priority_mix or DEFAULT_PRIORITY_MIX
+    tenants = tenants or {"default": 1.0}
+
+    workload = []
+    arrival = 0.0
+    for _ in range(requests):
+        arrival += rng.expovariate(rate)
+        category = rng.choices(list(category_mix), list(category_mix.values()))[0]
+        workload.append(
+            {
+                "arrival": arrival,
+                "query": rng.choice(QUERY_MIX[category]),
+                "priority": rng.choices(
+                    list(priority_mix), list(priority_mix.values())
+                )[0],
+                "tenant": rng.choices(list(tenants), list(tenants.values()))[0],
+            }
+        )
+    return workload
+
+
+def load_workload(path: str) -> List[Dict]:
+    """
+    Load a recorded workload or request journal (including rotated backups),
+    sorted by arrival
+    """
+    # Imported here so this module stays importable before settings are loaded
+    from orchestration.core.telemetry.request_journal import read_journal
+
+    return sorted(read_journal(path), key=lambda record: record["arrival"])
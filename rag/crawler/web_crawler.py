@@ -11,6 +11,7 @@ from typing import Dict, List, Optional
 import requests
 from bs4 import BeautifulSoup
 
+from rag.ingestion.chunker import chunk_spans
 from rag.ingestion.document_processor import DocumentProcessor
 
 # Add project root to path
@@ -119,30 +120,36 @@ class WebCrawler:
             # Create document chunks from crawled content
             content_with_title = f"Title: {data['title']}\n\nContent: {data['content']}"
 
-            # Use document processor to chunk the content
-            chunks = self.document_processor.chunk_text(content_with_title)
+            # Chunk boundaries as offsets into the page text
+            spans = chunk_spans(content_with_title)
 
-            for i, chunk in enumerate(chunks):
+            for i, (start, end) in enumerate(spans):
                 doc_data = {
-                    "content": chunk,
+                    "content": content_with_title[start:end],
                     "metadata": {
                         "source": data["url"],
                         "title": data["title"],
                         "chunk_id": i,
                         "scraped_at": data["scraped_at"],
                         "content_type": "web_crawled",
-                        "total_chunks": len(chunks),
+                        "total_chunks": len(spans),
+                        "start": start,
+                        "end": end,
                     },
                 }
                 documents.append(doc_data)
 
         # Ingest into ChromaDB
-        success = self.document_processor.ingest_documents(documents)
+        processor = self.document_processor
+        skipped_before = processor.near_duplicates_skipped
+        success = processor.ingest_documents(documents)
 
         return {
             "success": success,
             "urls_processed": len(crawled_data),
             "documents_created": len(documents),
+            "near_duplicates_skipped": processor.near_duplicates_skipped
+            - skipped_before,
             "sources": [data["url"] for data in crawled_data],
         }
 
@@ -0,0 +1,220 @@
+import os
+import re
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# MiniLM truncates at 256 word pieces including [CLS] and [SEP]; the default
+# leaves headroom for words the estimate below counts as one piece
+CHUNK_TOKENS = int(os.getenv("RAG_CHUNK_TOKENS", "200"))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("RAG_CHUNK_OVERLAP_TOKENS", "20"))
+# Hugging Face tokenizer used to count tokens, e.g.
+# sentence-transformers/all-MiniLM-L6-v2; empty uses the word/punctuation estimate
+CHUNK_TOKENIZER = os.getenv("RAG_CHUNK_TOKENIZER", "")
+
+# Character cap per budgeted token. Runs without spaces or punctuation (base64,
+# minified code, long URLs) estimate as a single token, so chunks are also cut
+# at max_tokens * MAX_CHARS_PER_TOKEN characters
+MAX_CHARS_PER_TOKEN = 8
+
+PARAGRAPH_PATTERN = re.compile(r"\n[ \t]*\n\s*")
+# Whitespace following a sentence-ending mark
+SENTENCE_PATTERN = re.compile(r"[.!?]\s+")
+WORD_PATTERN = re.compile(r"\S+")
+
+Span = Tuple[int, int]
+TokenCounter = Callable[[str, int, int], int]
+
+
+def estimate_tokens(text: str, start: int, end: int) -> int:
+    """
+    Approximate word pieces in text[start:end] as words plus periods and commas,
+    counted in place without slicing
+    """
+    return (
+        text.count(" ", start, end)
+        + text.count("\n", start, end)
+        + text.count(".", start, end)
+        + text.count(",", start, end)
+        + 1
+    )
+
+
+_token_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """The tokenizer named by CHUNK_TOKENIZER, loaded once per process"""
+    global _token_counter
+    if _token_counter is None:
+        if CHUNK_TOKENIZER:
+            from transformers import AutoTokenizer
+
+            tokenizer = AutoTokenizer.from_pretrained(CHUNK_TOKENIZER)
+
+            def count(text: str, start: int, end: int) -> int:
+                return len(tokenizer.encode(text[start:end], add_special_tokens=False))
+
+            _token_counter = count
+        else:
+            _token_counter = estimate_tokens
+    return _token_counter
+
+
+def _trimmed(text: str, start: int, end: int) -> Optional[Span]:
+    first_word = WORD_PATTERN.search(text, start, end)
+    if first_word is None:
+        return None
+    start = first_word.start()
+    while text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _pieces(
+    text: str, start: int, end: int, pattern: re.Pattern, keep: int
+) -> Iterator[Span]:
+    """Trimmed spans between matches of pattern; keep chars of each match stay left"""
+    position = start
+    for match in pattern.finditer(text, start, end):
+        span = _trimmed(text, position, match.start() + keep)
+        if span:
+            yield span
+        position = match.end()
+    span = _trimmed(text, position, end)
+    if span:
+        yield span
+
+
+def _hard_split(
+    text: str, start: int, end: int, max_tokens: int, count_tokens: TokenCounter
+) -> Iterator[Tuple[int, int, int]]:
+    """Fixed character windows for a piece no boundary could break small enough"""
+    max_chars = max_tokens * MAX_CHARS_PER_TOKEN
+    while start < end:
+        window = min(max_chars, end - start)
+        tokens = count_tokens(text, start, start + window)
+        # Dense text (a real tokenizer on CJK, say) needs narrower windows
+        while tokens > max_tokens and window > 1:
+            window //= 2
+            tokens = count_tokens(text, start, start + window)
+        yield start, start + window, tokens
+        start += window
+
+
+def _units(
+    text: str, max_tokens: int, count_tokens: TokenCounter
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    (start, end, tokens) of the largest pieces that fit in a chunk: whole
+    paragraphs where possible, else sentences, else runs of words, else fixed
+    character windows
+    """
+    max_chars = max_tokens * MAX_CHARS_PER_TOKEN
+
+    def fits(start: int, end: int, tokens: int) -> bool:
+        return tokens <= max_tokens and end - start <= max_chars
+
+    for start, end in _pieces(text, 0, len(text), PARAGRAPH_PATTERN, 0):
+        tokens = count_tokens(text, start, end)
+        if fits(start, end, tokens):
+            yield start, end, tokens
+            continue
+        for sentence_start, sentence_end in _pieces(
+            text, start, end, SENTENCE_PATTERN, 1
+        ):
+            tokens = count_tokens(text, sentence_start, sentence_end)
+            if fits(sentence_start, sentence_end, tokens):
+                yield sentence_start, sentence_end, tokens
+                continue
+            words = [
+                match.span()
+                for match in WORD_PATTERN.finditer(text, sentence_start, sentence_end)
+            ]
+            length = sentence_end - sentence_start
+            per_piece = max(
+                1, len(words) * min(max_tokens / tokens, max_chars / length)
+            )
+            per_piece = int(per_piece)
+            for i in range(0, len(words), per_piece):
+                piece_start = words[i][0]
+                piece_end = words[min(i + per_piece, len(words)) - 1][1]
+                tokens = count_tokens(text, piece_start, piece_end)
+                if fits(piece_start, piece_end, tokens):
+                    yield piece_start, piece_end, tokens
+                else:
+                    yield from _hard_split(
+                        text, piece_start, piece_end, max_tokens, count_tokens
+                    )
+
+
+def _overlap_start(
+    text: str, start: int, end: int, budget: int, count_tokens: TokenCounter
+) -> Optional[Span]:
+    """(offset, tokens) of the earliest sentence start whose tail fits in budget"""
+    # Only the last few characters per token can be part of the overlap
+    window_start = max(start, end - budget * MAX_CHARS_PER_TOKEN)
+    for match in SENTENCE_PATTERN.finditer(text, window_start, end):
+        tokens = count_tokens(text, match.end(), end)
+        if tokens <= budget:
+            return match.end(), tokens
+    return None
+
+
+def chunk_spans(
+    text: str,
+    max_tokens: int = CHUNK_TOKENS,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS,
+    count_tokens: Optional[TokenCounter] = None,
+) -> List[Span]:
+    """
+    (start, end) character offsets of chunks of at most max_tokens (and
+    max_tokens * MAX_CHARS_PER_TOKEN characters), cut at paragraph or sentence
+    boundaries, each starting with up to overlap_tokens of trailing sentences
+    from the previous chunk. The text is never copied
+    """
+    count_tokens = count_tokens or get_token_counter()
+    max_chars = max_tokens * MAX_CHARS_PER_TOKEN
+    spans = []
+    chunk_start = chunk_end = None
+    total = 0
+
+    for start, end, tokens in _units(text, max_tokens, count_tokens):
+        if (
+            chunk_start is not None
+            and total + tokens <= max_tokens
+            and end - chunk_start <= max_chars
+        ):
+            # Recounted whole: the separators between units cost tokens too
+            combined = count_tokens(text, chunk_start, end)
+            if combined <= max_tokens:
+                chunk_end, total = end, combined
+                continue
+
+        if chunk_start is not None:
+            spans.append((chunk_start, chunk_end))
+            overlap = _overlap_start(
+                text,
+                chunk_start,
+                chunk_end,
+                min(overlap_tokens, max_tokens - tokens),
+                count_tokens,
+            )
+            if overlap is not None and end - overlap[0] <= max_chars:
+                combined = count_tokens(text, overlap[0], end)
+                if combined <= max_tokens:
+                    chunk_start, chunk_end, total = overlap[0], end, combined
+                    continue
+
+        chunk_start, chunk_end, total = start, end, tokens
+
+    if chunk_start is not None:
+        spans.append((chunk_start, chunk_end))
+    return spans
+
+
+def chunk_text(
+    text: str,
+    chunk_size: int = CHUNK_TOKENS,
+    overlap: int = CHUNK_OVERLAP_TOKENS,
+) -> List[str]:
+    """Split text into overlapping chunks of at most chunk_size tokens"""
+    return [text[start:end] for start, end in chunk_spans(text, chunk_size, overlap)]
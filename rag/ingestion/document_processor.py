@@ -4,53 +4,52 @@ import sys
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from typing import Dict, List
-
-from rag.vector_store.chroma_manager import ChromaManager
+from typing import Dict, List, Optional
+
+from rag.ingestion.chunker import (
+    CHUNK_OVERLAP_TOKENS,
+    CHUNK_TOKENS,
+    chunk_spans,
+    chunk_text,
+)
+from rag.ingestion.file_reader import iter_file_documents, read_file_documents
+from rag.ingestion.near_duplicates import NearDuplicateIndex, get_near_duplicate_index
+from rag.ingestion.pipeline import (
+    ENCODE_BATCH_SIZE,
+    INGEST_WORKERS,
+    WRITE_BATCH_SIZE,
+    IngestionPipeline,
+    iter_files,
+)
+from rag.vector_store.chroma_manager import ChromaManager, get_chroma_manager
+from rag.vector_store.document_ids import document_id
 
 # Add project root to path for imports
 
 
 class DocumentProcessor:
-    def __init__(self, chroma_manager: ChromaManager = None):
-        self.chroma_manager = chroma_manager or ChromaManager()
+    def __init__(
+        self,
+        chroma_manager: ChromaManager = None,
+        dedup_index: Optional[NearDuplicateIndex] = None,
+    ):
+        self.chroma_manager = chroma_manager or get_chroma_manager()
+        self.dedup_index = dedup_index or get_near_duplicate_index()
+        self.near_duplicates_skipped = 0
 
     def chunk_text(
-        self, text: str, chunk_size: int = 500, overlap: int = 50
+        self,
+        text: str,
+        chunk_size: int = CHUNK_TOKENS,
+        overlap: int = CHUNK_OVERLAP_TOKENS,
     ) -> List[str]:
-        """Split text into overlapping chunks"""
-        words = text.split()
-        chunks = []
-
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk = " ".join(words[i : i + chunk_size])
-            if chunk.strip():
-                chunks.append(chunk.strip())
-
-        return chunks
+        """Split text into overlapping chunks of at most chunk_size tokens"""
+        return chunk_text(text, chunk_size, overlap)
 
     def process_text_file(self, file_path: str) -> List[Dict]:
         """Process a single text file"""
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-
-            chunks = self.chunk_text(content)
-
-            documents = []
-            for i, chunk in enumerate(chunks):
-                doc_data = {
-                    "content": chunk,
-                    "metadata": {
-                        "source": file_path,
-                        "chunk_id": i,
-                        "total_chunks": len(chunks),
-                        "file_name": os.path.basename(file_path),
-                    },
-                }
-                documents.append(doc_data)
-
-            return documents
+            return read_file_documents(file_path)
 
         except Exception as e:
             print(f"Error processing {file_path}: {e}")
@@ -62,50 +61,118 @@ class DocumentProcessor:
         """Process all files in a directory"""
         all_documents = []
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if any(file.endswith(ext) for ext in file_extensions):
-                    file_path = os.path.join(root, file)
-                    docs = self.process_text_file(file_path)
-                    all_documents.extend(docs)
+        for file_path in iter_files(directory, file_extensions):
+            all_documents.extend(self.process_text_file(file_path))
 
         return all_documents
 
+    def drop_near_duplicates(self, documents: List[Dict], ids: List[str]):
+        """
+        Documents, ids and MinHash signatures without chunks that nearly repeat
+        one already ingested from another source (or an earlier one in the
+        batch), checked before anything is embedded. Signatures are None when
+        there is no index
+        """
+        if self.dedup_index is None or not documents:
+            return documents, ids, None
+
+        signatures = self.dedup_index.signatures([doc["content"] for doc in documents])
+        duplicates = self.dedup_index.check_many(
+            ids, signatures, [doc["metadata"].get("source", "") for doc in documents]
+        )
+        kept = [i for i, duplicate_of in enumerate(duplicates) if duplicate_of is None]
+        skipped = len(documents) - len(kept)
+        if skipped:
+            self.near_duplicates_skipped += skipped
+            print(f"♻️ Skipped {skipped} near-duplicate chunks")
+        return (
+            [documents[i] for i in kept],
+            [ids[i] for i in kept],
+            [signatures[i] for i in kept],
+        )
+
+    def get_dedup_stats(self) -> Dict:
+        """Near-duplicate filter counters, or disabled when there is no index"""
+        if self.dedup_index is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "skipped": self.near_duplicates_skipped,
+            **self.dedup_index.get_stats(),
+        }
+
     def ingest_documents(self, documents: List[Dict]) -> bool:
-        """Ingest processed documents into ChromaDB"""
+        """Ingest processed documents into ChromaDB, minus near duplicates"""
         try:
-            contents = [doc["content"] for doc in documents]
-            metadatas = [doc["metadata"] for doc in documents]
             ids = [
-                f"{doc['metadata']['source']}_{doc['metadata']['chunk_id']}"
+                document_id(
+                    doc["metadata"]["source"],
+                    doc["metadata"]["chunk_id"],
+                    doc["content"],
+                )
                 for doc in documents
             ]
+            documents, ids, signatures = self.drop_near_duplicates(documents, ids)
+            if not documents:
+                return True
 
-            # Clean IDs to avoid ChromaDB issues
-            ids = [id.replace("/", "_").replace("\\", "_") for id in ids]
-
+            contents = [doc["content"] for doc in documents]
+            metadatas = [doc["metadata"] for doc in documents]
             self.chroma_manager.add_documents(contents, metadatas, ids)
+            # Indexed only once stored, so a failed write doesn't mark them seen
+            if signatures is not None:
+                self.dedup_index.add_many(
+                    ids,
+                    signatures,
+                    [metadata.get("source", "") for metadata in metadatas],
+                )
             return True
 
         except Exception as e:
             print(f"Error ingesting documents: {e}")
             return False
 
-    def ingest_from_directory(self, directory: str) -> Dict:
-        """Complete pipeline: process directory and ingest to ChromaDB"""
+    def ingest_from_directory(
+        self,
+        directory: str,
+        file_extensions: List[str] = [".txt", ".md"],
+        checkpoint_path: Optional[str] = None,
+        encode_batch_size: int = ENCODE_BATCH_SIZE,
+        write_batch_size: int = WRITE_BATCH_SIZE,
+        workers: int = INGEST_WORKERS,
+    ) -> Dict:
+        """
+        Complete pipeline: stream files from directory into ChromaDB in batches,
+        minus near duplicates. With a checkpoint_path, files finished by an
+        earlier run are skipped
+        """
         print(f"Processing documents from: {directory}")
 
-        documents = self.process_directory(directory)
+        pipeline = IngestionPipeline(
+            self.chroma_manager,
+            iter_file_documents,
+            encode_batch_size=encode_batch_size,
+            write_batch_size=write_batch_size,
+            checkpoint_path=checkpoint_path,
+            workers=workers,
+            dedup_index=self.dedup_index,
+        )
+        try:
+            progress = pipeline.run(iter_files(directory, file_extensions))
+        except Exception as e:
+            print(f"Error ingesting documents: {e}")
+            return {"success": False, "message": str(e), **pipeline.progress}
+        finally:
+            self.near_duplicates_skipped += pipeline.progress["chunks_near_duplicate"]
 
-        if not documents:
+        if not progress["chunks_read"] and not progress["files_skipped"]:
             return {"success": False, "message": "No documents found to process"}
 
-        success = self.ingest_documents(documents)
-
         return {
-            "success": success,
-            "documents_processed": len(documents),
-            "files_processed": len(set(doc["metadata"]["source"] for doc in documents)),
+            "success": True,
+            "documents_processed": progress["chunks_read"],
+            "files_processed": progress["files_done"],
+            **progress,
         }
 
     def ingest_crawled_data(self, crawled_data: List[Dict]) -> Dict:
@@ -122,20 +189,22 @@ class DocumentProcessor:
             )
 
             # Create document chunks
-            chunks = self.chunk_text(content)
+            spans = chunk_spans(content)
 
-            for i, chunk in enumerate(chunks):
+            for i, (start, end) in enumerate(spans):
                 # Convert tags list to string for ChromaDB compatibility
                 tags = item.get("tags", [])
                 tags_str = ", ".join(tags) if isinstance(tags, list) else str(tags)
 
                 doc_data = {
-                    "content": chunk,
+                    "content": content[start:end],
                     "metadata": {
                         "source": item.get("url", ""),
                         "title": item.get("title", ""),
                         "chunk_id": i,
-                        "total_chunks": len(chunks),
+                        "total_chunks": len(spans),
+                        "start": start,
+                        "end": end,
                         "source_type": item.get("source", "unknown"),
                         "scraped_at": item.get("scraped_at", ""),
                         "tags": tags_str,  # Convert list to string
@@ -145,12 +214,14 @@ class DocumentProcessor:
                 documents.append(doc_data)
 
         # Use existing ingest_documents method
+        skipped_before = self.near_duplicates_skipped
         success = self.ingest_documents(documents)
 
         return {
             "success": success,
             "items_processed": len(crawled_data),
             "documents_created": len(documents),
+            "near_duplicates_skipped": self.near_duplicates_skipped - skipped_before,
             "sources": [item.get("source", "unknown") for item in crawled_data],
         }
 
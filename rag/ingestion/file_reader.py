@@ -0,0 +1,146 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import codecs
+from typing import Dict, Iterator, List, Optional
+
+from rag.ingestion.chunker import CHUNK_OVERLAP_TOKENS, CHUNK_TOKENS, chunk_spans
+
+# Files above this size are chunked block by block instead of read whole
+STREAM_THRESHOLD_BYTES = int(os.getenv("RAG_STREAM_THRESHOLD_MB", "8")) * 1024 * 1024
+# Characters decoded per read while streaming
+BLOCK_CHARS = 1024 * 1024
+SNIFF_BYTES = 64 * 1024
+
+BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+# Control bytes that don't occur in text files (tab, newlines, form feed and
+# escape excluded)
+BINARY_BYTES = bytes(set(range(32)) - {8, 9, 10, 12, 13, 27})
+
+
+def detect_encoding(file_path: str) -> Optional[str]:
+    """Encoding to decode file_path with, or None if it looks binary"""
+    with open(file_path, "rb") as file:
+        sample = file.read(SNIFF_BYTES)
+
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if not sample:
+        return "utf-8"
+    control_bytes = len(sample) - len(sample.translate(None, BINARY_BYTES))
+    if b"\0" in sample or control_bytes > len(sample) * 0.05:
+        return None
+
+    try:
+        # Incremental so a multi-byte character cut at the sample end is fine
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    # The usual source of non-UTF-8 text; statistical detectors are unreliable
+    # on short samples, and the few undefined bytes decode as replacements
+    return "cp1252"
+
+
+def _document(
+    file_path: str, content: str, chunk_id: int, start: int, end: int, **extra
+) -> Dict:
+    return {
+        "content": content,
+        "metadata": {
+            "source": file_path,
+            "chunk_id": chunk_id,
+            "file_name": os.path.basename(file_path),
+            "start": start,
+            "end": end,
+            **extra,
+        },
+    }
+
+
+def _stream_chunks(
+    file, file_path: str, chunk_size: int, overlap: int, encoding: str
+) -> Iterator[Dict]:
+    """
+    Chunk a file block by block. The last chunk of each block may be cut short,
+    so it is carried into the next block and chunked again from its start
+    """
+    buffer = ""
+    buffer_offset = 0
+    chunk_id = 0
+    at_end = False
+    while not at_end:
+        block = file.read(BLOCK_CHARS)
+        at_end = not block
+        buffer += block
+        spans = chunk_spans(buffer, chunk_size, overlap)
+        # Keep the tail unless the file is done (or it has no breaks at all)
+        if not at_end and len(spans) > 1:
+            spans, carry_from = spans[:-1], spans[-1][0]
+        elif not at_end and len(buffer) < 4 * BLOCK_CHARS:
+            continue
+        else:
+            carry_from = len(buffer)
+
+        for start, end in spans:
+            yield _document(
+                file_path,
+                buffer[start:end],
+                chunk_id,
+                buffer_offset + start,
+                buffer_offset + end,
+                encoding=encoding,
+            )
+            chunk_id += 1
+        buffer = buffer[carry_from:]
+        buffer_offset += carry_from
+
+
+def iter_file_documents(
+    file_path: str, chunk_size: int = CHUNK_TOKENS, overlap: int = CHUNK_OVERLAP_TOKENS
+) -> Iterator[Dict]:
+    """
+    Lazily read and chunk one text file into documents, skipping binary files.
+    Large files are streamed so memory is bounded by the block size, and their
+    documents have no total_chunks since it isn't known until the end.
+    Module level (and free of any vector-store state) so process pools can run it
+    """
+    encoding = detect_encoding(file_path)
+    if encoding is None:
+        print(f"Skipping binary file {file_path}")
+        return
+
+    # Offsets are into the decoded text, with newlines normalized to \n
+    with open(file_path, "r", encoding=encoding, errors="replace") as file:
+        if os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES:
+            yield from _stream_chunks(file, file_path, chunk_size, overlap, encoding)
+            return
+        content = file.read()
+
+    spans = chunk_spans(content, chunk_size, overlap)
+    for i, (start, end) in enumerate(spans):
+        yield _document(
+            file_path,
+            content[start:end],
+            i,
+            start,
+            end,
+            total_chunks=len(spans),
+            encoding=encoding,
+        )
+
+
+def read_file_documents(
+    file_path: str, chunk_size: int = CHUNK_TOKENS, overlap: int = CHUNK_OVERLAP_TOKENS
+) -> List[Dict]:
+    """Read and chunk one text file into a list of documents"""
+    return list(iter_file_documents(file_path, chunk_size, overlap))
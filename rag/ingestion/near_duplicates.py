@@ -0,0 +1,245 @@
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from contextlib import closing
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Persistent near-duplicate index of ingested chunks; set to "" to disable
+DEDUP_INDEX_PATH = os.getenv("RAG_DEDUP_INDEX", "./dedup_index.db")
+# Estimated Jaccard similarity of word shingles at which a chunk is dropped
+DEDUP_THRESHOLD = float(os.getenv("RAG_DEDUP_THRESHOLD", "0.8"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    doc_id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL,
+    source TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket BLOB NOT NULL,
+    doc_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+"""
+
+WORD_PATTERN = re.compile(r"\w+")
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text: str, size: int = 5) -> List[str]:
+    """Overlapping runs of size lowercased words, or the whole text if shorter"""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return [" ".join(words)]
+    return [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+
+
+class MinHasher:
+    """MinHash signatures from seeded universal hash permutations of CRC32 shingles"""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = np.array(
+            [zlib.crc32(shingle.encode("utf-8")) for shingle in set(shingles(text))],
+            dtype=np.uint64,
+        )
+        # (num_perm, shingles) in one shot; uint64 overflow wraps on purpose
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % MERSENNE_PRIME
+        return (permuted & MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash-LSH index over stored chunks. A chunk is a near duplicate
+    when its estimated Jaccard similarity to an indexed chunk reaches threshold.
+    Chunks from the chunk's own source are not matches, so an edited page that
+    is ingested again gets its new chunks stored
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEDUP_INDEX_PATH,
+        threshold: float = DEDUP_THRESHOLD,
+        num_perm: int = 128,
+        bands: int = 16,
+    ):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.checked = 0
+        self.duplicates = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        # The file is only created once something is checked or added
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def _add(
+        self,
+        conn: sqlite3.Connection,
+        doc_id: str,
+        signature: np.ndarray,
+        source: str,
+    ) -> None:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO signatures (doc_id, signature, source) "
+            "VALUES (?, ?, ?)",
+            (doc_id, signature.tobytes(), source),
+        )
+        if cursor.rowcount:
+            conn.executemany(
+                "INSERT INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                [
+                    (band, key, doc_id)
+                    for band, key in enumerate(self._band_keys(signature))
+                ],
+            )
+
+    def _find(
+        self,
+        conn: sqlite3.Connection,
+        doc_id: str,
+        signature: np.ndarray,
+        source: str,
+    ) -> Optional[str]:
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            rows = conn.execute(
+                "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?",
+                (band, key),
+            )
+            candidates.update(row[0] for row in rows)
+        candidates.discard(doc_id)
+
+        for candidate in candidates:
+            other_signature, other_source = conn.execute(
+                "SELECT signature, source FROM signatures WHERE doc_id = ?",
+                (candidate,),
+            ).fetchone()
+            if source and other_source == source:
+                continue
+            other = np.frombuffer(other_signature, dtype=np.uint32)
+            if np.mean(other == signature) >= self.threshold:
+                return candidate
+        return None
+
+    def signatures(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """MinHash signatures to pass to check_many and add_many"""
+        return [self.hasher.signature(text) for text in texts]
+
+    def check_many(
+        self,
+        doc_ids: Sequence[str],
+        signatures: Sequence[np.ndarray],
+        sources: Optional[Sequence[str]] = None,
+    ) -> List[Optional[str]]:
+        """
+        For each chunk, the id of an indexed near duplicate from another source
+        or of an earlier non-duplicate in the same batch, else None. Nothing is
+        indexed; call add_many once the kept chunks are stored
+        """
+        sources = sources or [""] * len(doc_ids)
+        results = []
+        # The batch's own kept chunks, banded like the persistent index
+        batch_buckets: Dict[Tuple[int, bytes], List[Tuple[str, np.ndarray]]] = {}
+        with closing(self._connect()) as conn:
+            for doc_id, signature, source in zip(doc_ids, signatures, sources):
+                band_keys = self._band_keys(signature)
+                duplicate_of = self._find(conn, doc_id, signature, source)
+                if duplicate_of is None:
+                    for band, key in enumerate(band_keys):
+                        for other_id, other in batch_buckets.get((band, key), []):
+                            if other_id != doc_id and (
+                                np.mean(other == signature) >= self.threshold
+                            ):
+                                duplicate_of = other_id
+                                break
+                        if duplicate_of is not None:
+                            break
+                if duplicate_of is None:
+                    for band, key in enumerate(band_keys):
+                        batch_buckets.setdefault((band, key), []).append(
+                            (doc_id, signature)
+                        )
+                results.append(duplicate_of)
+
+        with self._lock:
+            self.checked += len(results)
+            self.duplicates += sum(result is not None for result in results)
+        return results
+
+    def add_many(
+        self,
+        doc_ids: Sequence[str],
+        signatures: Sequence[np.ndarray],
+        sources: Optional[Sequence[str]] = None,
+    ):
+        """Index stored chunks in one transaction; known ids are left as they are"""
+        sources = sources or [""] * len(doc_ids)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for doc_id, signature, source in zip(doc_ids, signatures, sources):
+                    self._add(conn, doc_id, signature, source)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def check_and_add(self, doc_id: str, text: str, source: str = "") -> Optional[str]:
+        """Id of an indexed near duplicate of text, or None after indexing it"""
+        signatures = self.signatures([text])
+        duplicate_of = self.check_many([doc_id], signatures, [source])[0]
+        if duplicate_of is None:
+            self.add_many([doc_id], signatures, [source])
+        return duplicate_of
+
+    def get_stats(self) -> Dict:
+        with closing(self._connect()) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        return {
+            "path": self.db_path,
+            "threshold": self.threshold,
+            "entries": entries,
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "duplicate_rate": self.duplicates / self.checked if self.checked else 0.0,
+        }
+
+
+_index: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> Optional[NearDuplicateIndex]:
+    """Process-wide near-duplicate index, or None when DEDUP_INDEX_PATH is empty"""
+    global _index
+    with _index_lock:
+        if DEDUP_INDEX_PATH and _index is None:
+            _index = NearDuplicateIndex(DEDUP_INDEX_PATH)
+        return _index
@@ -0,0 +1,412 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rag.ingestion.file_reader import STREAM_THRESHOLD_BYTES
+from rag.vector_store.document_ids import document_id
+
+# Chunks per model.encode call, and chunks per vector-store write
+ENCODE_BATCH_SIZE = int(os.getenv("RAG_ENCODE_BATCH_SIZE", "64"))
+WRITE_BATCH_SIZE = int(os.getenv("RAG_WRITE_BATCH_SIZE", "1000"))
+# Encoded batches buffered between stages; bounds pipeline memory
+QUEUE_SIZE = 4
+PROGRESS_INTERVAL = 10.0
+
+# Processes parsing and chunking files; embedding stays on one thread
+INGEST_WORKERS = int(os.getenv("RAG_INGEST_WORKERS", str(os.cpu_count() or 1)))
+# Files per pool task, so IPC overhead is amortized over small files, and
+# tasks submitted ahead of the one being consumed
+FILES_PER_TASK = 16
+IN_FLIGHT_PER_WORKER = 2
+
+
+def iter_files(directory: str, file_extensions: List[str]) -> Iterator[str]:
+    """Matching files under directory, in a stable order"""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if any(file.endswith(ext) for ext in file_extensions):
+                yield os.path.join(root, file)
+
+
+def _file_key(path: str) -> Dict:
+    stat = os.stat(path)
+    return {
+        "path": os.path.abspath(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+class IngestionStageError(RuntimeError):
+    """The embed or write stage failed, so the run cannot continue"""
+
+
+def _read_many(
+    read_documents: Callable[[str], Iterable[Dict]], paths: List[str]
+) -> List[Tuple[Optional[List[Dict]], Optional[str]]]:
+    """(documents, error) per path; runs in pool workers"""
+    results = []
+    for path in paths:
+        try:
+            # Generators can't be sent back across processes
+            results.append((list(read_documents(path)), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+class IngestionCheckpoint:
+    """Append-only log of fully written files, so an interrupted run can resume"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.completed.add((entry["path"], entry["mtime_ns"]))
+
+    def is_done(self, key: Dict) -> bool:
+        return (key["path"], key["mtime_ns"]) in self.completed
+
+    def mark_done(self, keys: List[Dict]):
+        if not keys:
+            return
+        with open(self.path, "a", encoding="utf-8") as file:
+            for key in keys:
+                file.write(json.dumps(key) + "\n")
+                self.completed.add((key["path"], key["mtime_ns"]))
+
+
+class IngestionPipeline:
+    """
+    Streams files through read -> chunk -> embed -> write with bounded queues
+    between stages, so memory depends on batch sizes rather than corpus size.
+    Reading and chunking can fan out over a process pool while a single thread
+    owns the embedding model. With a dedup_index, near duplicates of chunks
+    from other sources are dropped before embedding and the rest are indexed
+    once written. Files are checkpointed once all their chunks are in the
+    vector store
+    """
+
+    def __init__(
+        self,
+        chroma_manager,
+        read_documents: Callable[[str], Iterable[Dict]],
+        encode_batch_size: int = ENCODE_BATCH_SIZE,
+        write_batch_size: int = WRITE_BATCH_SIZE,
+        checkpoint_path: Optional[str] = None,
+        queue_size: int = QUEUE_SIZE,
+        workers: int = INGEST_WORKERS,
+        dedup_index=None,
+    ):
+        self.chroma_manager = chroma_manager
+        self.read_documents = read_documents
+        self.encode_batch_size = encode_batch_size
+        self.write_batch_size = write_batch_size
+        self.checkpoint = (
+            IngestionCheckpoint(checkpoint_path) if checkpoint_path else None
+        )
+        self.queue_size = queue_size
+        # read_documents must be picklable (module level) when workers > 1
+        self.workers = workers
+        self.dedup_index = dedup_index
+        self.progress = self._new_progress()
+        self._error: Optional[BaseException] = None
+
+    def _new_progress(self) -> Dict:
+        return {
+            "files_read": 0,
+            "files_done": 0,
+            "files_skipped": 0,
+            "files_failed": 0,
+            "chunks_read": 0,
+            "chunks_duplicate": 0,
+            "chunks_near_duplicate": 0,
+            "chunks_embedded": 0,
+            "chunks_written": 0,
+            "writes": 0,
+            "started_at": time.time(),
+            "elapsed": 0.0,
+            "chunks_per_second": 0.0,
+        }
+
+    def _put(self, target: queue.Queue, item):
+        # Give up instead of blocking forever if a downstream stage has died
+        while True:
+            if self._error is not None:
+                raise IngestionStageError("Ingestion stage failed") from self._error
+            try:
+                target.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _run_stage(self, work: Callable[[], None]):
+        try:
+            work()
+        except BaseException as e:
+            self._error = e
+
+    def _embed_stage(self, inbox: queue.Queue, outbox: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is None:
+                self._put(outbox, None)
+                return
+
+            ids, documents, metadatas, finished_files = item
+            stored = self.chroma_manager.stored_ids(ids) if ids else set()
+            keep = [i for i, id in enumerate(ids) if id not in stored]
+            self.progress["chunks_duplicate"] += len(ids) - len(keep)
+            signatures = None
+            if self.dedup_index is not None and keep:
+                signatures = self.dedup_index.signatures([documents[i] for i in keep])
+                duplicates = self.dedup_index.check_many(
+                    [ids[i] for i in keep],
+                    signatures,
+                    [metadatas[i].get("source", "") for i in keep],
+                )
+                unique = [
+                    j
+                    for j, duplicate_of in enumerate(duplicates)
+                    if duplicate_of is None
+                ]
+                self.progress["chunks_near_duplicate"] += len(keep) - len(unique)
+                keep = [keep[j] for j in unique]
+                signatures = [signatures[j] for j in unique]
+            if not keep and not finished_files:
+                continue
+
+            documents = [documents[i] for i in keep]
+            embeddings = (
+                self.chroma_manager.embedding_service.encode(documents).tolist()
+                if keep
+                else []
+            )
+            self.progress["chunks_embedded"] += len(keep)
+            # Finished files travel with the batch holding their last chunk
+            self._put(
+                outbox,
+                (
+                    [ids[i] for i in keep],
+                    documents,
+                    embeddings,
+                    [metadatas[i] for i in keep],
+                    finished_files,
+                    signatures,
+                ),
+            )
+
+    def _write_stage(self, inbox: queue.Queue):
+        buffer = {"ids": [], "documents": [], "embeddings": [], "metadatas": []}
+        finished_files: List[Dict] = []
+        signatures: List = []
+
+        def flush():
+            if buffer["ids"]:
+                self.chroma_manager.write_embedded(**buffer)
+                # Indexed only once stored, so a failed write doesn't mark them seen
+                if signatures:
+                    self.dedup_index.add_many(
+                        buffer["ids"],
+                        signatures,
+                        [
+                            metadata.get("source", "")
+                            for metadata in buffer["metadatas"]
+                        ],
+                    )
+                    signatures.clear()
+                self.progress["chunks_written"] += len(buffer["ids"])
+                self.progress["writes"] += 1
+                for values in buffer.values():
+                    values.clear()
+            if self.checkpoint is not None:
+                self.checkpoint.mark_done(finished_files)
+            self.progress["files_done"] += len(finished_files)
+            finished_files.clear()
+
+        while True:
+            item = inbox.get()
+            if item is None:
+                flush()
+                return
+
+            for key, values in zip(
+                ("ids", "documents", "embeddings", "metadatas"), item
+            ):
+                buffer[key].extend(values)
+            # Marked only by the flush that writes these files' last chunks
+            finished_files.extend(item[4])
+            if item[5] is not None:
+                signatures.extend(item[5])
+            if len(buffer["ids"]) >= self.write_batch_size:
+                flush()
+
+    def _report(self):
+        progress = self.progress
+        progress["elapsed"] = time.time() - progress["started_at"]
+        if progress["elapsed"]:
+            progress["chunks_per_second"] = (
+                progress["chunks_written"] / progress["elapsed"]
+            )
+        print(
+            f"📥 {progress['files_done']} files, "
+            f"{progress['chunks_written']} chunks written, "
+            f"{progress['chunks_duplicate']} duplicates and "
+            f"{progress['chunks_near_duplicate']} near duplicates skipped "
+            f"({progress['chunks_per_second']:.0f} chunks/s)"
+        )
+
+    def _pending_files(self, paths: Iterable[str]) -> Iterator[Tuple[str, Dict]]:
+        for path in paths:
+            key = _file_key(path)
+            if self.checkpoint is not None and self.checkpoint.is_done(key):
+                self.progress["files_skipped"] += 1
+                continue
+            yield path, key
+
+    def _read_files(
+        self, paths: Iterable[str]
+    ) -> Iterator[Tuple[str, Dict, Iterable[Dict]]]:
+        """
+        (path, checkpoint key, documents) per file. With several workers, files
+        are parsed and chunked in a process pool, a bounded number at a time,
+        except large files which are streamed lazily in this process
+        """
+        if self.workers <= 1:
+            for path, key in self._pending_files(paths):
+                yield path, key, self.read_documents(path)
+            return
+
+        in_flight: Deque[Tuple[List[Tuple[str, Dict]], Future]] = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+
+            def submit(group):
+                paths = [path for path, _ in group]
+                in_flight.append(
+                    (group, pool.submit(_read_many, self.read_documents, paths))
+                )
+
+            def finished():
+                group, future = in_flight.popleft()
+                for (path, key), (documents, error) in zip(group, future.result()):
+                    if error is not None:
+                        # Left out of the checkpoint so the next run retries it
+                        print(f"Error processing {path}: {error}")
+                        self.progress["files_failed"] += 1
+                    else:
+                        yield path, key, documents
+
+            group: List[Tuple[str, Dict]] = []
+            for path, key in self._pending_files(paths):
+                if key["size"] > STREAM_THRESHOLD_BYTES:
+                    # Streamed here rather than materialized in a worker
+                    yield path, key, self.read_documents(path)
+                    continue
+                group.append((path, key))
+                if len(group) >= FILES_PER_TASK:
+                    submit(group)
+                    group = []
+                if len(in_flight) >= self.workers * IN_FLIGHT_PER_WORKER:
+                    yield from finished()
+            if group:
+                submit(group)
+            while in_flight:
+                yield from finished()
+
+    def run(self, paths: Iterable[str]) -> Dict:
+        """Ingest every path and return the final progress counters"""
+        self.progress = self._new_progress()
+        self._error = None
+        to_embed: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        to_write: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stages = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(lambda: self._embed_stage(to_embed, to_write),),
+                name="ingest-embed",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._run_stage,
+                args=(lambda: self._write_stage(to_write),),
+                name="ingest-write",
+                daemon=True,
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+
+        last_report = time.time()
+        ids: List[str] = []
+        documents: List[str] = []
+        metadatas: List[Dict] = []
+        # Files whose last chunk is in the batch being filled
+        finished_files: List[Dict] = []
+
+        def send_batch():
+            if ids or finished_files:
+                self._put(
+                    to_embed, (ids[:], documents[:], metadatas[:], finished_files[:])
+                )
+                for values in (ids, documents, metadatas, finished_files):
+                    values.clear()
+
+        try:
+            for path, key, file_documents in self._read_files(paths):
+                try:
+                    for doc in file_documents:
+                        metadata = doc["metadata"]
+                        ids.append(
+                            document_id(
+                                metadata["source"],
+                                metadata["chunk_id"],
+                                doc["content"],
+                            )
+                        )
+                        documents.append(doc["content"])
+                        metadatas.append(metadata)
+                        self.progress["chunks_read"] += 1
+                        if len(ids) >= self.encode_batch_size:
+                            send_batch()
+                except IngestionStageError:
+                    raise
+                except Exception as e:
+                    # Chunks already sent are kept; ids make the retry idempotent
+                    print(f"Error processing {path}: {e}")
+                    self.progress["files_failed"] += 1
+                    continue
+
+                # The batch keeps filling across files; the file is checkpointed
+                # once the batch holding its last chunk has been written
+                finished_files.append(key)
+                self.progress["files_read"] += 1
+
+                if time.time() - last_report >= PROGRESS_INTERVAL:
+                    last_report = time.time()
+                    self._report()
+            send_batch()
+        finally:
+            if self._error is None:
+                self._put(to_embed, None)
+                for stage in stages:
+                    stage.join()
+
+        if self._error is not None:
+            raise IngestionStageError("Ingestion stage failed") from self._error
+        self._report()
+        return dict(self.progress)
@@ -4,31 +4,83 @@ import sys
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from typing import Dict
+from typing import Dict, Optional
 
+from orchestration.config.settings import DEFAULT_TENANT
 from orchestration.core.orchestrator import ModelOrchestrator
-from rag.vector_store.chroma_manager import ChromaManager
+from rag.retrieval.reranking import (
+    MMR_LAMBDA,
+    RERANK_OVERFETCH,
+    CrossEncoderReranker,
+    diversify,
+    get_reranker,
+)
+from rag.vector_store.chroma_manager import ChromaManager, get_chroma_manager
 
 # Add project root to path
 
+REJECTION_FIELDS = ("error", "retry_after", "rate_limited")
+
+
+def rejection_details(result: Dict) -> Dict:
+    """The error and, for rejected requests, retry_after/rate_limited of a result"""
+    return {key: result[key] for key in REJECTION_FIELDS if key in result}
+
 
 class RAGOrchestrator:
     def __init__(
         self,
         model_orchestrator: ModelOrchestrator = None,
         chroma_manager: ChromaManager = None,
+        overfetch: int = RERANK_OVERFETCH,
+        mmr_lambda: float = MMR_LAMBDA,
+        reranker: Optional[CrossEncoderReranker] = None,
     ):
         """Initialize RAG system with model orchestration"""
         self.model_orchestrator = model_orchestrator or ModelOrchestrator()
-        self.chroma_manager = chroma_manager or ChromaManager()
+        self.chroma_manager = chroma_manager or get_chroma_manager()
+        self.overfetch = overfetch
+        self.mmr_lambda = mmr_lambda
+        self.reranker = reranker or get_reranker()
+
+    def retrieve(self, query: str, n_results: int = 3) -> Dict:
+        """
+        Retrieve documents for query. With overfetch above 1, overfetch times
+        as many candidates are narrowed to a diverse n_results with MMR (scored
+        by the re-ranker if one is configured), so near-copies of one chunk
+        don't crowd out the rest of the context. A configured re-ranker is
+        applied even without over-fetching, reordering the n_results found
+        """
+        if self.overfetch <= 1 and self.reranker is None:
+            return self.chroma_manager.search_documents(query, n_results)
+
+        candidates = self.chroma_manager.search_documents(
+            query, n_results * max(self.overfetch, 1), include_embeddings=True
+        )
+        query_embedding = candidates.get("query_embedding")
+        if query_embedding is None and self.reranker is None:
+            # Lexical search skipped it, but MMR relevance needs it
+            query_embedding = self.chroma_manager.embedding_service.encode_query(query)
+        return diversify(
+            query,
+            query_embedding,
+            candidates,
+            n_results,
+            self.mmr_lambda,
+            self.reranker,
+        )
 
     def search_and_generate(
-        self, query: str, n_results: int = 3, priority: str = "balanced"
+        self,
+        query: str,
+        n_results: int = 3,
+        priority: str = "balanced",
+        tenant: str = DEFAULT_TENANT,
     ) -> Dict:
         """Complete RAG pipeline: retrieve documents and generate response"""
 
         # Step 1: Retrieve relevant documents
-        search_results = self.chroma_manager.search_documents(query, n_results)
+        search_results = self.retrieve(query, n_results)
 
         # Step 2: Build context-enhanced prompt
         context_docs = "\n\n".join(
@@ -49,7 +101,7 @@ Please provide a comprehensive answer based on the context provided."""
 
         # Step 3: Route to appropriate model with enhanced prompt
         result = self.model_orchestrator.process_request_sync(
-            query=enhanced_query, priority=priority, timeout=60
+            query=enhanced_query, priority=priority, timeout=60, tenant=tenant
         )
 
         # Step 4: Combine results
@@ -62,27 +114,32 @@ Please provide a comprehensive answer based on the context provided."""
             "model_used": result.get("model", ""),
             "response_time": result.get("response_time", 0),
             "success": result.get("success", False),
+            **rejection_details(result),
             "rag_metadata": {
                 "n_documents_retrieved": len(search_results["documents"]),
-                "total_documents_in_db": self.chroma_manager.get_collection_stats()[
-                    "total_documents"
-                ],
+                "n_candidates": search_results.get(
+                    "n_candidates", len(search_results["documents"])
+                ),
+                "total_documents_in_db": self.chroma_manager.collection.count(),
             },
         }
 
-    def simple_chat(self, query: str, use_rag: bool = True) -> Dict:
+    def simple_chat(
+        self, query: str, use_rag: bool = True, tenant: str = DEFAULT_TENANT
+    ) -> Dict:
         """Simple chat interface with optional RAG"""
         if use_rag:
-            return self.search_and_generate(query)
+            return self.search_and_generate(query, tenant=tenant)
         else:
             # Direct model call without RAG
-            result = self.model_orchestrator.process_request_sync(query)
+            result = self.model_orchestrator.process_request_sync(query, tenant=tenant)
             return {
                 "original_query": query,
                 "model_response": result.get("response", ""),
                 "model_used": result.get("model", ""),
                 "response_time": result.get("response_time", 0),
                 "success": result.get("success", False),
+                **rejection_details(result),
                 "rag_used": False,
             }
 
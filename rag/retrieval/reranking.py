@@ -0,0 +1,139 @@
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Candidates retrieved per requested result before diversifying; 1 (the
+# default) skips the stage
+RERANK_OVERFETCH = int(os.getenv("RAG_RERANK_OVERFETCH", "1"))
+# Relevance vs. novelty trade-off for MMR: 1.0 is pure relevance
+MMR_LAMBDA = float(os.getenv("RAG_MMR_LAMBDA", "0.5"))
+# sentence-transformers cross-encoder that rescores candidates, e.g.
+# cross-encoder/ms-marco-MiniLM-L-6-v2; empty skips re-ranking
+RERANKER_MODEL = os.getenv("RAG_RERANKER_MODEL", "")
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def mmr_select(
+    relevance: np.ndarray,
+    embeddings: np.ndarray,
+    k: int,
+    lambda_mult: float = MMR_LAMBDA,
+) -> List[int]:
+    """
+    Indices of k candidates chosen by maximal marginal relevance: each pick
+    maximizes lambda * relevance - (1 - lambda) * its highest cosine similarity
+    to the picks so far. The similarity matrix is computed once, and each step
+    updates every candidate's redundancy in a single vector op
+    """
+    count = len(relevance)
+    k = min(k, count)
+    if k <= 0:
+        return []
+    unit = normalize_rows(embeddings)
+    similarity = unit @ unit.T
+    relevance = np.asarray(relevance, dtype=np.float32)
+
+    selected = [int(np.argmax(relevance))]
+    redundancy = similarity[selected[0]].copy()
+    available = np.ones(count, dtype=bool)
+    available[selected[0]] = False
+    for _ in range(k - 1):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(redundancy, similarity[best], out=redundancy)
+    return selected
+
+
+def cosine_relevance(query_embedding: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+    return normalize_rows(embeddings) @ normalize_rows(query_embedding)
+
+
+class CrossEncoderReranker:
+    """Cross-encoder relevance scores, with the model loaded on first use"""
+
+    def __init__(self, model_name: str = RERANKER_MODEL, model=None):
+        self.model_name = model_name
+        self._model = model
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import CrossEncoder
+
+                print(f"Loading cross-encoder '{self.model_name}'")
+                self._model = CrossEncoder(self.model_name)
+            return self._model
+
+    def score(self, query: str, documents: List[str]) -> np.ndarray:
+        """Relevance of each document to query squashed into (0, 1), batched"""
+        if not documents:
+            return np.zeros(0, dtype=np.float32)
+        logits = np.asarray(
+            self.model.predict([(query, document) for document in documents]),
+            dtype=np.float32,
+        )
+        return 1 / (1 + np.exp(-logits))
+
+
+_rerankers: Dict[str, CrossEncoderReranker] = {}
+_rerankers_lock = threading.Lock()
+
+
+def get_reranker(model_name: Optional[str] = None) -> Optional[CrossEncoderReranker]:
+    """Shared re-ranker for model_name, or None when no model is configured"""
+    model_name = model_name or RERANKER_MODEL
+    if not model_name:
+        return None
+    with _rerankers_lock:
+        if model_name not in _rerankers:
+            _rerankers[model_name] = CrossEncoderReranker(model_name)
+        return _rerankers[model_name]
+
+
+def diversify(
+    query: str,
+    query_embedding: np.ndarray,
+    candidates: Dict,
+    n_results: int,
+    lambda_mult: float = MMR_LAMBDA,
+    reranker: Optional[CrossEncoderReranker] = None,
+) -> Dict:
+    """
+    Narrow over-fetched search results (with "embeddings") to n_results diverse
+    ones. Relevance is cosine similarity to the query, or the cross-encoder's
+    score when a reranker is given
+    """
+    documents = candidates["documents"]
+    if not documents:
+        return candidates
+    embeddings = np.asarray(candidates["embeddings"], dtype=np.float32)
+    if reranker is not None:
+        relevance = reranker.score(query, documents)
+    else:
+        relevance = cosine_relevance(query_embedding, embeddings)
+
+    order = mmr_select(relevance, embeddings, n_results, lambda_mult)
+    selected = {
+        key: [values[i] for i in order]
+        for key, values in candidates.items()
+        if key in ("ids", "documents", "distances", "metadatas")
+    }
+    return {
+        **candidates,
+        **selected,
+        "embeddings": embeddings[order],
+        "relevance": [float(relevance[i]) for i in order],
+        "n_candidates": len(documents),
+    }
@@ -1,27 +1,86 @@
 import os
-from typing import Dict, List
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import threading
+import time
+from typing import Dict, List, Optional, Set
 
 import chromadb
-from sentence_transformers import SentenceTransformer
+import numpy as np
+
+from rag.vector_store.document_ids import document_id
+from rag.vector_store.embedding_service import EmbeddingService, get_embedding_service
+from rag.vector_store.lexical_index import BM25Index, reciprocal_rank_fusion
+
+DEFAULT_PERSIST_DIRECTORY = "./chroma_db"
+# Used when the chromadb version does not report its own limit
+DEFAULT_MAX_BATCH_SIZE = 5000
+
+# "dense" (embeddings only), "lexical" (BM25 only) or "hybrid" (both, fused)
+SEARCH_MODE = os.getenv("RAG_SEARCH_MODE", "dense")
+# Share of the fused score given to BM25 ranks in hybrid mode
+LEXICAL_WEIGHT = float(os.getenv("RAG_LEXICAL_WEIGHT", "0.5"))
+# Candidates taken from each retriever per requested result before fusing
+HYBRID_CANDIDATES = 4
+RRF_K = 60
+# Chunks read per page when rebuilding the BM25 index from the collection
+LEXICAL_REBUILD_PAGE = 5000
+# Seconds between background checks for chunks other processes wrote or deleted
+LEXICAL_SYNC_INTERVAL = 30.0
+
+_clients: Dict[str, "chromadb.ClientAPI"] = {}
+_managers: Dict[str, "ChromaManager"] = {}
+_shared_lock = threading.Lock()
+
+
+def get_chroma_client(persist_directory: str = DEFAULT_PERSIST_DIRECTORY):
+    """One PersistentClient per storage directory for the whole process"""
+    path = os.path.abspath(persist_directory)
+    with _shared_lock:
+        if path not in _clients:
+            # Create directory if it doesn't exist
+            os.makedirs(path, exist_ok=True)
+            _clients[path] = chromadb.PersistentClient(path=path)
+        return _clients[path]
+
+
+def get_chroma_manager(
+    persist_directory: str = DEFAULT_PERSIST_DIRECTORY,
+) -> "ChromaManager":
+    """Shared ChromaManager per storage directory, used as the default everywhere"""
+    path = os.path.abspath(persist_directory)
+    with _shared_lock:
+        manager = _managers.get(path)
+    if manager is None:
+        # Built outside the lock since it takes the lock again for the client
+        manager = ChromaManager(persist_directory)
+        with _shared_lock:
+            manager = _managers.setdefault(path, manager)
+    return manager
 
 
 class ChromaManager:
-    def __init__(self, persist_directory: str = "./chroma_db"):
+    def __init__(
+        self,
+        persist_directory: str = DEFAULT_PERSIST_DIRECTORY,
+        embedding_service: EmbeddingService = None,
+    ):
         """Initialize ChromaDB with persistence"""
         self.persist_directory = persist_directory
 
-        # Create directory if it doesn't exist
-        os.makedirs(persist_directory, exist_ok=True)
-
-        # Initialize ChromaDB client with persistence
-        self.client = chromadb.PersistentClient(path=persist_directory)
-
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+        # Clients and embedding models are shared, so extra managers are cheap
+        self.client = get_chroma_client(persist_directory)
+        self.embedding_service = embedding_service or get_embedding_service()
 
         # Default collection name
         self.collection_name = "documents"
         self.collection = None
+        self._lexical_index: Optional[BM25Index] = None
+        self._lexical_lock = threading.Lock()
+        self._lexical_sync_thread: Optional[threading.Thread] = None
 
         # Initialize collection
         self._initialize_collection()
@@ -43,43 +102,300 @@ class ChromaManager:
             print(f"Created new collection '{self.collection_name}'")
 
     def add_documents(
-        self, documents: List[str], metadatas: List[Dict] = None, ids: List[str] = None
+        self,
+        documents: List[str],
+        metadatas: List[Dict] = None,
+        ids: List[str] = None,
+        skip_existing: bool = True,
     ):
-        """Add documents to the collection"""
+        """
+        Upsert documents into the collection. Ids default to a hash of source,
+        chunk position and text, and chunks already stored are not re-embedded
+        """
+        if ids is None:
+            # Bare texts are addressed by content alone
+            ids = [
+                document_id(
+                    metadata.get("source", ""), metadata.get("chunk_id", 0), doc
+                )
+                for doc, metadata in zip(documents, metadatas or [{}] * len(documents))
+            ]
+
         if metadatas is None:
             metadatas = [{"source": f"doc_{i}"} for i in range(len(documents))]
 
-        if ids is None:
-            ids = [f"doc_{i}_{hash(doc)}" for i, doc in enumerate(documents)]
+        # Last occurrence wins for ids repeated within the batch
+        pending = {
+            id: (doc, metadata) for id, doc, metadata in zip(ids, documents, metadatas)
+        }
+        if skip_existing:
+            for id in self.stored_ids(list(pending)):
+                del pending[id]
 
-        # Generate embeddings
-        embeddings = self.embedding_model.encode(documents).tolist()
+        if pending:
+            new_ids = list(pending)
+            new_documents = [pending[id][0] for id in new_ids]
 
-        # Add to collection
-        self.collection.add(
-            documents=documents, embeddings=embeddings, metadatas=metadatas, ids=ids
-        )
+            # Generate embeddings
+            embeddings = self.embedding_service.encode(new_documents).tolist()
+
+            self.write_embedded(
+                new_ids,
+                new_documents,
+                embeddings,
+                [pending[id][1] for id in new_ids],
+            )
 
-        print(f"Added {len(documents)} documents to collection")
+        print(
+            f"Added {len(pending)} documents to collection, "
+            f"skipped {len(documents) - len(pending)} duplicates"
+        )
         return ids
 
-    def search_documents(self, query: str, n_results: int = 5) -> Dict:
-        """Search for relevant documents"""
-        # Generate query embedding
-        query_embedding = self.embedding_model.encode([query]).tolist()
+    def stored_ids(self, ids: List[str]) -> Set[str]:
+        """The subset of ids already present in the collection"""
+        if not ids:
+            return set()
+        return set(self.collection.get(ids=ids, include=[])["ids"])
+
+    def write_embedded(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+    ):
+        """Upsert pre-computed embeddings, split to fit Chroma's max batch size"""
+        batch_size = self.max_batch_size
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            self.collection.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+            )
+        with self._lexical_lock:
+            # Until the index is first needed, writes only go to the collection
+            if self._lexical_index is not None:
+                self._lexical_index.add(ids, documents)
 
-        # Search in collection
-        results = self.collection.query(
-            query_embeddings=query_embedding,
-            n_results=n_results,
-            include=["documents", "distances", "metadatas"],
+    @property
+    def lexical_index(self) -> BM25Index:
+        """
+        BM25 index over the collection, built from it on first use (call
+        prepare_search at startup to keep that out of requests). Writes and
+        deletes through this manager keep it current
+        """
+        with self._lexical_lock:
+            if self._lexical_index is None:
+                index = BM25Index()
+                offset = 0
+                while True:
+                    page = self.collection.get(
+                        include=["documents"],
+                        limit=LEXICAL_REBUILD_PAGE,
+                        offset=offset,
+                    )
+                    if not page["ids"]:
+                        break
+                    index.add(page["ids"], page["documents"])
+                    offset += len(page["ids"])
+                print(f"Built BM25 index over {len(index)} documents")
+                self._lexical_index = index
+            return self._lexical_index
+
+    def sync_lexical_index(self) -> Dict:
+        """
+        Bring the BM25 index in line with the collection's ids, picking up
+        chunks other processes wrote or deleted. Scans every id, so it runs on
+        the background sync thread rather than in search_documents
+        """
+        index = self.lexical_index
+        # Taken before the scan: chunks indexed meanwhile are already stored
+        indexed = index.ids()
+        stored = set()
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=[], limit=LEXICAL_REBUILD_PAGE, offset=offset
+            )
+            if not page["ids"]:
+                break
+            stored.update(page["ids"])
+            offset += len(page["ids"])
+
+        missing = [id for id in stored if id not in index]
+        for start in range(0, len(missing), LEXICAL_REBUILD_PAGE):
+            page = self.collection.get(
+                ids=missing[start : start + LEXICAL_REBUILD_PAGE],
+                include=["documents"],
+            )
+            index.add(page["ids"], page["documents"])
+        removed = index.remove(indexed - stored)
+        if missing or removed:
+            print(
+                f"BM25 index synced: {len(missing)} added, {removed} removed "
+                "by other processes"
+            )
+        return {"added": len(missing), "removed": removed}
+
+    def _lexical_sync_loop(self):
+        while True:
+            time.sleep(LEXICAL_SYNC_INTERVAL)
+            try:
+                self.sync_lexical_index()
+            except Exception as e:
+                print(f"BM25 index sync failed: {e}")
+
+    def prepare_search(self, mode: Optional[str] = None):
+        """
+        Build whatever mode (default SEARCH_MODE) needs before serving queries,
+        and start syncing the BM25 index with other processes' writes
+        """
+        if (mode or SEARCH_MODE) == "dense":
+            return
+        self.lexical_index
+        with self._lexical_lock:
+            if self._lexical_sync_thread is None:
+                self._lexical_sync_thread = threading.Thread(
+                    target=self._lexical_sync_loop,
+                    name="bm25-sync",
+                    daemon=True,
+                )
+                self._lexical_sync_thread.start()
+
+    @property
+    def max_batch_size(self) -> int:
+        if hasattr(self.client, "get_max_batch_size"):
+            return self.client.get_max_batch_size()
+        return getattr(self.client, "max_batch_size", DEFAULT_MAX_BATCH_SIZE)
+
+    @property
+    def embedding_model(self):
+        return self.embedding_service.model
+
+    def search_documents(
+        self,
+        query: str,
+        n_results: int = 5,
+        mode: Optional[str] = None,
+        lexical_weight: Optional[float] = None,
+        include_embeddings: bool = False,
+    ) -> Dict:
+        """
+        Search for relevant documents. Hybrid mode fuses the dense and BM25
+        rankings with reciprocal rank fusion, weighting BM25 by lexical_weight.
+        Lexical mode never embeds the query, and its distances are None.
+        include_embeddings adds each result's stored embedding as a matrix,
+        plus the query's own as "query_embedding" (None in lexical mode)
+        """
+        mode = mode or SEARCH_MODE
+        if mode not in ("dense", "lexical", "hybrid"):
+            raise ValueError(f"Unknown search mode: {mode}")
+        lexical_weight = LEXICAL_WEIGHT if lexical_weight is None else lexical_weight
+
+        # Generate query embedding
+        query_embedding = (
+            self.embedding_service.encode_query(query) if mode != "lexical" else None
         )
+        candidates = n_results if mode == "dense" else n_results * HYBRID_CANDIDATES
 
-        return {
-            "documents": results["documents"][0],
-            "distances": results["distances"][0],
-            "metadatas": results["metadatas"][0],
+        found = {}
+        dense_ids = []
+        if mode != "lexical":
+            include = ["documents", "distances", "metadatas"]
+            if include_embeddings:
+                include.append("embeddings")
+            # Search in collection
+            results = self.collection.query(
+                query_embeddings=[query_embedding.tolist()],
+                n_results=candidates,
+                include=include,
+            )
+            dense_ids = results["ids"][0]
+            for i, id in enumerate(dense_ids):
+                found[id] = (
+                    results["documents"][0][i],
+                    results["distances"][0][i],
+                    results["metadatas"][0][i],
+                    results["embeddings"][0][i] if include_embeddings else None,
+                )
+
+        if mode == "dense":
+            ids = dense_ids
+        else:
+            lexical_ids = [id for id, _ in self.lexical_index.search(query, candidates)]
+            fused = reciprocal_rank_fusion(
+                [dense_ids, lexical_ids], [1 - lexical_weight, lexical_weight], RRF_K
+            )
+            ids = [id for id, _ in fused[:n_results]]
+            found.update(
+                self._fetch(
+                    query_embedding,
+                    [id for id in ids if id not in found],
+                    include_embeddings,
+                )
+            )
+            # Chunks deleted since they were indexed
+            ids = [id for id in ids if id in found]
+
+        search_results = {
+            "ids": ids,
+            "documents": [found[id][0] for id in ids],
+            "distances": [found[id][1] for id in ids],
+            "metadatas": [found[id][2] for id in ids],
             "query": query,
+            "mode": mode,
+        }
+        if include_embeddings:
+            embeddings = np.asarray([found[id][3] for id in ids], dtype=np.float32)
+            search_results["embeddings"] = embeddings.reshape(len(ids), -1)
+            search_results["query_embedding"] = query_embedding
+        return search_results
+
+    def _fetch(
+        self,
+        query_embedding: Optional[np.ndarray],
+        ids: List[str],
+        include_embeddings: bool = False,
+    ) -> Dict:
+        """
+        id -> (document, distance, metadata, embedding) for chunks the dense
+        search missed. Without a query embedding (lexical mode) distances are
+        None and embeddings are only read when asked for
+        """
+        if not ids:
+            return {}
+        include = ["documents", "metadatas"]
+        if query_embedding is not None or include_embeddings:
+            include.append("embeddings")
+        results = self.collection.get(ids=ids, include=include)
+        count = len(results["ids"])
+        if not count:
+            return {}
+        embeddings = (
+            np.asarray(results["embeddings"], dtype=np.float32)
+            if "embeddings" in include
+            else [None] * count
+        )
+        if query_embedding is not None:
+            # Squared L2, the collection's distance space, so results stay comparable
+            distances = [
+                float(distance)
+                for distance in ((embeddings - query_embedding) ** 2).sum(axis=1)
+            ]
+        else:
+            distances = [None] * count
+        return {
+            id: (document, distance, metadata, embedding)
+            for id, document, distance, metadata, embedding in zip(
+                results["ids"],
+                results["documents"],
+                distances,
+                results["metadatas"],
+                embeddings,
+            )
         }
 
     def get_collection_stats(self) -> Dict:
@@ -88,17 +404,33 @@ class ChromaManager:
             "total_documents": self.collection.count(),
             "collection_name": self.collection_name,
             "persist_directory": self.persist_directory,
+            "embeddings": self.embedding_service.get_stats(),
+            "lexical_index": self._lexical_index.get_stats()
+            if self._lexical_index is not None
+            else None,
         }
 
+    def delete_documents(self, ids: List[str]):
+        """Delete chunks by id from the collection and the BM25 index"""
+        if not ids:
+            return
+        self.collection.delete(ids=ids)
+        with self._lexical_lock:
+            if self._lexical_index is not None:
+                self._lexical_index.remove(ids)
+        print(f"Deleted {len(ids)} documents from collection")
+
     def delete_collection(self):
         """Delete the collection"""
         self.client.delete_collection(name=self.collection_name)
+        with self._lexical_lock:
+            self._lexical_index = None
         print(f"Deleted collection '{self.collection_name}'")
 
 
 if __name__ == "__main__":
     # Test the ChromaManager
-    chroma = ChromaManager()
+    chroma = get_chroma_manager()
 
     # Test documents
     test_docs = [
@@ -0,0 +1,13 @@
+import hashlib
+
+
+def document_id(source: str, offset: int, text: str) -> str:
+    """
+    Stable content-addressed chunk id: the same text at the same place in the
+    same source always maps to the same id, in any process
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (source, str(offset), text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
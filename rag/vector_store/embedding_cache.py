@@ -0,0 +1,182 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# A rowid table keeps the ~1.5 KB vectors out of the primary-key B-tree, which
+# WITHOUT ROWID would split into overflow pages and leave mostly empty
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_vectors (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    hash BLOB NOT NULL,
+    vector BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS embedding_vectors_key
+    ON embedding_vectors (model, hash);
+"""
+
+# Stay well under SQLite's bound-parameter limit
+LOOKUP_BATCH_SIZE = 500
+# Share of max_entries removed when the cap is hit, so pruning is not per insert
+PRUNE_FRACTION = 0.1
+
+
+def content_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class EmbeddingCache:
+    """
+    Persistent (model, content hash) -> float32 vector store, so unchanged text
+    is never encoded twice across runs. Holds at most max_entries vectors,
+    dropping the oldest inserted first once full (0 means unbounded)
+    """
+
+    def __init__(self, db_path: str = "./embedding_cache.db", max_entries: int = 0):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+        # Counted once when the file is opened, then kept up to date on writes
+        self.entries = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        # The file is only created once something is looked up or stored
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self.entries = self._count(conn)
+            self._initialized = True
+        return conn
+
+    def _count(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COUNT(*) FROM embedding_vectors").fetchone()[0]
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Cached vector for each text, or None where it has not been seen"""
+        hashes = [content_hash(text) for text in texts]
+        found: Dict[bytes, np.ndarray] = {}
+        with closing(self._connect()) as conn:
+            for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+                batch = list(set(hashes[start : start + LOOKUP_BATCH_SIZE]))
+                rows = conn.execute(
+                    "SELECT hash, vector FROM embedding_vectors WHERE model = ? "
+                    f"AND hash IN ({', '.join('?' * len(batch))})",
+                    (model, *batch),
+                )
+                for digest, vector in rows:
+                    found[digest] = np.frombuffer(vector, dtype=np.float32)
+
+        vectors = [found.get(digest) for digest in hashes]
+        hits = sum(1 for vector in vectors if vector is not None)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, model: str, texts: List[str], vectors: np.ndarray):
+        rows = [
+            (model, content_hash(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO embedding_vectors (model, hash, vector) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            inserted = conn.total_changes - before
+            conn.execute("COMMIT")
+            with self._lock:
+                self.entries += inserted
+                over_cap = self.max_entries and self.entries > self.max_entries
+            if over_cap:
+                self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Drop the oldest vectors to get back under max_entries with some slack"""
+        conn.execute("BEGIN IMMEDIATE")
+        # Other processes may have written too; only recount here, off the hot path
+        entries = self._count(conn)
+        excess = entries - int(self.max_entries * (1 - PRUNE_FRACTION))
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM embedding_vectors WHERE id IN "
+                "(SELECT id FROM embedding_vectors ORDER BY id LIMIT ?)",
+                (excess,),
+            )
+        conn.execute("COMMIT")
+        with self._lock:
+            self.entries = entries - max(excess, 0)
+            self.pruned += max(excess, 0)
+
+    def get_stats(self) -> Dict:
+        if not self._initialized and os.path.exists(self.db_path):
+            # Count an existing file once rather than reporting it as empty
+            self._connect().close()
+        lookups = self.hits + self.misses
+        return {
+            "path": self.db_path,
+            "entries": self.entries,
+            "max_entries": self.max_entries,
+            "pruned": self.pruned,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+class QueryEmbeddingCache:
+    """Bounded in-memory LRU of query embeddings keyed on (model, normalized query)"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model: str, query: str) -> Optional[np.ndarray]:
+        key = (model, normalize_query(query))
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, model: str, query: str, vector: np.ndarray):
+        key = (model, normalize_query(query))
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
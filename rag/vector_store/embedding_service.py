@@ -0,0 +1,127 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from rag.vector_store.embedding_cache import EmbeddingCache, QueryEmbeddingCache
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Persistent embedding cache shared by every model; set to "" to disable
+EMBEDDING_CACHE_PATH = os.getenv("RAG_EMBEDDING_CACHE", "./embedding_cache.db")
+# Vectors kept on disk before the oldest are pruned (~1.5 KB each at 384 dims)
+EMBEDDING_CACHE_MAX_ENTRIES = int(
+    os.getenv("RAG_EMBEDDING_CACHE_MAX_ENTRIES", "500000")
+)
+# Recent query embeddings kept in memory per model; 0 disables
+QUERY_CACHE_SIZE = int(os.getenv("RAG_QUERY_CACHE_SIZE", "1024"))
+
+
+class EmbeddingService:
+    """
+    Sentence embedding model loaded on first use, so components that never embed
+    anything (viewers, stats endpoints) don't pay for it
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        model=None,
+        cache: Optional[EmbeddingCache] = None,
+        query_cache_size: int = QUERY_CACHE_SIZE,
+    ):
+        self.model_name = model_name
+        self.cache = cache
+        self.query_cache = (
+            QueryEmbeddingCache(query_cache_size) if query_cache_size > 0 else None
+        )
+        self._model = model
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    print(f"🧠 Loading embedding model {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(texts), dtype=np.float32)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts as a (len(texts), dim) float32 array, only running the model
+        on texts missing from the cache
+        """
+        if self.cache is None or not texts:
+            return self._encode(texts)
+
+        cached = self.cache.get_many(self.model_name, texts)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if not missing:
+            return np.stack(cached)
+
+        encoded = self._encode([texts[i] for i in missing])
+        self.cache.put_many(self.model_name, [texts[i] for i in missing], encoded)
+        for i, vector in zip(missing, encoded):
+            cached[i] = vector
+        return np.stack(cached)
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """Embed a single search query, served from memory when recently seen"""
+        if self.query_cache is None:
+            return self.encode([query])[0]
+
+        vector = self.query_cache.get(self.model_name, query)
+        if vector is None:
+            vector = self.encode([query])[0]
+            self.query_cache.put(self.model_name, query, vector)
+        return vector
+
+    def get_stats(self) -> Dict:
+        return {
+            "model": self.model_name,
+            "loaded": self.loaded,
+            "cache": self.cache.get_stats() if self.cache is not None else None,
+            "query_cache": (
+                self.query_cache.get_stats() if self.query_cache is not None else None
+            ),
+        }
+
+
+_services: Dict[str, EmbeddingService] = {}
+_services_lock = threading.Lock()
+_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Process-wide embedding cache, or None when EMBEDDING_CACHE_PATH is empty"""
+    global _cache
+    if EMBEDDING_CACHE_PATH and _cache is None:
+        _cache = EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES)
+    return _cache
+
+
+def get_embedding_service(model_name: Optional[str] = None) -> EmbeddingService:
+    """Process-wide embedding service for model_name, shared by all components"""
+    model_name = model_name or DEFAULT_EMBEDDING_MODEL
+    with _services_lock:
+        if model_name not in _services:
+            _services[model_name] = EmbeddingService(
+                model_name, cache=get_embedding_cache()
+            )
+        return _services[model_name]
@@ -0,0 +1,160 @@
+import math
+import os
+import re
+import threading
+from collections import Counter
+from heapq import nlargest
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+# Identifiers keep their dots, dashes and colons (os.path.join, utf-8,
+# std::vector) and are also indexed by their parts
+TOKEN_PATTERN = re.compile(r"\w+(?:[.\-:]+\w+)*")
+PART_PATTERN = re.compile(r"\w+")
+# Query terms in more than this share of chunks add little beyond the rarer
+# terms but dominate lookup time, so they only count when nothing rarer matched.
+# Small collections are scored in full, since every term is "common" there and
+# the lookups are cheap anyway
+COMMON_TERM_SHARE = float(os.getenv("RAG_BM25_COMMON_TERM_SHARE", "0.5"))
+COMMON_TERM_MIN_DOCUMENTS = int(os.getenv("RAG_BM25_COMMON_TERM_MIN_DOCS", "10000"))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words and compound identifiers, with each identifier's parts"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        if not token.isalnum():
+            tokens.extend(PART_PATTERN.findall(token))
+    return tokens
+
+
+class BM25Index:
+    """
+    In-memory BM25 inverted index keyed by chunk id, updated incrementally as
+    chunks are written or deleted. Ids are content-addressed, so a known id is
+    never re-indexed. Removed chunks are only tombstoned, so their terms still
+    count toward document frequencies
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        common_term_share: float = COMMON_TERM_SHARE,
+        common_term_min_documents: int = COMMON_TERM_MIN_DOCUMENTS,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.common_term_share = common_term_share
+        self.common_term_min_documents = common_term_min_documents
+        # term -> {doc index: term frequency}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_ids: List[str] = []
+        self.doc_lengths: List[int] = []
+        self._positions: Dict[str, int] = {}
+        self._removed: Set[int] = set()
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._positions
+
+    def add(self, ids: Sequence[str], documents: Sequence[str]) -> int:
+        """Index documents under ids, skipping ids already indexed"""
+        added = 0
+        with self._lock:
+            for doc_id, text in zip(ids, documents):
+                if doc_id in self._positions:
+                    continue
+                position = len(self.doc_ids)
+                counts = Counter(tokenize(text))
+                for term, frequency in counts.items():
+                    self.postings.setdefault(term, {})[position] = frequency
+                length = sum(counts.values())
+                self._positions[doc_id] = position
+                self.doc_ids.append(doc_id)
+                self.doc_lengths.append(length)
+                self._total_length += length
+                added += 1
+        return added
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Drop ids from search results; unknown ids are ignored"""
+        removed = 0
+        with self._lock:
+            for doc_id in ids:
+                position = self._positions.pop(doc_id, None)
+                if position is None:
+                    continue
+                self._removed.add(position)
+                self._total_length -= self.doc_lengths[position]
+                removed += 1
+        return removed
+
+    def ids(self) -> Set[str]:
+        """Snapshot of the indexed ids"""
+        with self._lock:
+            return set(self._positions)
+
+    def search(self, query: str, n_results: int = 10) -> List[Tuple[str, float]]:
+        """Top (id, BM25 score) pairs for query, best first"""
+        with self._lock:
+            count = len(self._positions)
+            if not count:
+                return []
+            average_length = self._total_length / count
+            k1, b = self.k1, self.b
+            matched = [
+                self.postings[term]
+                for term in set(tokenize(query))
+                if term in self.postings
+            ]
+            scores: Dict[int, float] = {}
+            skip_common = count >= self.common_term_min_documents
+            # Rarest first, so common terms can be skipped once something matched
+            for postings in sorted(matched, key=len):
+                frequency = len(postings)
+                if (
+                    skip_common
+                    and scores
+                    and frequency > count * self.common_term_share
+                ):
+                    break
+                idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                for position, tf in postings.items():
+                    if position in self._removed:
+                        continue
+                    norm = k1 * (
+                        1 - b + b * self.doc_lengths[position] / average_length
+                    )
+                    scores[position] = scores.get(position, 0.0) + (
+                        idf * tf * (k1 + 1) / (tf + norm)
+                    )
+            best = nlargest(n_results, scores.items(), key=lambda item: item[1])
+            return [(self.doc_ids[position], score) for position, score in best]
+
+    def get_stats(self) -> Dict:
+        return {
+            "documents": len(self._positions),
+            "terms": len(self.postings),
+            "average_length": self._total_length / len(self._positions)
+            if self._positions
+            else 0.0,
+        }
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[str]], weights: Iterable[float], k: int = 60
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked id lists: each id scores the weighted sum of 1 / (k + rank)
+    over the lists it appears in. Best first
+    """
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
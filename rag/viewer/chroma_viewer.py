@@ -5,12 +5,12 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 
-from rag.vector_store.chroma_manager import ChromaManager
+from rag.vector_store.chroma_manager import get_chroma_manager
 
 
 class ChromaViewer:
     def __init__(self):
-        self.chroma = ChromaManager()
+        self.chroma = get_chroma_manager()
 
     def show_collection_info(self):
         """Display basic collection information"""
@@ -81,8 +81,12 @@ class ChromaViewer:
                 results["documents"], results["distances"], results.get("metadatas", [])
             )
         ):
-            similarity = 1 - distance
-            print(f"\n{i+1}. Similarity: {similarity:.3f}")
+            if distance is None:
+                # Lexical search has no embedding distance
+                print(f"\n{i+1}.")
+            else:
+                similarity = 1 - distance
+                print(f"\n{i+1}. Similarity: {similarity:.3f}")
             print(f"   Source: {metadata.get('source_type', 'unknown')}")
             print(f"   Title: {metadata.get('title', 'No title')}")
             print(f"   Content: {doc[:200]}...")
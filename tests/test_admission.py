@@ -0,0 +1,108 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import threading
+
+import pytest
+
+from orchestration.core.balancer.admission import AdmissionController, AdmissionRejected
+from orchestration.core.balancer.load_balancer import LoadBalancer
+from orchestration.core.balancer.wait_estimator import WaitTimeEstimator
+
+ROUTING_RULES = {
+    "reasoning": ["llama3.1:70b", "mixtral:8x7b-instruct-v0.1-q4_0"],
+    "fast": ["neural-chat:7b-v3.3-q4_0", "llama3.1:8b"],
+}
+
+
+def test_wait_estimator_uses_observed_service_times():
+    """Test that estimates come from recorded samples rather than the prior"""
+    estimator = WaitTimeEstimator()
+    for service_time in [1.0, 2.0, 3.0, 4.0]:
+        estimator.record("llama3.1:8b", service_time)
+
+    assert estimator.expected_service_time("llama3.1:8b") == pytest.approx(2.5)
+    assert estimator.expected_service_time("llama3.1:8b", quantile=0.9) == 4.0
+    # Unobserved models fall back to their configured max response time
+    assert estimator.expected_service_time("codellama:13b") == 20.0
+
+
+def test_cold_model_is_admitted_at_default_timeout():
+    """Test that a model slower than the deadline on paper still gets a first run"""
+    balancer = LoadBalancer(max_concurrent_requests=2)
+    controller = AdmissionController(balancer, ROUTING_RULES)
+
+    # llama3.1:70b is configured for 90s, above the 60s default timeout
+    assert balancer.wait_estimator.expected_service_time("llama3.1:70b") == 30.0
+    decision = controller.admit("llama3.1:70b", "reasoning", deadline=60)
+
+    assert decision["model"] == "llama3.1:70b"
+    assert decision["downgraded_from"] is None
+    balancer.stop()
+
+
+def test_wait_estimator_queue_and_slots():
+    """Test that queued work is spread over the available slots"""
+    estimator = WaitTimeEstimator()
+    estimator.record("m", 10.0)
+
+    assert estimator.estimate_wait([], [], slots=2) == 0.0
+    assert estimator.estimate_wait([("m", 4.0)], [], slots=2) == 0.0
+    assert estimator.estimate_wait([("m", 4.0), ("m", 8.0)], [], slots=2) == 2.0
+    # Two queued requests take the next two slot openings
+    wait = estimator.estimate_wait([("m", 4.0), ("m", 8.0)], [10.0, 10.0], slots=2)
+    assert wait == 12.0
+
+
+def _occupy_slot(balancer: LoadBalancer, model: str, release: threading.Event):
+    """Hold the balancer's only slot with a request running until release is set"""
+
+    def execute(task):
+        release.wait(5)
+        return {"success": True, "response_time": 0.0}
+
+    balancer.execute_model_request = execute
+    return balancer.submit_request("busy", model)
+
+
+def test_admission_downgrades_when_deadline_cannot_be_met():
+    """Test that a slow model is swapped for one that meets the deadline"""
+    balancer = LoadBalancer(max_concurrent_requests=2)
+    balancer.wait_estimator.record("llama3.1:70b", 80.0)
+    balancer.wait_estimator.record("mixtral:8x7b-instruct-v0.1-q4_0", 40.0)
+    balancer.wait_estimator.record("neural-chat:7b-v3.3-q4_0", 1.0)
+    controller = AdmissionController(balancer, ROUTING_RULES)
+
+    decision = controller.admit("llama3.1:70b", "reasoning", deadline=30)
+
+    assert decision["model"] == "neural-chat:7b-v3.3-q4_0"
+    assert decision["downgraded_from"] == "llama3.1:70b"
+    assert controller.stats["downgraded"] == 1
+    balancer.stop()
+
+
+def test_admission_rejects_with_retry_after():
+    """Test that requests are shed up front when no model fits the deadline"""
+    balancer = LoadBalancer(max_concurrent_requests=1, max_queue_size=0)
+    balancer.wait_estimator.record("llama3.1:70b", 80.0)
+    controller = AdmissionController(balancer, ROUTING_RULES)
+
+    with pytest.raises(AdmissionRejected):
+        controller.admit(
+            "llama3.1:70b", "reasoning", deadline=30, allow_downgrade=False
+        )
+
+    release = threading.Event()
+    busy = _occupy_slot(balancer, "llama3.1:70b", release)
+    with pytest.raises(AdmissionRejected) as excinfo:
+        controller.admit("llama3.1:70b", "reasoning", deadline=300)
+
+    assert excinfo.value.estimated_wait == pytest.approx(80.0, abs=1.0)
+    assert int(excinfo.value.retry_after_header) in (80, 81)
+    assert controller.stats["rejected"] == 2
+    release.set()
+    busy.result(timeout=5)
+    balancer.stop()
@@ -0,0 +1,141 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+import api.orchestration_api as orchestration_api
+from api.compression import StreamingAwareGZipMiddleware
+
+client = TestClient(orchestration_api.app)
+
+
+def _fake_result(**kwargs):
+    return {
+        "success": True,
+        "response": "word " * 500,
+        "model": "llama3.1:8b",
+        "response_time": 1.2,
+        "truncated": False,
+    }
+
+
+def test_orchestrate_response_is_lean_by_default(monkeypatch):
+    """Test that system status is only embedded when asked for"""
+    monkeypatch.setattr(
+        orchestration_api.orchestrator, "process_request_sync", _fake_result
+    )
+
+    lean = client.post("/orchestrate", json={"query": "Hello"})
+    assert lean.status_code == 200
+    assert "orchestration_stats" not in lean.json()
+
+    full = client.post("/orchestrate", json={"query": "Hello", "include": ["stats"]})
+    assert "load_balancer" in full.json()["orchestration_stats"]
+
+
+def test_large_responses_are_gzipped(monkeypatch):
+    """Test gzip compression of large payloads"""
+    monkeypatch.setattr(
+        orchestration_api.orchestrator, "process_request_sync", _fake_result
+    )
+
+    response = client.post(
+        "/orchestrate",
+        json={"query": "Hello"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.headers.get("content-encoding") == "gzip"
+
+
+def test_max_tokens_must_be_positive_and_bounded(monkeypatch):
+    """Test that max_tokens can't disable or exceed the output budget"""
+    monkeypatch.setattr(
+        orchestration_api.orchestrator, "process_request_sync", _fake_result
+    )
+
+    for max_tokens in (-1, 0, orchestration_api.MAX_GENERATION_TOKENS + 1):
+        response = client.post(
+            "/orchestrate", json={"query": "Hello", "max_tokens": max_tokens}
+        )
+        assert response.status_code == 422
+    ok = client.post("/orchestrate", json={"query": "Hello", "max_tokens": 64})
+    assert ok.status_code == 200
+
+
+def test_rejected_requests_map_to_retry_after_statuses(monkeypatch):
+    """Test that throttled and shed requests return 429 and 503 with Retry-After"""
+    for rate_limited, status_code in ((True, 429), (False, 503)):
+        monkeypatch.setattr(
+            orchestration_api.orchestrator,
+            "process_request_sync",
+            lambda **kwargs: {
+                "success": False,
+                "error": "rejected",
+                "retry_after": 1.5,
+                "rate_limited": rate_limited,
+            },
+        )
+        response = client.post("/orchestrate", json={"query": "Hello"})
+        assert response.status_code == status_code
+        assert response.headers["retry-after"] == "2"
+
+
+def test_batch_stream_is_not_gzipped(monkeypatch):
+    """Test that NDJSON results stream uncompressed even when gzip is accepted"""
+
+    def fake_batch(queries, **kwargs):
+        for index, query in enumerate(queries):
+            yield {"index": index, "response": "word " * 500, "success": True}
+
+    monkeypatch.setattr(orchestration_api.orchestrator, "process_batch", fake_batch)
+
+    with client.stream(
+        "POST",
+        "/orchestrate/batch",
+        json={"queries": ["a", "b", "c"]},
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [line["index"] for line in lines] == [0, 1, 2]
+
+
+def test_streamed_chunks_are_forwarded_immediately():
+    """Test that each streamed chunk is sent before the next one is produced"""
+    sent = []
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/x-ndjson")],
+            }
+        )
+        for index in range(3):
+            # Everything sent so far has already reached the client
+            assert len(sent) == index + 1
+            await send(
+                {"type": "http.response.body", "body": b"x" * 2000, "more_body": True}
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = StreamingAwareGZipMiddleware(app, minimum_size=1024)
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(middleware(scope, receive, send))
+
+    assert [len(message.get("body", b"")) for message in sent[1:]] == [2000] * 3 + [0]
@@ -0,0 +1,78 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from orchestration.config.settings import SimulatedModelProfile
+from orchestration.core.backend.base import BackendError, BackendTimeoutError
+from orchestration.core.backend.factory import create_backend
+from orchestration.core.backend.generation import GenerationOptions
+from orchestration.core.backend.simulated_backend import SimulatedBackend
+
+
+def test_simulated_backend_is_deterministic():
+    """Test that the same seed replays identical timings and text"""
+    first = SimulatedBackend(time_scale=0, seed=7)
+    second = SimulatedBackend(time_scale=0, seed=7)
+
+    for prompt in ["Hi", "Explain queues", "Hi"]:
+        a = first.generate("llama3.1:8b", prompt)
+        b = second.generate("llama3.1:8b", prompt)
+        assert a == b
+
+    # A repeated prompt draws a fresh sample rather than the first one again
+    repeat = SimulatedBackend(time_scale=0, seed=7)
+    assert repeat.generate("codellama:13b", "x") != repeat.generate(
+        "codellama:13b", "x"
+    )
+
+
+def test_simulated_backend_budget_truncation_and_cold_loads():
+    """Test num_predict truncation and load time on the first request only"""
+    backend = create_backend("simulated", time_scale=0)
+
+    cold = backend.generate("llama3.1:8b", "Hi", GenerationOptions(num_predict=5))
+    assert cold["truncated"] is True
+    assert cold["done_reason"] == "length"
+    assert cold["telemetry"]["eval_count"] == 5
+    assert cold["telemetry"]["load_duration"] == 3.0
+
+    warm = backend.generate("llama3.1:8b", "Hi again")
+    assert warm["telemetry"]["load_duration"] == 0.0
+    assert warm["telemetry"]["tokens_per_second"] > 0
+
+
+def test_simulated_backend_evicts_least_recently_used_models():
+    """Test the memory budget and LRU residency"""
+    backend = SimulatedBackend(time_scale=0, memory_gb=50)
+    backend.generate("llama3.1:8b", "a")
+    backend.generate("codellama:13b", "b")
+    backend.generate("llama3.1:70b", "c", timeout=600)
+
+    assert backend.list_running() == ["codellama:13b", "llama3.1:70b"]
+    assert backend.get_stats()["evictions"] == 1
+
+
+def test_simulated_backend_failure_and_timeout_injection():
+    """Test injected errors, timeouts and unknown models"""
+    backend = SimulatedBackend(
+        profiles={
+            "flaky": SimulatedModelProfile(failure_rate=1.0),
+            "slow": SimulatedModelProfile(tokens_per_second=1.0, output_tokens=500),
+        },
+        time_scale=0,
+    )
+
+    with pytest.raises(BackendError):
+        backend.generate("flaky", "Hi")
+    with pytest.raises(BackendTimeoutError):
+        backend.generate("slow", "Hi", timeout=5)
+    with pytest.raises(BackendError):
+        backend.generate("missing", "Hi")
+
+    health = backend.health_check("flaky")
+    assert health["healthy"] is False
+    assert backend.get_stats()["failures"] == 2
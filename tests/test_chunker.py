@@ -0,0 +1,121 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import codecs
+
+from rag.ingestion import file_reader
+from rag.ingestion.chunker import chunk_spans, chunk_text, estimate_tokens
+from rag.ingestion.file_reader import read_file_documents
+
+
+def test_chunks_respect_token_budget_and_sentences():
+    """Chunks stay under the token budget, end on sentences and overlap"""
+    text = "This is a test document. " * 100
+    spans = chunk_spans(text, max_tokens=50, overlap_tokens=10)
+
+    assert len(spans) > 1
+    for start, end in spans:
+        assert estimate_tokens(text, start, end) <= 50
+        assert text[start:end].startswith("This") and text[end - 1] == "."
+    # Each chunk starts inside the previous one
+    assert all(spans[i + 1][0] < spans[i][1] for i in range(len(spans) - 1))
+    assert chunk_text(text, 50, 10) == [text[start:end] for start, end in spans]
+
+
+def test_chunks_prefer_paragraph_boundaries():
+    """Paragraphs are kept whole and long runs without punctuation still split"""
+    first = "Short intro paragraph. It has two sentences."
+    second = "A second paragraph follows here."
+    text = f"  {first}\n\n{second}\n\n" + "word " * 120
+
+    spans = chunk_spans(text, max_tokens=40, overlap_tokens=0)
+
+    assert text[spans[0][0] : spans[0][1]] == f"{first}\n\n{second}"
+    assert all(estimate_tokens(text, start, end) <= 40 for start, end in spans)
+    assert chunk_text("   \n\n  ") == []
+
+
+def test_separators_between_units_count_toward_the_budget():
+    """Many short paragraphs still pack into chunks the estimate keeps in budget"""
+    text = "\n\n".join(f"Item {i}." for i in range(500))
+    spans = chunk_spans(text, max_tokens=200, overlap_tokens=20)
+
+    assert len(spans) > 1
+    assert all(estimate_tokens(text, start, end) <= 200 for start, end in spans)
+    # Still packed, not one paragraph per chunk
+    assert max(estimate_tokens(text, start, end) for start, end in spans) > 150
+
+
+def test_runs_without_spaces_are_split_by_characters():
+    """Text no boundary can break is still cut into bounded chunks"""
+    text = "A" * 200000
+    spans = chunk_spans(text, max_tokens=200, overlap_tokens=20)
+
+    assert len(spans) == 125
+    assert all(end - start <= 1600 for start, end in spans)
+    assert "".join(text[start:end] for start, end in spans) == text
+
+    # A tokenizer counting every character as a token still gets its budget
+    def per_char(text, start, end):
+        return end - start - text.count(" ", start, end)
+
+    mixed = "Intro sentence here. " + "x" * 5000 + " and a tail."
+    spans = chunk_spans(mixed, 50, 0, count_tokens=per_char)
+    assert all(per_char(mixed, start, end) <= 50 for start, end in spans)
+    assert sum(per_char(mixed, start, end) for start, end in spans) == per_char(
+        mixed, 0, len(mixed)
+    )
+
+
+def test_file_documents_record_offsets(tmp_path):
+    """Each document carries start/end offsets back into the source file"""
+    path = tmp_path / "notes.txt"
+    content = "\n\n".join(f"Paragraph {i} talks about topic {i}." for i in range(50))
+    path.write_text(content, encoding="utf-8")
+
+    docs = read_file_documents(str(path), chunk_size=30, overlap=5)
+
+    assert len(docs) > 1
+    for doc in docs:
+        metadata = doc["metadata"]
+        assert content[metadata["start"] : metadata["end"]] == doc["content"]
+
+
+def test_large_files_stream_in_blocks(tmp_path, monkeypatch):
+    """Streamed chunks keep exact offsets and cover every paragraph"""
+    monkeypatch.setattr(file_reader, "STREAM_THRESHOLD_BYTES", 1000)
+    monkeypatch.setattr(file_reader, "BLOCK_CHARS", 500)
+    paragraphs = [f"Paragraph {i} talks about topic {i}." for i in range(300)]
+    content = "\n\n".join(paragraphs)
+    path = tmp_path / "large.txt"
+    path.write_text(content, encoding="utf-8")
+
+    documents = file_reader.iter_file_documents(str(path), chunk_size=30, overlap=5)
+    assert not isinstance(documents, list)
+    docs = list(documents)
+
+    assert [doc["metadata"]["chunk_id"] for doc in docs] == list(range(len(docs)))
+    for doc in docs:
+        metadata = doc["metadata"]
+        assert content[metadata["start"] : metadata["end"]] == doc["content"]
+        assert "total_chunks" not in metadata
+    covered = "\n".join(doc["content"] for doc in docs)
+    assert all(paragraph in covered for paragraph in paragraphs)
+
+
+def test_encoding_detection_and_binary_skipping(tmp_path):
+    """BOMs and legacy encodings are decoded, binary files produce nothing"""
+    latin = tmp_path / "latin.txt"
+    latin.write_bytes("Caf\xe9 cr\xe8me.".encode("latin-1"))
+    bom = tmp_path / "bom.txt"
+    bom.write_bytes(codecs.BOM_UTF8 + "Hello there.".encode("utf-8"))
+    binary = tmp_path / "image.txt"
+    binary.write_bytes(bytes(range(256)) * 4)
+
+    assert read_file_documents(str(latin))[0]["content"] == "Café crème."
+    assert read_file_documents(str(bom))[0]["content"] == "Hello there."
+    assert file_reader.detect_encoding(str(binary)) is None
+    assert read_file_documents(str(binary)) == []
@@ -0,0 +1,107 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+
+from rag.vector_store.document_ids import document_id
+from rag.vector_store.embedding_cache import EmbeddingCache
+from rag.vector_store.embedding_service import EmbeddingService, get_embedding_service
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_embedding_service_is_shared_per_model():
+    """Components asking for the same model get one lazily loaded service"""
+    service = get_embedding_service("all-MiniLM-L6-v2")
+    assert get_embedding_service() is service
+    assert get_embedding_service("other-model") is not service
+    assert not get_embedding_service("never-loaded").loaded
+
+
+def test_embedding_service_encodes_float32():
+    """Encoding goes through the wrapped model and returns a float32 matrix"""
+    model = FakeModel()
+    service = EmbeddingService("fake", model=model)
+
+    embeddings = service.encode(["ab", "abcd"])
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.tolist() == [[2.0, 1.0], [4.0, 1.0]]
+    assert model.calls == 1
+
+
+def test_embedding_cache_skips_unchanged_text(tmp_path):
+    """Only texts missing from the persistent cache reach the model"""
+    model = FakeModel()
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"))
+    service = EmbeddingService("fake", model=model, cache=cache)
+
+    first = service.encode(["ab", "abcd"])
+    # A new process reuses the on-disk cache for the unchanged chunk
+    reopened = EmbeddingService(
+        "fake", model=model, cache=EmbeddingCache(cache.db_path)
+    )
+    second = reopened.encode(["abcd", "abcdef"])
+
+    assert first[1].tolist() == second[0].tolist()
+    assert second[1].tolist() == [6.0, 1.0]
+    assert model.calls == 2
+    stats = reopened.cache.get_stats()
+    assert stats["entries"] == 3
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_embedding_cache_prunes_oldest_entries(tmp_path):
+    """The cache drops its oldest vectors once it grows past max_entries"""
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"), max_entries=10)
+    texts = [f"text {i}" for i in range(12)]
+    cache.put_many("fake", texts, np.ones((12, 2), dtype=np.float32))
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 9 and stats["pruned"] == 3
+    assert cache.get_many("fake", texts[:3]) == [None, None, None]
+    assert all(vector is not None for vector in cache.get_many("fake", texts[3:]))
+
+    # Re-storing known text doesn't inflate the count
+    cache.put_many("fake", texts[3:], np.ones((9, 2), dtype=np.float32))
+    reopened = EmbeddingCache(cache.db_path)
+    assert reopened.get_stats()["entries"] == cache.get_stats()["entries"] == 9
+
+
+def test_query_embeddings_served_from_lru():
+    """Repeated queries differing only in whitespace skip the model entirely"""
+    model = FakeModel()
+    service = EmbeddingService("fake", model=model, query_cache_size=2)
+
+    service.encode_query("what is python")
+    vector = service.encode_query("  what is   python ")
+    service.encode_query("second")
+    service.encode_query("third")
+    service.encode_query("what is python")
+
+    assert vector.tolist() == [14.0, 1.0]
+    assert model.calls == 4
+    stats = service.get_stats()["query_cache"]
+    assert stats["size"] == 2
+    assert stats["hits"] == 1 and stats["misses"] == 4
+
+
+def test_document_ids_are_content_addressed():
+    """Ids depend only on source, offset and text, never on the process"""
+    chunk_id = document_id("docs/a.txt", 0, "hello world")
+
+    assert chunk_id == document_id("docs/a.txt", 0, "hello world")
+    assert chunk_id != document_id("docs/a.txt", 1, "hello world")
+    assert chunk_id != document_id("docs/b.txt", 0, "hello world")
+    assert chunk_id != document_id("docs/a.txt", 0, "hello world!")
+    assert len(chunk_id) == 32
@@ -0,0 +1,106 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from orchestration.core.backend.generation import (
+    GenerationOptions,
+    resolve_generation_options,
+)
+from orchestration.core.backend.ollama_backend import OllamaBackend
+from orchestration.core.telemetry.metrics_registry import MetricsRegistry
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _FakeOllamaHandler.requests.append(payload)
+        chunks = [
+            {"response": " Hello", "done": False},
+            {"response": " there ", "done": False},
+            {
+                "response": "",
+                "done": True,
+                "done_reason": "length",
+                "load_duration": 2_000_000_000,
+                "prompt_eval_count": 3,
+                "prompt_eval_duration": 100_000_000,
+                "eval_count": 2,
+                "eval_duration": 500_000_000,
+            },
+        ]
+        body = "".join(json.dumps(chunk) + "\n" for chunk in chunks).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_budgets_take_smaller_of_priority_and_category():
+    """Test default output budgets and explicit overrides"""
+    options = resolve_generation_options("balanced", "fast")
+    assert options.num_predict == 192
+
+    options = resolve_generation_options("speed", "coding", stop=["\n\n"])
+    assert options.num_predict == 256
+    assert options.to_ollama_options() == {"num_predict": 256, "stop": ["\n\n"]}
+
+    options = resolve_generation_options("speed", "coding", max_tokens=4096)
+    assert options.num_predict == 4096
+    # Explicit values are clamped to a positive, bounded budget
+    assert resolve_generation_options("speed", max_tokens=-1).num_predict == 1
+    assert resolve_generation_options("speed", max_tokens=10**6).num_predict == 4096
+
+
+def test_ollama_backend_passes_options_and_reports_truncation():
+    """Test the generate payload, done_reason handling and telemetry"""
+    server = HTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        backend = OllamaBackend(f"http://127.0.0.1:{server.server_port}")
+        result = backend.generate(
+            "llama3.1:8b", "Hi", GenerationOptions(num_predict=8, temperature=0.2)
+        )
+    finally:
+        server.shutdown()
+
+    assert result["response"] == "Hello there"
+    assert result["truncated"] is True
+    assert _FakeOllamaHandler.requests[-1]["options"] == {
+        "num_predict": 8,
+        "temperature": 0.2,
+    }
+    assert _FakeOllamaHandler.requests[-1]["stream"] is True
+
+    telemetry = result["telemetry"]
+    assert telemetry["load_duration"] == 2.0
+    assert telemetry["prompt_eval_count"] == 3
+    assert telemetry["tokens_per_second"] == 4.0
+    assert telemetry["time_to_first_token"] is not None
+
+
+def test_metrics_registry_aggregates_per_model():
+    """Test per-model telemetry aggregation and cold load counting"""
+    registry = MetricsRegistry()
+    registry.record("llama3.1:8b", {"load_duration": 3.0, "tokens_per_second": 40.0})
+    registry.record("llama3.1:8b", {"load_duration": 0.0, "tokens_per_second": 60.0})
+    registry.record("llama3.1:8b", None)
+
+    stats = registry.get_model_stats("llama3.1:8b")
+    assert stats["requests"] == 2
+    assert stats["cold_loads"] == 1
+    assert stats["tokens_per_second"]["mean"] == 50.0
+    assert "time_to_first_token" not in stats
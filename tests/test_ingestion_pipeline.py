@@ -0,0 +1,150 @@
+import json
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from rag.ingestion.pipeline import IngestionPipeline, iter_files
+from rag.vector_store.embedding_service import EmbeddingService
+
+
+class FakeModel:
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(len(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class FakeChromaManager:
+    def __init__(self, fail_writes: bool = False, fail_after: int = None):
+        self.model = FakeModel()
+        self.embedding_service = EmbeddingService("fake", model=self.model)
+        self.stored = {}
+        self.writes = []
+        self.fail_writes = fail_writes
+        self.fail_after = fail_after
+
+    def stored_ids(self, ids):
+        return {id for id in ids if id in self.stored}
+
+    def write_embedded(self, ids, documents, embeddings, metadatas):
+        if self.fail_writes or len(self.writes) == self.fail_after:
+            raise ValueError("disk full")
+        self.writes.append(len(ids))
+        self.stored.update(zip(ids, documents))
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for i, line in enumerate(file):
+            yield {"content": line.strip(), "metadata": {"source": path, "chunk_id": i}}
+
+
+def _write_corpus(directory, files=3, lines=5):
+    for f in range(files):
+        with open(os.path.join(directory, f"doc_{f}.txt"), "w") as file:
+            file.write("\n".join(f"file {f} line {i}" for i in range(lines)))
+    return sorted(iter_files(str(directory), [".txt"]))
+
+
+def test_pipeline_writes_in_batches_and_resumes(tmp_path):
+    """Chunks are written in bounded batches and finished files are checkpointed"""
+    paths = _write_corpus(tmp_path)
+    manager = FakeChromaManager()
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+
+    progress = IngestionPipeline(
+        manager,
+        read_lines,
+        encode_batch_size=2,
+        write_batch_size=4,
+        checkpoint_path=checkpoint,
+    ).run(paths)
+
+    assert progress["chunks_written"] == 15
+    assert progress["files_done"] == 3
+    assert max(manager.writes) <= 4 + 2
+    # Encode batches fill across file boundaries
+    assert manager.model.batches == [2] * 7 + [1]
+
+    # A second run over the same files skips them entirely
+    rerun = IngestionPipeline(manager, read_lines, checkpoint_path=checkpoint).run(
+        paths
+    )
+    assert rerun["files_skipped"] == 3
+    assert rerun["chunks_read"] == 0
+
+
+def test_pipeline_skips_stored_chunks_and_surfaces_errors(tmp_path):
+    """Already stored chunks are not embedded again and write failures propagate"""
+    paths = _write_corpus(tmp_path, files=2)
+    manager = FakeChromaManager()
+    IngestionPipeline(manager, read_lines).run(paths[:1])
+
+    progress = IngestionPipeline(manager, read_lines).run(paths)
+    assert progress["chunks_duplicate"] == 5
+    assert progress["chunks_embedded"] == 5
+
+    with pytest.raises(RuntimeError):
+        IngestionPipeline(FakeChromaManager(fail_writes=True), read_lines).run(paths)
+
+
+def test_checkpoint_only_covers_written_files(tmp_path):
+    """A file is checkpointed only once the write holding its last chunk succeeds"""
+    paths = _write_corpus(tmp_path, files=3, lines=3)
+    manager = FakeChromaManager(fail_after=2)
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+
+    with pytest.raises(RuntimeError):
+        IngestionPipeline(
+            manager,
+            read_lines,
+            encode_batch_size=2,
+            write_batch_size=2,
+            checkpoint_path=checkpoint,
+        ).run(paths)
+
+    with open(checkpoint, "r", encoding="utf-8") as file:
+        done = [json.loads(line)["path"] for line in file]
+    # Four chunks were written: all of the first file, part of the second
+    assert len(manager.stored) == 4
+    assert done == [os.path.abspath(paths[0])]
+
+
+def test_pipeline_parses_files_in_process_pool(tmp_path):
+    """Parallel parsing keeps file order and reports unreadable files"""
+    paths = _write_corpus(tmp_path, files=4)
+    with open(paths[1], "wb") as file:
+        file.write(b"\xff\xfe not utf-8")
+    manager = FakeChromaManager()
+
+    progress = IngestionPipeline(manager, read_lines, workers=2).run(paths)
+
+    assert progress["files_failed"] == 1
+    assert progress["files_done"] == 3
+    assert progress["chunks_written"] == 15
+    assert sorted(manager.stored.values())[0] == "file 0 line 0"
+
+
+def test_pipeline_drops_near_duplicates_from_other_files(tmp_path):
+    """Directory ingestion skips chunks that repeat another file and indexes the rest"""
+    from rag.ingestion.near_duplicates import NearDuplicateIndex
+
+    line = "Python is a versatile programming language known for its readability"
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(f"{line}\n{name} has its own closing words")
+    index = NearDuplicateIndex(str(tmp_path / "dedup.db"), threshold=0.8)
+    manager = FakeChromaManager()
+
+    progress = IngestionPipeline(manager, read_lines, dedup_index=index, workers=1).run(
+        sorted(iter_files(str(tmp_path), [".txt"]))
+    )
+
+    assert progress["chunks_near_duplicate"] == 1
+    assert progress["chunks_written"] == 3
+    assert index.get_stats()["entries"] == 3
@@ -0,0 +1,172 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from orchestration.config.settings import ORCHESTRATION_CONFIG
+from orchestration.core.balancer.tenancy import RateLimitExceeded
+from orchestration.jobs.job_store import JobStore
+from orchestration.jobs.job_worker import JobWorker, validate_callback_url
+
+
+class _StubOrchestrator:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def process_request(self, query, priority, user_preference, **kwargs):
+        self.calls.append((query, priority, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        future = Future()
+        future.set_result(outcome)
+        return future
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        _CallbackHandler.received.append(json.loads(body))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_queued_jobs_survive_restart(tmp_path):
+    """Test that queued and interrupted jobs are picked up by a new store"""
+    db_path = str(tmp_path / "jobs.db")
+    store = JobStore(db_path)
+    first = store.enqueue({"query": "first"})
+    second = store.enqueue({"query": "second"})
+    assert store.claim_next()["id"] == first
+
+    # Another process starting up leaves a job within its lease alone
+    restarted = JobStore(db_path)
+    assert restarted.requeue_expired(lease=60) == 0
+    assert restarted.get_stats() == {"queued": 1, "running": 1}
+
+    # Once the lease runs out the worker is presumed dead
+    time.sleep(0.01)
+    assert restarted.requeue_expired(lease=0.001) == 1
+    assert restarted.get_stats() == {"queued": 2}
+    assert restarted.claim_next()["id"] == first
+    assert restarted.claim_next()["id"] == second
+    assert restarted.claim_next() is None
+    assert restarted.get(first)["attempts"] == 2
+
+
+def test_worker_records_results_and_requeues_rate_limited_jobs(tmp_path):
+    """Test job completion, failure and rate-limit requeueing"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    orchestrator = _StubOrchestrator(
+        [
+            {"success": True, "response": "42", "model": "llama3.1:70b"},
+            RateLimitExceeded("slow down", retry_after=30, estimated_wait=30),
+            {"success": False, "error": "Request timeout"},
+        ]
+    )
+    worker = JobWorker(orchestrator, store, num_workers=1)
+
+    done = store.enqueue(
+        {"query": "q", "priority": "accuracy", "generation": {"num_predict": 64}}
+    )
+    worker.run_job(store.claim_next())
+    job = store.get(done)
+    assert job["status"] == "completed"
+    assert job["result"]["response"] == "42"
+    assert orchestrator.calls[0][2]["generation"].num_predict == 64
+
+    throttled = store.enqueue({"query": "q"})
+    worker.run_job(store.claim_next())
+    assert store.get(throttled)["status"] == "queued"
+    assert store.claim_next() is None  # not ready until retry_after elapses
+
+    store.requeue(throttled)
+    worker.run_job(store.claim_next())
+    job = store.get(throttled)
+    assert job["status"] == "failed"
+    assert job["error"] == "Request timeout"
+
+    # Jobs get their own deadline rather than the interactive default
+    assert orchestrator.calls[0][2]["deadline"] == ORCHESTRATION_CONFIG.job_timeout
+    assert orchestrator.calls[0][2]["timeout"] == ORCHESTRATION_CONFIG.job_timeout
+
+
+def test_worker_fails_jobs_that_are_never_admitted(tmp_path):
+    """Test that admission retries stop after job_max_attempts"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    attempts = ORCHESTRATION_CONFIG.job_max_attempts
+    orchestrator = _StubOrchestrator(
+        [RateLimitExceeded("slow down", retry_after=0, estimated_wait=0)] * attempts
+    )
+    worker = JobWorker(orchestrator, store, num_workers=1)
+
+    job_id = store.enqueue({"query": "q"})
+    for _ in range(attempts):
+        store.requeue(job_id)  # skip the retry delay
+        worker.run_job(store.claim_next())
+
+    job = store.get(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == attempts
+    assert "Not admitted" in job["error"]
+
+
+def test_callback_urls_are_restricted():
+    """Test that callbacks must be http(s) and can't target internal hosts"""
+    for url in (
+        "file:///etc/passwd",
+        "gopher://example.com/",
+        "http:///no-host",
+        "http://127.0.0.1:8080/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://10.0.0.5/hook",
+        "http://[::1]/hook",
+    ):
+        with pytest.raises(ValueError):
+            validate_callback_url(url)
+
+    # An allowlist replaces the public-address check
+    validate_callback_url("http://127.0.0.1:8080/hook", ["127.0.0.1"])
+    with pytest.raises(ValueError):
+        validate_callback_url("https://example.com/hook", ["hooks.internal"])
+
+
+def test_worker_posts_finished_job_to_callback_url(tmp_path):
+    """Test webhook delivery of a finished job"""
+    server = HTTPServer(("127.0.0.1", 0), _CallbackHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    store = JobStore(str(tmp_path / "jobs.db"))
+    worker = JobWorker(
+        _StubOrchestrator([{"success": True, "response": "ok"}]),
+        store,
+        callback_hosts=["127.0.0.1"],
+    )
+    try:
+        job_id = store.enqueue(
+            {"query": "q"},
+            callback_url=f"http://127.0.0.1:{server.server_port}/hook",
+        )
+        worker.run_job(store.claim_next())
+    finally:
+        server.shutdown()
+
+    assert _CallbackHandler.received[-1]["id"] == job_id
+    assert _CallbackHandler.received[-1]["status"] == "completed"
+    assert store.get(job_id)["callback_status"] == "delivered (204)"
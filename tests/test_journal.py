@@ -0,0 +1,60 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from orchestration.core.telemetry.request_journal import RequestJournal, read_journal
+
+
+def _result(index, **overrides):
+    return {
+        "request_id": f"req_{index}",
+        "query": f"query {index}",
+        "model": "llama3.1:8b",
+        "response": "a long response that is not journaled",
+        "priority": "balanced",
+        "category": "general",
+        "tenant": "default",
+        "arrival": 100.0 + index,
+        "timestamp": 100.5 + index,
+        "response_time": 2.0,
+        "success": True,
+        **overrides,
+    }
+
+
+def test_journal_writes_compact_workload_records(tmp_path):
+    """Test the journaled fields and rejection marking"""
+    journal = RequestJournal(str(tmp_path / "journal.ndjson"))
+    journal.record(_result(0))
+    journal.record(_result(1, model=None, success=False, rejected=True))
+    journal.close()
+
+    entries = list(read_journal(str(tmp_path / "journal.ndjson")))
+    assert entries[0] == {
+        "arrival": 100.0,
+        "query": "query 0",
+        "priority": "balanced",
+        "category": "general",
+        "tenant": "default",
+        "model": "llama3.1:8b",
+        "service_time": 2.0,
+        "queue_time": 0.5,
+        "success": True,
+    }
+    assert entries[1]["rejected"] is True
+    assert "model" not in entries[1]
+
+
+def test_journal_rotates_and_reads_back_in_order(tmp_path):
+    """Test size-based rotation and oldest-first reading across backups"""
+    path = str(tmp_path / "journal.ndjson")
+    journal = RequestJournal(path, max_bytes=600, backup_count=10)
+    for index in range(20):
+        journal.record(_result(index))
+    journal.close()
+
+    assert os.path.exists(f"{path}.1")
+    arrivals = [entry["arrival"] for entry in read_journal(path)]
+    assert arrivals == [100.0 + index for index in range(20)]
@@ -0,0 +1,87 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from rag.vector_store.lexical_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+def test_tokenize_keeps_identifiers_and_their_parts():
+    """Dotted and dashed identifiers are indexed whole and by part"""
+    assert tokenize("Call os.path.join on UTF-8 input") == [
+        "call",
+        "os.path.join",
+        "os",
+        "path",
+        "join",
+        "on",
+        "utf-8",
+        "utf",
+        "8",
+        "input",
+    ]
+
+
+def test_bm25_ranks_exact_identifiers_and_indexes_incrementally():
+    """Rare identifiers outrank common words, and known ids are not re-added"""
+    index = BM25Index()
+    index.add(
+        ["a", "b", "c"],
+        [
+            "Python errors are common when a module is missing.",
+            "ModuleNotFoundError: No module named 'chromadb' in Python.",
+            "Install packages with pip before running Python code.",
+        ],
+    )
+
+    assert index.search("ModuleNotFoundError chromadb")[0][0] == "b"
+    assert index.search("kubernetes") == []
+
+    assert index.add(["b", "d"], ["ignored", "Use pip install chromadb."]) == 1
+    assert len(index) == 4
+    assert [id for id, _ in index.search("pip chromadb", 2)] == ["d", "b"]
+
+
+def test_reciprocal_rank_fusion_weights_rankings():
+    """Ids found by both rankings rise, and the weight tilts the order"""
+    dense, lexical = ["x", "y", "z"], ["w", "y"]
+
+    fused = reciprocal_rank_fusion([dense, lexical], [0.5, 0.5])
+    assert fused[0][0] == "y"
+    assert {id for id, _ in fused} == {"w", "x", "y", "z"}
+
+    dense_only = reciprocal_rank_fusion([dense, lexical], [1.0, 0.0])
+    assert [id for id, _ in dense_only][:3] == ["x", "y", "z"]
+
+
+def test_common_terms_only_skipped_in_large_collections():
+    """Small collections score every query term; large ones skip common terms"""
+    ids = ["a", "b", "c"]
+    documents = [
+        "Python errors are common.",
+        "Python is readable.",
+        "Python has many packages.",
+    ]
+
+    small = BM25Index()
+    small.add(ids, documents)
+    assert [id for id, _ in small.search("python errors")][0] == "a"
+    assert len(small.search("python errors")) == 3
+
+    large = BM25Index(common_term_min_documents=3)
+    large.add(ids, documents)
+    assert [id for id, _ in large.search("python errors")] == ["a"]
+
+
+def test_removed_ids_leave_results_and_can_return():
+    """Removed chunks stop matching, and re-adding the id indexes it again"""
+    index = BM25Index()
+    index.add(["a", "b"], ["pip install chromadb", "pip install numpy"])
+
+    assert index.remove(["a", "unknown"]) == 1
+    assert len(index) == 1 and index.ids() == {"b"}
+    assert [id for id, _ in index.search("chromadb pip")] == ["b"]
+
+    assert index.add(["a"], ["pip install chromadb"]) == 1
+    assert index.search("chromadb")[0][0] == "a"
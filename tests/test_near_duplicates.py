@@ -0,0 +1,81 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from rag.ingestion.near_duplicates import MinHasher, NearDuplicateIndex
+
+ARTICLE = (
+    "Python is a versatile programming language known for its simplicity and "
+    "readability. It supports multiple paradigms including object oriented and "
+    "functional programming, and it is widely used in web development and data science."
+)
+OTHER = (
+    "Machine learning is a subset of artificial intelligence that enables "
+    "computers to learn and improve from experience without explicit programming."
+)
+
+
+def test_signatures_estimate_similarity():
+    """Signatures agree in proportion to shared shingles"""
+    hasher = MinHasher()
+    base = hasher.signature(ARTICLE)
+
+    assert (base == hasher.signature(ARTICLE.upper())).all()
+    assert (base == hasher.signature(ARTICLE + " Share this.")).mean() > 0.8
+    assert (base == hasher.signature(OTHER)).mean() < 0.2
+
+
+def test_index_drops_near_duplicates_across_runs(tmp_path):
+    """Near duplicates are reported, persisted and compared within a batch"""
+    path = str(tmp_path / "dedup.db")
+    index = NearDuplicateIndex(path, threshold=0.8)
+
+    ids = ["a", "b", "c"]
+    signatures = index.signatures([ARTICLE, ARTICLE + " Share this.", OTHER])
+    assert index.check_many(ids, signatures) == [None, "a", None]
+    # Checking indexes nothing until the kept chunks are added
+    assert index.check_many(["e"], signatures[2:]) == [None]
+    index.add_many(["a", "c"], [signatures[0], signatures[2]])
+
+    reopened = NearDuplicateIndex(path, threshold=0.8)
+    # Re-ingesting the same chunk is not a duplicate of itself
+    assert reopened.check_and_add("a", ARTICLE) is None
+    assert reopened.check_and_add("d", "Read more: " + OTHER) == "c"
+    stats = reopened.get_stats()
+    assert stats["entries"] == 2
+    assert (stats["checked"], stats["duplicates"]) == (2, 1)
+
+
+class _FailingChromaManager:
+    def add_documents(self, documents, metadatas, ids):
+        raise ValueError("disk full")
+
+
+def test_failed_write_leaves_chunks_unindexed(tmp_path):
+    """Chunks whose write fails are not remembered as seen"""
+    pytest.importorskip("chromadb")
+    from rag.ingestion.document_processor import DocumentProcessor
+
+    index = NearDuplicateIndex(str(tmp_path / "dedup.db"), threshold=0.8)
+    documents = [{"content": ARTICLE, "metadata": {"source": "a", "chunk_id": 0}}]
+
+    failing = DocumentProcessor(_FailingChromaManager(), dedup_index=index)
+    assert failing.ingest_documents(documents) is False
+    assert index.get_stats()["entries"] == 0
+
+
+def test_same_source_is_not_a_near_duplicate_of_itself(tmp_path):
+    """An edited page re-ingested from its own URL is kept; a copy elsewhere is not"""
+    index = NearDuplicateIndex(str(tmp_path / "dedup.db"), threshold=0.8)
+    assert index.check_and_add("v1", ARTICLE, "https://a.example/page") is None
+
+    edited = ARTICLE + " Share this."
+    assert index.check_and_add("v2", edited, "https://a.example/page") is None
+    assert index.check_and_add("copy", edited, "https://b.example/page") in (
+        "v1",
+        "v2",
+    )
@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 # Add project root to path
 
+from orchestration.core.backend.simulated_backend import SimulatedBackend
 from orchestration.core.pool.model_pool import ModelPool
 
 
@@ -19,10 +20,14 @@ def test_model_pool_initialization():
 
 def test_model_pool_get_model_status():
     """Test model status retrieval"""
-    pool = ModelPool()
+    backend = SimulatedBackend(time_scale=0)
+    backend.generate("llama3.1:8b", "Hello")
+    pool = ModelPool(backend=backend)
     status = pool.get_model_status()
     assert isinstance(status, dict)
     assert len(status) == 5
+    assert status["llama3.1:8b"]["status"] == "loaded"
+    assert pool.get_available_models() == ["llama3.1:8b"]
 
 
 def test_model_categories():
@@ -33,3 +38,129 @@ def test_model_categories():
     assert pool.models["neural-chat:7b-v3.3-q4_0"]["category"] == "fast"
     assert pool.models["codellama:13b"]["category"] == "coding"
     assert pool.models["mixtral:8x7b-instruct-v0.1-q4_0"]["category"] == "analysis"
+
+
+def test_process_batch_routes_once_and_groups_by_model():
+    """Test bulk processing with a single routing pass and model grouping"""
+    from orchestration.core.orchestrator import ModelOrchestrator
+
+    orchestrator = ModelOrchestrator(max_concurrent_requests=1)
+    status_calls = []
+    get_model_status = orchestrator.router.model_pool.get_model_status
+    orchestrator.router.model_pool.get_model_status = lambda: (
+        status_calls.append(1) or get_model_status()
+    )
+    executed = []
+
+    def fake_execute(task):
+        executed.append(task.model)
+        return {"success": True, "model": task.model, "response": "ok"}
+
+    orchestrator.load_balancer.execute_model_request = fake_execute
+    queries = [
+        "Write a Python function",
+        "Hi",
+        "Debug this script",
+        "Hello",
+        "Write a class",
+    ]
+
+    results = list(orchestrator.process_batch(queries))
+    orchestrator.shutdown()
+
+    assert sorted(result["index"] for result in results) == list(range(5))
+    assert all(result["success"] for result in results)
+    assert len(status_calls) == 1
+    # Each model's requests run back to back
+    assert executed == sorted(executed)
+
+
+def test_closed_batch_stream_cancels_queued_requests():
+    """Test that closing a batch stream early cancels what it still has queued"""
+    import threading
+
+    import pytest
+
+    from orchestration.core.orchestrator import ModelOrchestrator
+
+    orchestrator = ModelOrchestrator(max_concurrent_requests=1)
+    running, release = threading.Event(), threading.Event()
+    executed = []
+
+    def fake_execute(task):
+        executed.append(task.query)
+        if len(executed) > 1:
+            running.set()
+            release.wait(5)
+        return {"success": True, "model": task.model, "response": "ok"}
+
+    orchestrator.load_balancer.execute_model_request = fake_execute
+    batch = orchestrator.process_batch(["Hi", "Hello", "Hey"], user_preference="m")
+    assert next(batch)["success"]
+    assert running.wait(5)
+    batch.close()  # one request running, one still queued
+    queued = list(orchestrator.load_balancer.pending_futures.values())
+    assert len(queued) == 1 and queued[0].cancelled()
+    release.set()
+
+    def broken_submit(*args, **kwargs):
+        raise ValueError("bad options")
+
+    orchestrator.load_balancer.submit_request = broken_submit
+    # Only a full queue is retried; other errors reach the caller
+    with pytest.raises(ValueError):
+        list(orchestrator.process_batch(["Hi"]))
+    orchestrator.shutdown()
+
+    assert len(executed) == 2
+
+
+def _fake_execute(task):
+    return {"request_id": task.request_id, "success": True, "response": "ok"}
+
+
+def test_slow_completion_hooks_do_not_hold_worker_slots():
+    """Test that callbacks and subscribers run off the inference worker"""
+    import threading
+
+    from orchestration.core.orchestrator import ModelOrchestrator
+
+    orchestrator = ModelOrchestrator(max_concurrent_requests=1)
+    orchestrator.load_balancer.execute_model_request = _fake_execute
+    release = threading.Event()
+    seen = []
+
+    def slow_subscriber(result):
+        release.wait(5)
+        seen.append(("subscriber", result["request_id"]))
+
+    orchestrator.add_completion_hook(slow_subscriber)
+    futures = [
+        orchestrator.process_request(
+            "Hi", callback=lambda result: seen.append(("callback", result["success"]))
+        )
+        for _ in range(3)
+    ]
+
+    # Every request finishes on the single slot while the subscriber is blocked
+    assert all(future.result(timeout=5)["success"] for future in futures)
+    release.set()
+    orchestrator.shutdown()
+
+    assert seen.count(("callback", True)) == 3
+    assert len([hook for hook, _ in seen if hook == "subscriber"]) == 3
+
+
+def test_process_request_async_is_awaitable():
+    """Test awaiting a request result from asyncio code"""
+    import asyncio
+
+    from orchestration.core.orchestrator import ModelOrchestrator
+
+    orchestrator = ModelOrchestrator(max_concurrent_requests=1)
+    orchestrator.load_balancer.execute_model_request = _fake_execute
+
+    result = asyncio.run(orchestrator.process_request_async("Hello"))
+    orchestrator.shutdown()
+
+    assert result["response"] == "ok"
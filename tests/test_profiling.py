@@ -0,0 +1,97 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.profiling import install_profiling
+from orchestration.core.telemetry.sampling_profiler import SamplingProfiler
+
+
+def _busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def _app(tmp_path, enabled, admin_token="secret"):
+    app = FastAPI()
+
+    @app.get("/work")
+    def work():
+        return {"total": _busy_loop(0.2)}
+
+    install_profiling(
+        app, enabled=enabled, profile_dir=str(tmp_path), admin_token=admin_token
+    )
+    return TestClient(app)
+
+
+def test_sampling_profiler_collects_collapsed_stacks():
+    """Test that a CPU-bound function shows up in the collapsed stacks"""
+    import threading
+
+    with SamplingProfiler(interval=0.001) as profiler:
+        worker = threading.Thread(target=_busy_loop, args=(0.2,), name="busy")
+        worker.start()
+        worker.join()
+
+    assert profiler.samples > 0
+    busy_lines = [
+        line for line in profiler.collapsed().splitlines() if "_busy_loop" in line
+    ]
+    assert busy_lines
+    assert busy_lines[0].startswith("busy;")
+
+
+def test_profile_header_saves_profile_and_admin_endpoint_serves_it(tmp_path):
+    """Test per-request profiling via the X-Profile header"""
+    client = _app(tmp_path, enabled=True)
+
+    plain = client.get("/work")
+    assert "x-profile-id" not in plain.headers
+
+    profiled = client.get("/work", headers={"X-Profile": "1"})
+    profile_id = profiled.headers["x-profile-id"]
+    assert profiled.headers["x-profile-scope"] == "process"
+    assert client.get("/admin/profiles", headers=ADMIN).json() == [profile_id]
+    profile = client.get(f"/admin/profiles/{profile_id}", headers=ADMIN)
+    assert "_busy_loop" in profile.text
+    assert client.get("/admin/profiles/..%2Fsecret", headers=ADMIN).status_code == 404
+
+    capture = client.post("/admin/profile", params={"seconds": 0.1}, headers=ADMIN)
+    assert capture.status_code == 200
+    assert capture.headers["x-profile-id"].endswith("-process")
+
+
+def test_admin_endpoints_require_token(tmp_path):
+    """Test that profiles can't be read or captured without the admin token"""
+    client = _app(tmp_path, enabled=True)
+    assert client.get("/admin/profiles").status_code == 401
+    wrong = {"X-Admin-Token": "guess"}
+    assert client.get("/admin/profiles", headers=wrong).status_code == 401
+    assert client.post("/admin/profile", params={"seconds": 0.1}).status_code == 401
+
+    # Without a configured token the endpoints are not mounted at all
+    untokened = _app(tmp_path, enabled=True, admin_token=None)
+    assert untokened.get("/admin/profiles", headers=ADMIN).status_code == 404
+
+
+def test_profiling_disabled_registers_nothing(tmp_path):
+    """Test that nothing is installed when profiling is off"""
+    client = _app(tmp_path, enabled=False)
+
+    response = client.get("/work", headers={"X-Profile": "1"})
+    assert "x-profile-id" not in response.headers
+    assert client.post("/admin/profile", params={"seconds": 0.1}).status_code == 404
+    assert client.app.user_middleware == []
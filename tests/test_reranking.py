@@ -0,0 +1,105 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+import pytest
+
+from rag.retrieval.reranking import CrossEncoderReranker, diversify, mmr_select
+
+# Two near-copies of one chunk, then two distinct chunks
+EMBEDDINGS = np.array(
+    [[1.0, 0.0, 0.0], [0.99, 0.05, 0.0], [0.6, 0.8, 0.0], [0.6, 0.0, 0.8]],
+    dtype=np.float32,
+)
+RELEVANCE = np.array([0.9, 0.89, 0.7, 0.6], dtype=np.float32)
+
+
+def test_mmr_skips_near_copies():
+    """MMR trades a little relevance for results that aren't copies"""
+    assert mmr_select(RELEVANCE, EMBEDDINGS, 3, lambda_mult=0.5) == [0, 2, 3]
+    assert mmr_select(RELEVANCE, EMBEDDINGS, 3, lambda_mult=1.0) == [0, 1, 2]
+    assert mmr_select(RELEVANCE, EMBEDDINGS, 10) == [0, 2, 3, 1]
+    assert mmr_select(RELEVANCE[:0], EMBEDDINGS[:0], 3) == []
+
+
+class FakeCrossEncoder:
+    def predict(self, pairs):
+        # Prefers the last document regardless of embeddings
+        return [float(i) for i in range(len(pairs))]
+
+
+def test_diversify_narrows_candidates_and_uses_reranker():
+    """Every per-result field is narrowed, and re-ranker scores drive relevance"""
+    candidates = {
+        "ids": ["a", "b", "c", "d"],
+        "documents": ["copy", "copy again", "other", "another"],
+        "distances": [0.1, 0.2, 0.3, 0.4],
+        "metadatas": [{"i": i} for i in range(4)],
+        "embeddings": EMBEDDINGS,
+        "query": "q",
+    }
+    query_embedding = np.array([1.0, 0.2, 0.2], dtype=np.float32)
+
+    results = diversify("q", query_embedding, candidates, 2)
+    # b is the closer copy to the query, so a is dropped as redundant
+    assert results["ids"] == ["b", "d"]
+    assert results["distances"] == [0.2, 0.4]
+    assert results["embeddings"].shape == (2, 3)
+    assert (results["query"], results["n_candidates"]) == ("q", 4)
+
+    reranker = CrossEncoderReranker("fake", model=FakeCrossEncoder())
+    reranked = diversify("q", query_embedding, candidates, 2, reranker=reranker)
+    assert reranked["ids"][0] == "d"
+    assert all(0 < score < 1 for score in reranked["relevance"])
+
+
+class FakeChromaManager:
+    def __init__(self):
+        self.embedding_service = self
+        self.encoded = 0
+        self.requests = []
+
+    def encode_query(self, query):
+        self.encoded += 1
+        return np.array([1.0, 0.2, 0.2], dtype=np.float32)
+
+    def search_documents(self, query, n_results, include_embeddings=False):
+        self.requests.append((n_results, include_embeddings))
+        results = {
+            "ids": ["a", "b", "c", "d"][:n_results],
+            "documents": ["copy", "copy again", "other", "another"][:n_results],
+            "distances": [0.1, 0.2, 0.3, 0.4][:n_results],
+            "metadatas": [{}] * min(n_results, 4),
+            "query": query,
+        }
+        if include_embeddings:
+            results["embeddings"] = EMBEDDINGS[:n_results]
+            results["query_embedding"] = self.encode_query(query)
+        return results
+
+
+def test_retrieve_reranks_without_overfetch_and_embeds_query_once():
+    """A configured re-ranker runs even at overfetch 1, reusing the search's embedding"""
+    pytest.importorskip("chromadb")
+    from rag.retrieval.rag_orchestrator import RAGOrchestrator
+
+    manager = FakeChromaManager()
+    reranker = CrossEncoderReranker("fake", model=FakeCrossEncoder())
+    rag = RAGOrchestrator(
+        model_orchestrator=object(),
+        chroma_manager=manager,
+        overfetch=1,
+        reranker=reranker,
+    )
+    results = rag.retrieve("q", 2)
+    assert manager.requests == [(2, True)]
+    assert results["ids"][0] == "b"
+    assert "relevance" in results
+
+    rag.overfetch = 2
+    rag.retrieve("q", 2)
+    assert manager.requests[-1] == (4, True)
+    assert manager.encoded == 2  # once per search, never again for MMR
@@ -0,0 +1,102 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import threading
+
+from orchestration.core.balancer.load_balancer import LoadBalancer, RequestTask
+from orchestration.core.balancer.scheduling import (
+    FIFOPolicy,
+    PriorityPolicy,
+    ShortestExpectedJobFirstPolicy,
+    WeightedFairPolicy,
+    create_policy,
+)
+
+
+def _task(name: str, priority: str = "balanced", cost: float = 1.0) -> RequestTask:
+    return RequestTask(
+        name, name, "llama3.1:8b", priority, 0.0, predicted_service_time=cost
+    )
+
+
+def _drain(policy, now: float = 0.0):
+    return [policy.pop(now).request_id for _ in range(len(policy))]
+
+
+def test_fifo_and_priority_ordering():
+    """Test arrival order for FIFO and class order for priority scheduling"""
+    fifo, priority = FIFOPolicy(), PriorityPolicy()
+    for i, task in enumerate(
+        [_task("a", "background"), _task("b", "balanced"), _task("c", "speed")]
+    ):
+        fifo.push(task, float(i))
+        priority.push(task, float(i))
+
+    assert _drain(fifo) == ["a", "b", "c"]
+    assert _drain(priority) == ["c", "b", "a"]
+
+
+def test_sjf_orders_by_cost_with_aging():
+    """Test that short jobs go first but long waiters eventually overtake"""
+    policy = ShortestExpectedJobFirstPolicy(aging_rate=0.5)
+    policy.push(_task("long", cost=60.0), now=0.0)
+    policy.push(_task("short", cost=1.0), now=0.0)
+    assert _drain(policy) == ["short", "long"]
+
+    # A 60s job queued 200s ago beats a fresh 1s job
+    policy.push(_task("old_long", cost=60.0), now=0.0)
+    policy.push(_task("new_short", cost=1.0), now=200.0)
+    assert _drain(policy) == ["old_long", "new_short"]
+
+
+def test_weighted_fair_shares_capacity():
+    """Test that flows are served in proportion to their weights"""
+    policy = WeightedFairPolicy(weights={"speed": 3.0, "background": 1.0})
+    for i in range(8):
+        policy.push(_task(f"bg{i}", "background"), now=0.0)
+        policy.push(_task(f"fg{i}", "speed"), now=0.0)
+
+    first_eight = _drain(policy)[:8]
+    assert sum(name.startswith("fg") for name in first_eight) == 6
+
+
+def test_create_policy_rejects_unknown_names():
+    """Test the policy factory"""
+    assert create_policy("sjf").name == "sjf"
+    try:
+        create_policy("lottery")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_load_balancer_queues_beyond_capacity():
+    """Test that requests beyond the slot count wait in the dispatch queue"""
+    balancer = LoadBalancer(
+        max_concurrent_requests=1, scheduling_policy="priority", max_queue_size=5
+    )
+    release = threading.Event()
+    order = []
+
+    def fake_execute(task):
+        release.wait(timeout=5)
+        order.append(task.query)
+        return {"success": True, "model": task.model, "response": task.query}
+
+    balancer.execute_model_request = fake_execute
+    futures = [
+        balancer.submit_request("first", "llama3.1:8b", "balanced"),
+        balancer.submit_request("later", "llama3.1:8b", "background"),
+        balancer.submit_request("urgent", "llama3.1:8b", "speed"),
+    ]
+    assert balancer.get_stats()["queue_size"] == 2
+
+    release.set()
+    results = [future.result(timeout=5) for future in futures]
+
+    assert all(result["success"] for result in results)
+    assert order == ["first", "urgent", "later"]
+    balancer.stop()
@@ -0,0 +1,127 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import threading
+
+import pytest
+
+from orchestration.config.settings import TenantConfig
+from orchestration.core.balancer.load_balancer import LoadBalancer, RequestTask
+from orchestration.core.balancer.scheduling import create_policy
+from orchestration.core.balancer.tenancy import RateLimitExceeded, TenantManager
+
+TENANTS = {
+    "default": TenantConfig("default", weight=1.0, requests_per_second=1.0, burst=2),
+    "dashboard": TenantConfig("dashboard", weight=3.0, max_concurrent=1),
+}
+
+
+def test_token_bucket_throttles_bursts():
+    """Test that a tenant is throttled once its burst is spent"""
+    manager = TenantManager(TENANTS)
+    manager.check_rate_limit("default")
+    manager.check_rate_limit("default")
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        manager.check_rate_limit("default")
+
+    assert 0 < excinfo.value.retry_after <= 1.0
+    stats = manager.get_stats()["default"]
+    assert stats["submitted"] == 2
+    assert stats["throttled"] == 1
+
+
+def test_unknown_tenants_share_the_default_bucket():
+    """Test that inventing tenant names doesn't bypass the default rate limit"""
+    manager = TenantManager(TENANTS)
+    manager.check_rate_limit("default")
+    manager.check_rate_limit("nightly-job")
+
+    with pytest.raises(RateLimitExceeded):
+        manager.check_rate_limit("another-made-up-name")
+
+    assert manager.resolve("nightly-job") == "default"
+    assert manager.get_config("nightly-job").name == "default"
+    assert list(manager.get_stats()) == ["default"]
+    assert manager.get_stats()["default"]["submitted"] == 2
+
+
+def test_weighted_fair_queuing_by_tenant():
+    """Test that capacity is shared in proportion to tenant weights"""
+    manager = TenantManager(TENANTS)
+    policy = create_policy("weighted_fair", tenant_weights=manager.weight)
+    for i in range(8):
+        for tenant in ("default", "dashboard"):
+            task = RequestTask(
+                f"{tenant}{i}", "q", "llama3.1:8b", "balanced", 0.0, tenant=tenant
+            )
+            task.predicted_service_time = 1.0
+            policy.push(task, 0.0)
+
+    first_eight = [policy.pop(0.0).tenant for _ in range(8)]
+    assert first_eight.count("dashboard") == 6
+
+
+def test_priority_orders_requests_within_a_tenant():
+    """Test that a tenant's speed requests go before its background ones"""
+    manager = TenantManager(TENANTS)
+    policy = create_policy("weighted_fair", tenant_weights=manager.weight)
+    for name, priority in [("bg1", "background"), ("bg2", "background")] + [
+        ("fast", "speed")
+    ]:
+        task = RequestTask(name, "q", "llama3.1:8b", priority, 0.0, tenant="default")
+        task.predicted_service_time = 1.0
+        policy.push(task, 0.0)
+
+    assert [policy.pop(0.0).request_id for _ in range(3)] == ["fast", "bg1", "bg2"]
+
+
+def test_concurrency_quota_holds_back_tenant():
+    """Test that a tenant at its quota waits while others are dispatched"""
+    balancer = LoadBalancer(max_concurrent_requests=2, scheduling_policy="fifo")
+    balancer.tenants = TenantManager(TENANTS)
+    release = threading.Event()
+    started = []
+
+    def fake_execute(task):
+        started.append(task.query)
+        release.wait(timeout=5)
+        return {"success": True, "response_time": 0.1}
+
+    balancer.execute_model_request = fake_execute
+    futures = [
+        balancer.submit_request("dash-1", "llama3.1:8b", tenant="dashboard"),
+        balancer.submit_request("dash-2", "llama3.1:8b", tenant="dashboard"),
+        balancer.submit_request("other", "llama3.1:8b", tenant="default"),
+    ]
+
+    stats = balancer.get_tenant_stats()
+    assert stats["dashboard"]["in_flight"] == 1
+    assert stats["dashboard"]["queued"] == 1
+    assert stats["default"]["in_flight"] == 1
+
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert balancer.get_tenant_stats()["dashboard"]["completed"] == 2
+    balancer.stop()
+
+
+def test_sync_requests_return_rate_limit_as_error():
+    """Test that process_request_sync reports throttling instead of raising"""
+    from orchestration.core.orchestrator import ModelOrchestrator
+
+    orchestrator = ModelOrchestrator()
+    orchestrator.load_balancer.tenants = TenantManager(TENANTS)
+    orchestrator.load_balancer.tenants.check_rate_limit("default")
+    orchestrator.load_balancer.tenants.check_rate_limit("default")
+
+    result = orchestrator.process_request_sync("Hello")
+    orchestrator.shutdown()
+
+    assert result["success"] is False
+    assert result["rate_limited"] is True
+    assert 0 < result["retry_after"] <= 1.0